@@ -0,0 +1,87 @@
+"""
+Vergleicht RequestClient (synchron, ein Thread pro Request) mit
+AsyncRequestClient (ein Event-Loop) gegen einen lokalen HTTP-Server, der
+jede Antwort um --delay Sekunden verzögert.
+
+    PYTHONPATH=. python benchmarks/bench_async_client.py --requests 200 --threads 16
+"""
+import argparse
+import asyncio
+import http.server
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from web_scraper_operations.async_request_client import AsyncRequestClient
+from web_scraper_operations.request_client import RequestClient
+
+
+def start_server(delay, payload_size):
+    body = b"x" * payload_size
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    class Server(http.server.ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_sync(url, n, threads):
+    local = threading.local()
+
+    def fetch(_):
+        if not hasattr(local, "client"):
+            local.client = RequestClient(pool_size=1)
+        return local.client.request_get(url)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        ok = sum(executor.map(fetch, range(n)))
+    return time.perf_counter() - start, ok
+
+
+async def run_async(url, n, concurrency):
+    start = time.perf_counter()
+    async with AsyncRequestClient(pool_size=concurrency, max_concurrency=concurrency) as client:
+        results = await client.download_many([url] * n)
+    return time.perf_counter() - start, sum(1 for r in results if r["ok"])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--payload", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    server = start_server(args.delay, args.payload)
+    url = f"http://127.0.0.1:{server.server_port}/file.pdf"
+
+    sync_time, sync_ok = run_sync(url, args.requests, args.threads)
+    async_time, async_ok = asyncio.run(run_async(url, args.requests, args.concurrency))
+    server.shutdown()
+
+    print(f"{'Client':<28}{'Zeit [s]':>10}{'req/s':>10}{'ok':>6}")
+    print(f"{f'sync ({args.threads} Threads)':<28}{sync_time:>10.2f}{args.requests / sync_time:>10.1f}{sync_ok:>6}")
+    print(f"{f'async (concurrency {args.concurrency})':<28}{async_time:>10.2f}{args.requests / async_time:>10.1f}{async_ok:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Misst die Kosten der Konfiguration beim Bau einer PlanSoMain-Instanz.
+
+Alt: yaml.safe_load + drei _replace_in_dict-Durchläufe + _dict_to_namespace
+pro Instanz. Neu: planso_config.load_config (einmal geparst, Platzhalter erst
+beim Zugriff ersetzt). Pro Instanz werden die Selectoren gelesen, die ein
+typischer Flow braucht. Ein Browser wird nicht gestartet.
+
+    PYTHONPATH=. python benchmarks/bench_config_cache.py --instances 200
+"""
+import argparse
+import os
+import time
+from types import SimpleNamespace
+
+import yaml
+
+from web_scraper_operations.planso_config import load_config
+
+CONFIG = os.path.join(
+    os.path.dirname(__file__), "..", "web_scraper_operations", "config.yaml"
+)
+
+
+def _replace_in_dict(data, search, replace):
+    if isinstance(data, dict):
+        return {k: _replace_in_dict(v, search, replace) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_replace_in_dict(i, search, replace) for i in data]
+    elif isinstance(data, str):
+        return data.replace(search, replace)
+    return data
+
+
+def _dict_to_namespace(d):
+    if isinstance(d, dict):
+        return SimpleNamespace(**{k: _dict_to_namespace(v) for k, v in d.items()})
+    elif isinstance(d, list):
+        return [_dict_to_namespace(i) for i in d]
+    return d
+
+
+def old_config(table):
+    with open(CONFIG, "r") as f:
+        config = yaml.safe_load(f)["jvg"]
+    config = _replace_in_dict(config, "TABLE_ID", table)
+    config = _replace_in_dict(config, "TABLE_NAME", "Tabelle")
+    config = _replace_in_dict(config, "ORGA_LIST_ID", "42")
+    return _dict_to_namespace(config)
+
+
+def new_config(table):
+    return load_config(
+        CONFIG, "jvg", TABLE_ID=table, TABLE_NAME="Tabelle", ORGA_LIST_ID="42"
+    )
+
+
+def touch(config):
+    # typische Zugriffe eines Upload-Flows
+    selenium = config.selenium
+    for name in ("login_username_field", "table_element", "load_table_indicator"):
+        entry = getattr(selenium, name)
+        entry.locator_strategie, entry.selector
+    config.login_payload.system_login_username = "user"
+
+
+def run(build, instances):
+    start = time.perf_counter()
+    for i in range(instances):
+        touch(build(str(1000 + i)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--instances", type=int, default=200)
+    args = parser.parse_args()
+
+    new_config("warmup")
+    old = run(old_config, args.instances)
+    new = run(new_config, args.instances)
+    print(f"{'':10}{'gesamt [s]':>12}{'pro Instanz [ms]':>18}")
+    for label, total in (("alt", old), ("neu", new)):
+        print(f"{label:10}{total:12.3f}{total / args.instances * 1000:18.3f}")
+    print(f"Faktor: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
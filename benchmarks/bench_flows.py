@@ -0,0 +1,366 @@
+"""
+Führt alle Flows aus planso_flows.py gegen einen lokalen Nachbau der PlanSo-
+Seiten aus (benchmarks/fake_planso) und misst pro Flow und Tabellengröße
+Wandzeit, Anzahl WebDriver-Kommandos und Spitzen-RSS.
+
+Modi:
+  fake    Fake-Driver ohne Chrome; --latency-ms simuliert den Round Trip
+          zu chromedriver pro Kommando (Skalierung ohne Browser testen)
+  chrome  headless Chrome gegen einen lokalen HTTP-Server mit denselben Seiten
+          (RSS inkl. chromedriver/Chrome)
+
+Tabellengrößen als ZEILENxSPALTEN, Spalten werden aus config.table_fields genommen.
+--browser-config startet die Clients mit dem Abschnitt `browser` der config.yaml
+(page_load_strategy, resource_policy); im Vergleich mit einem Lauf ohne zeigt
+sich, was die Policy spart.
+
+--concurrency N startet jeden Flow N-mal parallel. MB/Sess ist der Anstieg
+des Spitzen-RSS gegenüber dem RSS vor dem Flow geteilt durch N, Sess/GB die
+daraus folgende Anzahl paralleler Sessions pro GB (nur mit --mode chrome
+aussagekräftig). --launch-profile wählt das Chrome-Startprofil (default/lean).
+
+--deep-links trägt die URL-Vorlagen des Nachbaus (fake_planso.site.DEEP_LINKS)
+in eine Kopie der config.yaml ein; invoice und spareparts_ok bekommen dann die
+order_id und springen ohne Suche direkt zu den Teilen.
+
+--fixed-sleeps misst jeden Flow zusätzlich mit den festen time.sleep-Pausen
+von vor der Umstellung auf settle() (FIXED_SLEEPS) als Vergleichswert; die
+Spalte "sleeps [s]" zeigt die Wandzeit dieses Laufs neben "wall [s]".
+
+    PYTHONPATH=. python benchmarks/bench_flows.py --sizes 100x10,1000x40 --latency-ms 2
+    PYTHONPATH=. python benchmarks/bench_flows.py --mode fake --jqgrid --flows upload,invoice
+    PYTHONPATH=. python benchmarks/bench_flows.py --mode chrome --sizes 100x10
+    PYTHONPATH=. python benchmarks/bench_flows.py --mode chrome --sizes 100x10 --browser-config
+    PYTHONPATH=. python benchmarks/bench_flows.py --mode chrome --sizes 100x10 --concurrency 4 --launch-profile lean
+    PYTHONPATH=. python benchmarks/bench_flows.py --flows invoice,invoice_batch --deep-links
+    PYTHONPATH=. python benchmarks/bench_flows.py --sizes 50x10 --fixed-sleeps
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import yaml
+
+from fake_planso.site import DEEP_LINKS, FakePlanSo, plate, serve
+from web_scraper_operations import planso_flows
+from web_scraper_operations.command_profiler import CommandProfiler
+from web_scraper_operations.planso_config import browser_options, load_config
+from web_scraper_operations.planso_scraper import PlanSoMain
+from web_scraper_operations.selenium_client import _process_tree_rss
+
+CONFIG = os.path.join(
+    os.path.dirname(os.path.abspath(planso_flows.__file__)), "config.yaml"
+)
+
+# Feste Pausen pro settle()-Aufruf vor der Umstellung (Sekunden). Wo ein
+# settle() mehrere alte time.sleep ersetzt, steht hier deren Summe verteilt auf
+# die neuen Aufrufe: search 8x 1 s in find_element_with_search auf 3 Aufrufe,
+# open_details 3x 1 s auf 2 Aufrufe, upload_close 1 s + 1 s, open_table und
+# logout inkl. der Pausen in planso_flows (1 s bzw. 0,3 s).
+FIXED_SLEEPS = {
+    "login": 1.0,
+    "logout": 0.8,
+    "dialog": 1.0,
+    "open_table": 2.0,
+    "open_orga_list": 1.0,
+    "open_details": 1.5,
+    "search": 8 / 3,
+    "set_page": 1.0,
+    "teile": 1.0,
+    "upload_dialog": 1.0,
+    "upload_alert": 2.0,
+    "upload_close": 2.0,
+}
+
+
+@contextmanager
+def fixed_sleeps():
+    """Ersetzt PlanSoMain.settle durch die alten festen Pausen (FIXED_SLEEPS)."""
+    settle = PlanSoMain.settle
+    PlanSoMain.settle = lambda self, step, target=None: time.sleep(FIXED_SLEEPS[step])
+    try:
+        yield
+    finally:
+        PlanSoMain.settle = settle
+
+
+class PeakRss:
+    """Spitzen-RSS dieses Prozesses inkl. Kindprozessen (chromedriver, Chrome)."""
+
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while True:
+            self.peak = max(self.peak, _process_tree_rss(os.getpid()))
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+
+def columns_from_config(count, client="jvg"):
+    with open(CONFIG, "r") as f:
+        fields = yaml.safe_load(f)[client]["table_fields"]
+    prefix = "baymis_TABLE_ID_"
+    return [value[len(prefix) :] for value in fields.values()][:count]
+
+
+def parse_sizes(text):
+    sizes = []
+    for item in text.split(","):
+        rows, cols = item.lower().split("x")
+        sizes.append((int(rows), int(cols)))
+    return sizes
+
+
+def _ok(result):
+    if not isinstance(result, dict):
+        return True
+    if "error" in result or "Error" in result:
+        return False
+    return all("error" not in job for job in result.get("jobs", []))
+
+
+def _run(flow, kwargs):
+    try:
+        result = flow(**kwargs)
+        return result, _ok(result)
+    except Exception as e:
+        return {"exception": repr(e)}, False
+
+
+def write_deep_link_config(path, client="jvg"):
+    """Kopie der config.yaml mit den deep_links des Nachbaus."""
+    with open(CONFIG, "r") as f:
+        data = yaml.safe_load(f)
+    data[client]["deep_links"] = dict(DEEP_LINKS)
+    with open(path, "w") as f:
+        yaml.safe_dump(data, f, allow_unicode=True)
+    return path
+
+
+def build_flows(site, files, base_url, pool, config=None):
+    """(Kurzname, Flow-Funktion, kwargs) für jeden Flow in planso_flows.py."""
+    n = len(site.rows)
+    # Zielzeilen weit hinten, damit Suche/Paging etwas zu tun haben
+    indices = sorted({n * 3 // 4, n // 2, n - 1})
+    targets = [plate(i) for i in indices]
+    common = {
+        "username": "bench",
+        "password": "bench",
+        "base_url": base_url,
+        "selenium_pool": pool,
+        "config": config,
+    }
+    # mit deep_links ist die ID bekannt, die Suche entfällt
+    direct = {"order_id": site.rows[indices[0]]["ID"]} if config else {}
+    table = {"table": site.table_id, "table_name": site.table_name}
+    orga = {"table": site.orga_table_id, "orga_list_id": site.orga_list_id}
+    search = {"search_field_name": "Kennzeichen"}
+    return [
+        (
+            "upload",
+            planso_flows.planso_upload_flow,
+            dict(common, **table, **search, field_name="Dokumente", search_string=targets[0], path=files[0]),
+        ),
+        (
+            "bulk_upload",
+            planso_flows.planso_bulk_upload,
+            dict(common, **table, **search, field_name="Dokumente", search_string=targets[0], path_list=files[1:3]),
+        ),
+        (
+            "invoice",
+            planso_flows.planso_invoice_positions_flow,
+            dict(common, **orga, **search, **direct, search_string=targets[0]),
+        ),
+        (
+            "spareparts_ok",
+            planso_flows.planso_spareparts_ok,
+            dict(common, **orga, **search, **direct, search_string=targets[0], positions=""),
+        ),
+        (
+            "trash",
+            planso_flows.planso_trash_documents,
+            dict(common, **table, **search, field_name="Dokumente", search_string=targets[0]),
+        ),
+        (
+            "upload_batch",
+            planso_flows.planso_upload_batch_flow,
+            dict(common, **table, **search, field_name="Dokumente", jobs=[(t, [files[3]]) for t in targets]),
+        ),
+        (
+            "invoice_batch",
+            planso_flows.planso_invoice_positions_batch_flow,
+            dict(common, **orga, **search, jobs=[(t, None) for t in targets]),
+        ),
+        (
+            "spareparts_ok_batch",
+            planso_flows.planso_spareparts_ok_batch_flow,
+            dict(common, **orga, **search, jobs=[(t, "") for t in targets]),
+        ),
+    ]
+
+
+def run_size(args, rows, cols, files):
+    site = FakePlanSo(
+        rows=rows,
+        columns=columns_from_config(cols),
+        parts=args.parts,
+        load_time=args.load_ms / 1000,
+        jqgrid=args.jqgrid,
+    )
+    profiler = CommandProfiler()
+    options = browser_options(load_config(CONFIG, "jvg")) if args.browser_config else {}
+    if args.launch_profile:
+        options["launch"] = dict(options.get("launch", {}), profile=args.launch_profile)
+    server = None
+    if args.mode == "chrome":
+        from web_scraper_operations.selenium_client import SeleniumClient
+
+        server, base_url = serve(site)
+        factory = lambda: SeleniumClient(headless=True, **options)
+    else:
+        from fake_planso.driver import FakeSeleniumClient
+
+        base_url = "http://planso.fake/"
+        # der Fake-Driver hat keinen HTTP-Cache, ein Template bräuchte echtes Chrome
+        options.pop("profile_template", None)
+        factory = lambda: FakeSeleniumClient(site, latency=args.latency_ms / 1000, **options)
+
+    from fake_planso.driver import BenchPool
+
+    pool = BenchPool(factory, profiler)
+    results = []
+    try:
+        for name, flow, kwargs in build_flows(site, files, base_url, pool, args.config):
+            if args.flows and name not in args.flows:
+                continue
+            profiler.reset()
+            baseline = _process_tree_rss(os.getpid())
+            with PeakRss() as rss:
+                start = time.perf_counter()
+                if args.concurrency == 1:
+                    result, ok = _run(flow, kwargs)
+                else:
+                    with ThreadPoolExecutor(args.concurrency) as executor:
+                        outcomes = list(executor.map(lambda _: _run(flow, kwargs), range(args.concurrency)))
+                    result = [r for r, _ in outcomes]
+                    ok = all(o for _, o in outcomes)
+                wall = time.perf_counter() - start
+            profile = profiler.as_dict()
+            wall_sleeps = None
+            if args.fixed_sleeps:
+                with fixed_sleeps():
+                    start = time.perf_counter()
+                    _, ok_sleeps = _run(flow, kwargs)
+                    wall_sleeps = time.perf_counter() - start
+                ok = ok and ok_sleeps
+            per_session = max(rss.peak - baseline, 0) / args.concurrency / 2**20
+            results.append(
+                {
+                    "flow": name,
+                    "size": f"{rows}x{cols}",
+                    "wall": round(wall, 3),
+                    "wall_fixed_sleeps": round(wall_sleeps, 3) if wall_sleeps is not None else None,
+                    "commands": profile["commands"],
+                    "command_time": profile["time"],
+                    "peak_rss_mb": round(rss.peak / 2**20, 1),
+                    "concurrency": args.concurrency,
+                    "session_rss_mb": round(per_session, 1),
+                    "sessions_per_gb": int(1024 // per_session) if per_session else None,
+                    "ok": ok,
+                    "top_callers": profile["by_caller"][:5],
+                    "result": result,
+                }
+            )
+            print_row(results[-1])
+    finally:
+        if server is not None:
+            server.shutdown()
+    return results
+
+
+def print_header():
+    print(
+        f"{'flow':22}{'size':>10}{'wall [s]':>10}{'sleeps [s]':>11}{'commands':>10}{'cmd [s]':>9}{'RSS [MB]':>10}"
+        f"{'MB/Sess':>9}{'Sess/GB':>9}  ok"
+    )
+
+
+def print_row(row):
+    sleeps = row["wall_fixed_sleeps"]
+    print(
+        f"{row['flow']:22}{row['size']:>10}{row['wall']:10.2f}"
+        f"{'-' if sleeps is None else format(sleeps, '.2f'):>11}"
+        f"{row['commands']:10d}"
+        f"{row['command_time']:9.2f}{row['peak_rss_mb']:10.1f}{row['session_rss_mb']:9.1f}"
+        f"{row['sessions_per_gb'] or '-':>9}  {'ja' if row['ok'] else 'NEIN'}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("fake", "chrome"), default="fake")
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("100x10,1000x40"))
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="nur --mode fake")
+    parser.add_argument("--load-ms", type=float, default=300.0, help="Ladezeit der Tabelle")
+    parser.add_argument("--parts", type=int, default=5, help="Ersatzteile pro Auftrag")
+    parser.add_argument("--jqgrid", action="store_true", help="jqGrid-API emulieren (nur --mode fake)")
+    parser.add_argument("--flows", type=lambda s: s.split(","), default=None)
+    parser.add_argument("--browser-config", action="store_true", help="Abschnitt browser der config.yaml verwenden")
+    parser.add_argument("--concurrency", type=int, default=1, help="parallele Läufe pro Flow")
+    parser.add_argument("--launch-profile", choices=("default", "lean"), help="Chrome-Startprofil")
+    parser.add_argument("--deep-links", action="store_true", help="deep_links des Nachbaus verwenden")
+    parser.add_argument("--fixed-sleeps", action="store_true", help="zusätzlich mit den alten festen Pausen messen")
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON schreiben")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    if args.mode == "chrome" and args.jqgrid:
+        parser.error("--jqgrid gibt es nur mit --mode fake")
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.CRITICAL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_flows_") as tmp:
+        files = []
+        for name in ("rechnung.pdf", "foto_1.jpg", "foto_2.jpg", "gutachten.pdf"):
+            path = os.path.join(tmp, name)
+            with open(path, "wb") as f:
+                f.write(os.urandom(32 * 1024))
+            files.append(path)
+        args.config = write_deep_link_config(os.path.join(tmp, "config.yaml")) if args.deep_links else None
+
+        print_header()
+        for rows, cols in args.sizes:
+            results.extend(run_size(args, rows, cols, files))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+    sys.exit(0 if all(r["ok"] for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
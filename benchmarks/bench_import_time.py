@@ -0,0 +1,75 @@
+"""
+Prüft die Importzeit der Paket-Module mit `python -X importtime` gegen ein
+Budget. selenium, yaml, requests und aiohttp dürfen beim Import nicht geladen werden,
+sondern erst bei der ersten Benutzung.
+
+Beendet sich mit Exit-Code 1, wenn ein Modul über dem Budget liegt oder
+schwere Abhängigkeiten eager lädt (für CI geeignet).
+
+    PYTHONPATH=. python benchmarks/bench_import_time.py --budget-ms 50
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MODULES = (
+    "web_scraper_operations.planso_flows",
+    "web_scraper_operations.planso_scraper",
+    "web_scraper_operations.planso_config",
+)
+HEAVY = ("selenium", "yaml", "requests", "aiohttp")
+
+
+def import_time_ms(module):
+    """Kumulierte Importzeit von `module` in ms (ohne Interpreter-Start)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"keine importtime-Zeile für {module}")
+
+
+def heavy_modules(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+        check=True,
+    ).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    for module in MODULES:
+        best = min(import_time_ms(module) for _ in range(args.runs))
+        heavy = heavy_modules(module)
+        ok = best <= args.budget_ms and not heavy
+        failed |= not ok
+        print(
+            f"{'OK ' if ok else 'FAIL'} {module:45}{best:8.1f} ms"
+            + (f"  lädt eager: {', '.join(heavy)}" if heavy else "")
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
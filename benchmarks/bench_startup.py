@@ -0,0 +1,96 @@
+"""
+Misst die Startzeit eines SeleniumClient (Konstruktor bis Driver bereit) und
+die Zeit für quit() in drei Varianten:
+
+  discovery  wie früher: webdriver.Chrome(service=Service()), d.h. Selenium
+             Manager und ein eigener chromedriver pro Client
+  resolved   Pfade einmal pro Prozess aufgelöst, eigener chromedriver pro Client
+  shared     Pfade einmal aufgelöst, alle Clients öffnen nur eine Session am
+             geteilten chromedriver
+
+Braucht Chrome + chromedriver (oder Netz für Selenium Manager).
+
+    PYTHONPATH=. python benchmarks/bench_startup.py --runs 10
+    CHROMEDRIVER_PATH=/usr/bin/chromedriver PYTHONPATH=. python benchmarks/bench_startup.py --modes resolved,shared
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from web_scraper_operations.selenium_client import SeleniumClient, resolve_binaries
+
+MODES = ("discovery", "resolved", "shared")
+
+
+class DiscoveryClient(SeleniumClient):
+    """SeleniumClient mit dem alten Start: Binary-Suche und chromedriver pro Client."""
+
+    def _start_driver(self, chrome_options):
+        return webdriver.Chrome(service=Service(), options=chrome_options)
+
+
+def run_mode(mode, runs):
+    cls = DiscoveryClient if mode == "discovery" else SeleniumClient
+    starts, quits = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        client = cls(headless=True, shared_service=(mode == "shared"))
+        starts.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        client.quit()
+        quits.append(time.perf_counter() - start)
+    return {
+        "mode": mode,
+        "runs": runs,
+        # der erste Start enthält einmalige Kosten (Auflösung, geteilter chromedriver)
+        "first": round(starts[0], 3),
+        "median": round(statistics.median(starts), 3),
+        "mean_after_first": round(statistics.mean(starts[1:] or starts), 3),
+        "quit_median": round(statistics.median(quits), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--modes", type=lambda s: s.split(","), default=list(MODES))
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON schreiben")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    unknown = set(args.modes) - set(MODES)
+    if unknown:
+        parser.error(f"unbekannte Modi: {', '.join(sorted(unknown))}")
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.CRITICAL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    start = time.perf_counter()
+    driver_path, browser_path = resolve_binaries()
+    print(f"Auflösung: {time.perf_counter() - start:.3f}s  ({driver_path}, {browser_path or '-'})")
+
+    print(f"{'mode':12}{'runs':>6}{'first [s]':>11}{'median [s]':>12}{'mean 2.. [s]':>14}{'quit [s]':>10}")
+    results = []
+    for mode in args.modes:
+        row = run_mode(mode, args.runs)
+        results.append(row)
+        print(
+            f"{row['mode']:12}{row['runs']:6d}{row['first']:11.3f}{row['median']:12.3f}"
+            f"{row['mean_after_first']:14.3f}{row['quit_median']:10.3f}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
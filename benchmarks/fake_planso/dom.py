@@ -0,0 +1,525 @@
+"""
+Minimaler DOM für die Fake-PlanSo-Seite mit einer Teilmenge von CSS und XPath,
+so weit sie die Selektoren aus config.yaml brauchen.
+
+CSS:   tag, #id, .klasse, [attr], [attr="wert"], [attr='wert'], Nachfahren (Leerzeichen), Kind (>)
+XPath: / // . .. ancestor::, Knotentests (name, *, text()), @attr,
+       Prädikate mit Position, and/or, not(), contains(), =, !=
+"""
+import html
+import itertools
+import re
+
+_keys = itertools.count()
+
+
+def selenium_text(text):
+    """Normalisierung von WebElement.text: geschützte Leerzeichen werden normale, Zeilen getrimmt."""
+    lines = text.replace("\xa0", " ").split("\n")
+    return "\n".join(line.strip() for line in lines).strip()
+
+
+class Node:
+    __slots__ = ("tag", "attrs", "children", "parent", "text", "key", "hidden")
+
+    def __init__(self, tag, attrs=None, children=(), text="", key=None, hidden=False):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = None
+        self.text = text
+        self.hidden = hidden
+        self.key = key
+        for child in children:
+            self.append(child)
+
+    def append(self, child):
+        if child is None:
+            return
+        child.parent = self
+        self.children.append(child)
+
+    # ----- Abfragen
+
+    def iter(self):
+        """Alle Nachfahren in Dokumentreihenfolge (ohne self)."""
+        for child in self.children:
+            yield child
+            yield from child.iter()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def is_displayed(self):
+        if self.hidden or self.attrs.get("type") == "hidden":
+            return False
+        return not any(a.hidden for a in self.ancestors())
+
+    def text_content(self):
+        """Wie Node.textContent (inkl. versteckter Teile)."""
+        parts = [self.text] + [c.text_content() for c in self.children]
+        return " ".join(p for p in parts if p)
+
+    def visible_text(self):
+        """Wie WebElement.text: nur sichtbarer Text, normalisiert (selenium_text)."""
+        return selenium_text(self.inner_text())
+
+    def inner_text(self):
+        """Wie HTMLElement.innerText: nur sichtbarer Text, geschützte Leerzeichen bleiben erhalten."""
+        if not self.is_displayed():
+            return ""
+        return self._visible_text()
+
+    def _visible_text(self):
+        if self.hidden:
+            return ""
+        parts = [self.text] + [c._visible_text() for c in self.children]
+        return " ".join(p for p in parts if p)
+
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    # ----- HTML
+
+    def to_html(self):
+        attrs = dict(self.attrs)
+        if self.hidden:
+            attrs["style"] = "display:none;" + attrs.get("style", "")
+        if self.key is not None:
+            attrs["data-key"] = self.key
+        rendered = "".join(
+            f' {k}="{html.escape(str(v), quote=True)}"' if v is not True else f" {k}"
+            for k, v in attrs.items()
+            if v is not None and v is not False
+        )
+        if self.tag in ("input", "br", "img"):
+            return f"<{self.tag}{rendered}>"
+        inner = html.escape(self.text) + "".join(c.to_html() for c in self.children)
+        return f"<{self.tag}{rendered}>{inner}</{self.tag}>"
+
+
+def el(tag, attrs=None, *children, text="", key=None, hidden=False):
+    return Node(tag, attrs, children, text=text, key=key, hidden=hidden)
+
+
+def assign_keys(root):
+    """
+    Vergibt stabile Schlüssel: Knoten mit id -> '#id', sonst Pfad ab dem
+    nächsten Vorfahren mit Schlüssel. So überleben Element-Referenzen ein
+    Neu-Rendern, solange der Knoten noch existiert.
+    """
+
+    def walk(node, prefix):
+        if node.key is None:
+            node_id = node.attrs.get("id")
+            node.key = f"#{node_id}" if node_id else prefix
+        counts = {}
+        for child in node.children:
+            n = counts.get(child.tag, 0)
+            counts[child.tag] = n + 1
+            walk(child, f"{node.key}/{child.tag}[{n}]")
+
+    walk(root, "/")
+    return root
+
+
+# ======================================================================= CSS
+
+_CSS_PART = re.compile(
+    r"""
+    (?P<tag>^[a-zA-Z*][\w-]*)
+  | \#(?P<id>[\w:-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~^$*]?=)\s*(?P<q>["']?)(?P<val>.*?)(?P=q))?\s*\]
+    """,
+    re.VERBOSE,
+)
+
+
+def _css_compound(text):
+    tests = []
+    pos = 0
+    while pos < len(text):
+        m = _CSS_PART.match(text, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"CSS nicht unterstützt: {text!r}")
+        tests.append(m.groupdict())
+        pos = m.end()
+    return tests
+
+
+def _css_tokens(selector):
+    """Zerlegt in Compound-Selektoren und Kombinatoren (' ' oder '>')."""
+    tokens, buf, depth, quote = [], "", 0, None
+    for ch in selector.strip():
+        if quote:
+            buf += ch
+            if ch == quote:
+                quote = None
+            continue
+        if ch in "\"'":
+            quote = ch
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        if depth == 0 and ch in " >":
+            if buf:
+                tokens.append(buf)
+                buf = ""
+            if ch == ">":
+                tokens.append(">")
+            continue
+        buf += ch
+    if buf:
+        tokens.append(buf)
+    parts, combinator = [], " "
+    for token in tokens:
+        if token == ">":
+            combinator = ">"
+            continue
+        parts.append((combinator, _css_compound(token)))
+        combinator = " "
+    return parts
+
+
+def _css_test(node, tests):
+    for t in tests:
+        if t["tag"] and t["tag"] != "*" and node.tag != t["tag"].lower():
+            return False
+        if t["id"] and node.attrs.get("id") != t["id"]:
+            return False
+        if t["cls"] and t["cls"] not in node.classes():
+            return False
+        if t["attr"]:
+            if t["attr"] not in node.attrs:
+                return False
+            if t["op"]:
+                value = str(node.attrs[t["attr"]])
+                expected = t["val"]
+                op = t["op"]
+                if op == "=" and value != expected:
+                    return False
+                if op == "~=" and expected not in value.split():
+                    return False
+                if op == "^=" and not value.startswith(expected):
+                    return False
+                if op == "$=" and not value.endswith(expected):
+                    return False
+                if op == "*=" and expected not in value:
+                    return False
+    return True
+
+
+def _css_match(node, parts):
+    combinator, tests = parts[-1]
+    if not _css_test(node, tests):
+        return False
+    if len(parts) == 1:
+        return True
+    rest = parts[:-1]
+    if combinator == ">":
+        return node.parent is not None and _css_match(node.parent, rest)
+    return any(_css_match(a, rest) for a in node.ancestors())
+
+
+def css_select(scope, selector):
+    parts = _css_tokens(selector)
+    return [n for n in scope.iter() if _css_match(n, parts)]
+
+
+# ===================================================================== XPath
+
+_XP_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<str>"[^"]*"|'[^']*')
+      | (?P<num>\d+)
+      | (?P<op>//|/|::|\.\.|\.|\(|\)|\[|\]|@|,|!=|=|\*)
+      | (?P<name>[A-Za-z_][\w-]*)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _xp_tokenize(text):
+    tokens, pos = [], 0
+    text = text.strip()
+    while pos < len(text):
+        m = _XP_TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"XPath nicht unterstützt: {text!r} bei {pos}")
+        pos = m.end()
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "str":
+            value = value[1:-1]
+        elif kind == "num":
+            value = int(value)
+        tokens.append((kind, value))
+    return tokens
+
+
+class _XPathParser:
+    def __init__(self, text):
+        self.tokens = _xp_tokenize(text)
+        self.pos = 0
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if value is not None and token[1] != value:
+            raise ValueError(f"XPath: erwartet {value!r}, gefunden {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        expr = self.expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"XPath: unerwartetes Token {self.peek()!r}")
+        return expr
+
+    def expr(self):
+        left = self.and_expr()
+        while self.peek() == ("name", "or"):
+            self.take()
+            left = ("or", left, self.and_expr())
+        return left
+
+    def and_expr(self):
+        left = self.cmp_expr()
+        while self.peek() == ("name", "and"):
+            self.take()
+            left = ("and", left, self.cmp_expr())
+        return left
+
+    def cmp_expr(self):
+        left = self.unary()
+        if self.peek()[1] in ("=", "!="):
+            op = self.take()[1]
+            return (op, left, self.unary())
+        return left
+
+    def unary(self):
+        kind, value = self.peek()
+        if kind == "str":
+            self.take()
+            return ("lit", value)
+        if kind == "num":
+            self.take()
+            return ("num", value)
+        if (
+            kind == "name"
+            and self.peek(1)[1] == "("
+            and value in ("contains", "not", "starts-with", "normalize-space")
+        ):
+            self.take()
+            self.take("(")
+            args = []
+            if self.peek()[1] != ")":
+                args.append(self.expr())
+                while self.peek()[1] == ",":
+                    self.take()
+                    args.append(self.expr())
+            self.take(")")
+            return ("fn", value, args)
+        return self.path()
+
+    def path(self):
+        absolute = None
+        if self.peek()[1] in ("/", "//"):
+            absolute = self.take()[1]
+        steps = [self.step()]
+        while self.peek()[1] in ("/", "//"):
+            sep = self.take()[1]
+            if sep == "//":
+                steps.append(("descendant-or-self", "node", []))
+            steps.append(self.step())
+        if absolute == "//":
+            steps.insert(0, ("descendant-or-self", "node", []))
+        return ("path", absolute is not None, steps)
+
+    def step(self):
+        kind, value = self.peek()
+        if value == ".":
+            self.take()
+            return ("self", "node", [])
+        if value == "..":
+            self.take()
+            return ("parent", "node", [])
+        axis = "child"
+        if value == "@":
+            self.take()
+            axis = "attribute"
+        elif kind == "name" and self.peek(1)[1] == "::":
+            axis = self.take()[1]
+            self.take("::")
+        kind, value = self.take()
+        if value == "*":
+            test = "*"
+        elif kind == "name" and value in ("text", "node") and self.peek()[1] == "(":
+            self.take("(")
+            self.take(")")
+            test = f"{value}()"
+        elif kind == "name":
+            test = value
+        else:
+            raise ValueError(f"XPath: Knotentest erwartet, gefunden {value!r}")
+        predicates = []
+        while self.peek()[1] == "[":
+            self.take()
+            predicates.append(self.expr())
+            self.take("]")
+        return (axis, test, predicates)
+
+
+def _string(value):
+    """XPath string(): erster Knoten bzw. Wert."""
+    if isinstance(value, list):
+        if not value:
+            return ""
+        value = value[0]
+    if isinstance(value, Node):
+        return value.text_content()
+    return str(value)
+
+
+def _truthy(value):
+    if isinstance(value, list):
+        return bool(value)
+    return bool(value)
+
+
+def _axis(node, axis):
+    if axis == "child":
+        return list(node.children)
+    if axis == "self":
+        return [node]
+    if axis == "parent":
+        return [node.parent] if node.parent is not None else []
+    if axis == "descendant-or-self":
+        return [node] + list(node.iter())
+    if axis == "descendant":
+        return list(node.iter())
+    if axis == "ancestor":
+        return list(node.ancestors())[::-1]
+    if axis == "ancestor-or-self":
+        return list(node.ancestors())[::-1] + [node]
+    raise ValueError(f"XPath-Achse nicht unterstützt: {axis}")
+
+
+def _eval(expr, node):
+    kind = expr[0]
+    if kind == "lit":
+        return expr[1]
+    if kind == "num":
+        return expr[1]
+    if kind == "or":
+        return _truthy(_eval(expr[1], node)) or _truthy(_eval(expr[2], node))
+    if kind == "and":
+        return _truthy(_eval(expr[1], node)) and _truthy(_eval(expr[2], node))
+    if kind in ("=", "!="):
+        left, right = _eval(expr[1], node), _eval(expr[2], node)
+        lefts = left if isinstance(left, list) else [left]
+        rights = right if isinstance(right, list) else [right]
+        equal = any(_string(a) == _string(b) for a in lefts for b in rights)
+        return equal if kind == "=" else not equal
+    if kind == "fn":
+        name, args = expr[1], [_eval(a, node) for a in expr[2]]
+        if name == "not":
+            return not _truthy(args[0])
+        if name == "contains":
+            return _string(args[1]) in _string(args[0])
+        if name == "starts-with":
+            return _string(args[0]).startswith(_string(args[1]))
+        if name == "normalize-space":
+            return " ".join(_string(args[0] if args else node).split())
+    if kind == "path":
+        return _eval_path(expr, node)
+    raise ValueError(f"XPath-Ausdruck nicht unterstützt: {expr!r}")
+
+
+def _eval_path(expr, node):
+    _, absolute, steps = expr
+    context = [node.root()] if absolute else [node]
+    for axis, test, predicates in steps:
+        result = []
+        seen = set()
+        for ctx in context:
+            if not isinstance(ctx, Node):
+                continue
+            if axis == "attribute":
+                if test in ctx.attrs:
+                    result.append(str(ctx.attrs[test]))
+                continue
+            if test == "text()":
+                texts = [ctx.text] if ctx.text else []
+                result.extend(texts)
+                continue
+            candidates = [
+                n
+                for n in _axis(ctx, axis)
+                if test in ("*", "node") or n.tag == test
+            ]
+            for predicate in predicates:
+                filtered = []
+                for position, candidate in enumerate(candidates, start=1):
+                    value = _eval(predicate, candidate)
+                    if isinstance(value, int) and not isinstance(value, bool):
+                        if value == position:
+                            filtered.append(candidate)
+                    elif _truthy(value):
+                        filtered.append(candidate)
+                candidates = filtered
+            for candidate in candidates:
+                if id(candidate) not in seen:
+                    seen.add(id(candidate))
+                    result.append(candidate)
+        context = result
+    return context
+
+
+_XPATH_CACHE = {}
+
+
+def xpath_select(scope, selector):
+    expr = _XPATH_CACHE.get(selector)
+    if expr is None:
+        expr = _XPATH_CACHE[selector] = _XPathParser(selector).parse()
+    result = _eval(expr, scope)
+    nodes = [n for n in result if isinstance(n, Node)] if isinstance(result, list) else []
+    # Dokumentreihenfolge wie im Browser
+    order = {id(n): i for i, n in enumerate([scope.root()] + list(scope.root().iter()))}
+    return sorted(nodes, key=lambda n: order.get(id(n), 0))
+
+
+def select(scope, using, value):
+    if using == "css selector":
+        return css_select(scope, value)
+    if using == "xpath":
+        return xpath_select(scope, value)
+    if using == "tag name":
+        return [n for n in scope.iter() if n.tag == value.lower()]
+    if using in ("link text", "partial link text"):
+        return [
+            n
+            for n in scope.iter()
+            if n.tag == "a"
+            and (
+                n.visible_text() == value
+                if using == "link text"
+                else value in n.visible_text()
+            )
+        ]
+    raise ValueError(f"Locator nicht unterstützt: {using}")
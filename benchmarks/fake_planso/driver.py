@@ -0,0 +1,459 @@
+"""
+Fake-Driver: beantwortet W3C-WebDriver-Kommandos direkt aus der Session der
+Fake-Seite, ohne Chrome/chromedriver. Jedes Kommando kann eine feste Latenz
+bekommen (Round Trip zu chromedriver), damit sich die Skalierung der Flows
+mit der Anzahl Kommandos messen lässt.
+
+Eingehängt wird er als `command_executor` eines `webdriver.Remote`, so laufen
+SeleniumClient, WebDriverWait, Select usw. unverändert.
+"""
+import os
+import threading
+import time
+import uuid
+
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from fake_planso.dom import css_select, select, selenium_text
+from web_scraper_operations.planso_scraper import (
+    COLUMN_MAP_SCRIPT,
+    GRID_FILTER_SCRIPT,
+    GRID_SEARCH_SCRIPT,
+    TEILE_INFO_SCRIPT,
+)
+from web_scraper_operations.selenium_client import SETTLE_SCRIPT, SeleniumClient
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+# Sondertasten aus selenium.webdriver.common.keys (Private Use Area)
+RETURN_KEYS = ("\ue006", "\ue007")
+
+
+class WebDriverError(Exception):
+    def __init__(self, error, message):
+        super().__init__(message)
+        self.error = error
+        self.message = message
+
+
+class FakeConnection:
+    """
+    Ersatz für RemoteConnection: `execute(command, params)` liefert Antworten
+    im W3C-Format ({"value": ...} bzw. {"status": <error>, "value": {...}}).
+
+    :param latency: Sekunden, die jedes Kommando zusätzlich dauert
+    """
+
+    def __init__(self, site, latency=0.0):
+        self.site = site
+        self.latency = latency
+        self.session = site.new_session()
+        self.commands = 0
+        self._lock = threading.Lock()
+
+    def execute(self, command, params):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.commands += 1
+        handler = getattr(self, f"_cmd_{command}", None)
+        try:
+            if handler is None:
+                raise WebDriverError("unknown command", f"Kommando nicht nachgebildet: {command}")
+            return {"value": handler(params or {})}
+        except WebDriverError as e:
+            return {"status": e.error, "value": {"error": e.error, "message": e.message}}
+
+    # ----- Hilfen
+
+    def _node(self, params, key="id"):
+        node = self.session.node(params[key])
+        if node is None:
+            raise WebDriverError("stale element reference", f"Element {params[key]} ist nicht mehr im DOM")
+        return node
+
+    def _ref(self, node):
+        return {ELEMENT_KEY: node.key}
+
+    def _find(self, scope, params):
+        try:
+            return select(scope, params["using"], params["value"])
+        except ValueError as e:
+            raise WebDriverError("invalid selector", str(e))
+
+    def _unwrap(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self._node({"id": value[ELEMENT_KEY]})
+        if isinstance(value, list):
+            return [self._unwrap(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._unwrap(v) for k, v in value.items()}
+        return value
+
+    def _dispatch_from(self, node, attribute, value=None):
+        """Löst die Aktion des nächsten Vorfahren mit `attribute` aus."""
+        for candidate in [node] + list(node.ancestors()):
+            action = candidate.attrs.get(attribute)
+            if action:
+                self.session.dispatch(action, candidate.attrs.get("data-target"), value)
+                return True
+        return False
+
+    # ----- Session / Navigation
+
+    def _cmd_newSession(self, params):
+        return {
+            "sessionId": uuid.uuid4().hex,
+            "capabilities": {"browserName": "chrome", "browserVersion": "fake", "platformName": "linux"},
+        }
+
+    def _cmd_setTimeouts(self, params):
+        return None
+
+    def _cmd_get(self, params):
+        self.session.navigate(params["url"])
+        return None
+
+    def _cmd_getCurrentUrl(self, params):
+        return self.session.url
+
+    def _cmd_w3cGetWindowHandles(self, params):
+        return ["main"]
+
+    def _cmd_w3cGetCurrentWindowHandle(self, params):
+        return "main"
+
+    def _cmd_switchToWindow(self, params):
+        return None
+
+    def _cmd_newWindow(self, params):
+        # nur ein Fenster: der "neue" Tab ist der alte, ohne Seite
+        self.session.navigate("about:blank")
+        return {"handle": "main", "type": "tab"}
+
+    def _cmd_close(self, params):
+        return None
+
+    def _cmd_quit(self, params):
+        return None
+
+    def close(self):
+        """Wird von webdriver.Remote.quit aufgerufen."""
+
+    def _cmd_executeCdpCommand(self, params):
+        return {}
+
+    # ----- Cookies
+
+    def _cmd_getCookies(self, params):
+        return list(self.session.cookies.values())
+
+    def _cmd_addCookie(self, params):
+        cookie = params["cookie"]
+        self.session.cookies[cookie["name"]] = cookie
+        return None
+
+    def _cmd_deleteAllCookies(self, params):
+        self.session.cookies.clear()
+        return None
+
+    # ----- Elemente finden
+
+    def _cmd_findElement(self, params):
+        nodes = self._find(self.session.document(), params)
+        if not nodes:
+            raise WebDriverError("no such element", f"{params['using']}={params['value']}")
+        return self._ref(nodes[0])
+
+    def _cmd_findElements(self, params):
+        return [self._ref(n) for n in self._find(self.session.document(), params)]
+
+    def _cmd_findChildElement(self, params):
+        nodes = self._find(self._node(params), params)
+        if not nodes:
+            raise WebDriverError("no such element", f"{params['using']}={params['value']}")
+        return self._ref(nodes[0])
+
+    def _cmd_findChildElements(self, params):
+        return [self._ref(n) for n in self._find(self._node(params), params)]
+
+    def _cmd_w3cGetActiveElement(self, params):
+        return self._ref(self.session.document())
+
+    # ----- Element-Zustand
+
+    def _cmd_getElementText(self, params):
+        return self._node(params).visible_text()
+
+    def _cmd_getElementTagName(self, params):
+        return self._node(params).tag
+
+    def _cmd_getElementAttribute(self, params):
+        return _attribute(self._node(params), params["name"], self.session)
+
+    def _cmd_getElementProperty(self, params):
+        node = self._node(params)
+        name = params["name"]
+        if name in ("checked", "selected", "multiple", "disabled"):
+            return name in node.attrs
+        if name == "value":
+            return self.session.values.get(node.key, node.attrs.get("value", ""))
+        return node.attrs.get(name)
+
+    def _cmd_isElementSelected(self, params):
+        node = self._node(params)
+        return "checked" in node.attrs or "selected" in node.attrs
+
+    def _cmd_isElementEnabled(self, params):
+        return "disabled" not in self._node(params).attrs
+
+    def _cmd_getElementRect(self, params):
+        return _rect(self._node(params))
+
+    # ----- Interaktion
+
+    def _cmd_clickElement(self, params):
+        node = self._node(params)
+        if not node.is_displayed():
+            raise WebDriverError("element not interactable", f"<{node.tag}> ist nicht sichtbar")
+        if node.tag == "option":
+            select_node = next(a for a in node.ancestors() if a.tag == "select")
+            self._dispatch_from(select_node, "data-change", node.attrs.get("value"))
+        elif node.attrs.get("type") == "checkbox":
+            self._dispatch_from(node, "data-change", "checked" not in node.attrs)
+        else:
+            self._dispatch_from(node, "data-action")
+        return None
+
+    def _cmd_clearElement(self, params):
+        self.session.set_value(self._node(params).key, "")
+        return None
+
+    def _cmd_sendKeysToElement(self, params):
+        node = self._node(params)
+        text = params["text"]
+        if node.attrs.get("type") == "file":
+            paths = [p for p in text.split("\n") if p]
+            for path in paths:
+                if not os.path.isfile(path):
+                    raise WebDriverError("invalid argument", f"File not found : {path}")
+            if len(paths) > 1 and "multiple" not in node.attrs:
+                raise WebDriverError("invalid argument", "the element can not hold multiple files")
+            self._dispatch_from(node, "data-change", [os.path.basename(p) for p in paths])
+            return None
+
+        typed = "".join(ch for ch in text if not "\ue000" <= ch <= "\ue05d")
+        value = self.session.values.get(node.key, node.attrs.get("value", "")) + typed
+        self.session.set_value(node.key, value)
+        if any(key in text for key in RETURN_KEYS) and node.attrs.get("data-enter"):
+            self._dispatch_from(node, "data-enter", value)
+        elif typed and node.attrs.get("data-input"):
+            self._dispatch_from(node, "data-input", value)
+        return None
+
+    # ----- Scripts
+
+    def _cmd_w3cExecuteScript(self, params):
+        script = params["script"]
+        args = self._unwrap(params.get("args", []))
+        if script.startswith("/* isDisplayed */"):
+            return args[0].is_displayed()
+        if script.startswith("/* getAttribute */"):
+            return _attribute(args[0], args[1], self.session)
+        if script == SETTLE_SCRIPT:
+            return self._settle(args[0])
+        if script == COLUMN_MAP_SCRIPT:
+            return self._column_map(args[0])
+        if script == GRID_SEARCH_SCRIPT:
+            return self._grid_search(*args) if self.site.jqgrid else None
+        if script == GRID_FILTER_SCRIPT:
+            return self._grid_filter(*args) if self.site.jqgrid else False
+        if script == TEILE_INFO_SCRIPT:
+            return self._teile_info(*args)
+        if "arguments[0].checked = true" in script:
+            self._dispatch_from(args[0], "data-change", True)
+            return None
+        if script.strip() == "arguments[0].click();":
+            self._dispatch_from(args[0], "data-action")
+            return None
+        if "localStorage.clear()" in script:
+            return None
+        raise WebDriverError("javascript error", "Script wird vom Fake-Driver nicht unterstützt")
+
+    def _settle(self, element):
+        session = self.session
+        idle = not session.is_blocked() and not session.is_loading()
+        return {"idle": idle, "rect": _rect_list(element) if element is not None else None}
+
+    def _column_map(self, table_id):
+        document = self.session.document()
+        tables = css_select(document, f"#{table_id}")
+        if not tables:
+            return None
+        tbodies = [n for n in tables[0].iter() if n.tag == "tbody"]
+        rows = [n for n in tbodies[0].iter() if n.tag == "tr"] if tbodies else []
+        if len(rows) < 2:
+            return None
+        result = {}
+        for i, td in enumerate(n for n in rows[1].iter() if n.tag == "td"):
+            name = td.attrs.get("aria-describedby")
+            if name is not None and name not in result:
+                result[name] = i
+        return result
+
+    def _grid_search(self, table_id, field, id_field, needle):
+        session = self.session
+        if session.view != "grid" or table_id != f"baymis_{session.table_id()}":
+            return None
+        result = {
+            "page": session.page,
+            "last_page": session.last_page(),
+            "page_size": session.page_size,
+            "row_list": list(self.site.row_list),
+            "records": len(session.filtered_rows()),
+            "all_equal": True,
+            "match": None,
+        }
+        for i, row in enumerate(session.page_rows()):
+            if str(row.get(field)).strip() != needle:
+                result["all_equal"] = False
+            if result["match"] is None and any(needle in str(value) for value in row.values()):
+                result["match"] = {"row": i + 1, "plate": row.get(field), "id": row.get(id_field)}
+        return result
+
+    def _grid_filter(self, table_id, field, needle, toolbar_field=None):
+        session = self.session
+        if session.view != "grid" or table_id != f"baymis_{session.table_id()}":
+            return False
+        records = len(session.filtered_rows())
+        if toolbar_field:
+            session.set_value(f"#{toolbar_field}", needle)
+        if self.site.ignore_grid_filter:
+            # Backend ohne stringResult/multipleSearch: Reload ohne Filter
+            session.dispatch("page", None, "1")
+        else:
+            session.operator = "eq"
+            session.dispatch("filter", field, needle)
+        return {"records": records}
+
+    def _teile_info(self, rows, selectors):
+        def first(row, selector):
+            nodes = css_select(row, selector)
+            return nodes[0] if nodes else None
+
+        def visible_text(node):
+            # wie visibleText() im Script: innerText plus Normalisierung von WebElement.text
+            return selenium_text(node.inner_text())
+
+        def text(row, selector):
+            node = first(row, selector)
+            return visible_text(node) if node is not None else None
+
+        def attr(row, selector, name):
+            node = first(row, selector)
+            return node.attrs.get(name) if node is not None else None
+
+        def checked(row, selector):
+            node = first(row, selector)
+            return "checked" in node.attrs if node is not None else None
+
+        out = []
+        for row in rows:
+            out.append(
+                {
+                    "data_id": row.attrs.get("data-id"),
+                    "data_partid": row.attrs.get("data-partid"),
+                    "data_pnum": row.attrs.get("data-pnum"),
+                    "name": text(row, selectors["name"]),
+                    "part_number": attr(row, selectors["part_nr"], "data-prtnumber"),
+                    "price": text(row, selectors["price"]),
+                    "quantity": text(row, selectors["quantity"]),
+                    "total_price": text(row, selectors["total_price"]),
+                    "bestellt": checked(row, selectors["bestellt"]),
+                    "delivered": checked(row, selectors["delivered"]),
+                    "status": attr(row, selectors["status"], "title"),
+                    "bestelldatum": text(row, selectors["bestelldatum"]),
+                    "project_num": text(row, selectors["project_num"]),
+                }
+            )
+        sums, gesamtpreis = [], None
+        tables = css_select(self.session.document(), selectors["bottom_line"])
+        if tables:
+            trs = css_select(tables[0], selectors["bottom_line_tr"])
+            for tr in trs:
+                tds = css_select(tr, selectors["bottom_line_td"])
+                sums.append(visible_text(tds[1]) if len(tds) > 1 else None)
+            if trs:
+                tds = css_select(trs[-1], selectors["bottom_line_td"])
+                if tds:
+                    gesamtpreis = visible_text(tds[-1])
+        return {"rows": out, "sums": sums, "gesamtpreis": gesamtpreis}
+
+
+def _attribute(node, name, session):
+    """Wie Selenium get_attribute (Property vor Attribut, boolesche Attribute als 'true')."""
+    if name in ("checked", "selected", "multiple", "disabled", "readonly"):
+        return "true" if name in node.attrs else None
+    if name == "value" and node.key in session.values:
+        return session.values[node.key]
+    value = node.attrs.get(name)
+    return None if value is None else str(value)
+
+
+def _rect(node):
+    x, y, width, height, _ = _rect_list(node)
+    return {"x": x, "y": y, "width": width, "height": height}
+
+
+def _rect_list(node):
+    if not node.is_displayed():
+        return [0, 0, 0, 0, False]
+    depth = sum(1 for _ in node.ancestors())
+    index = node.parent.children.index(node) if node.parent is not None else 0
+    return [depth * 10, index * 20, 100, 20, True]
+
+
+class FakeSeleniumClient(SeleniumClient):
+    """
+    SeleniumClient, dessen Driver ein webdriver.Remote mit FakeConnection ist.
+    Alle Methoden von SeleniumClient (Waits, settle, Upload, ...) laufen unverändert.
+    """
+
+    def __init__(self, site, latency=0.0, wait_timeout=30, **options):
+        self.connection = FakeConnection(site, latency)
+        super().__init__(headless=True, **options)
+        if wait_timeout != self._webdriver_wait:
+            self._webdriver_wait = wait_timeout
+            self.driver.set_page_load_timeout(self._webdriver_wait)
+            self.driver.set_script_timeout(self._webdriver_wait)
+            self.wait = WebDriverWait(self.driver, self._webdriver_wait)
+
+    def _start_driver(self, chrome_options):
+        driver = webdriver.Remote(command_executor=self.connection, options=chrome_options)
+        # wie webdriver.Chrome: Dateipfade nicht hochladen, sondern direkt senden
+        driver._is_remote = False
+        return driver
+
+
+class BenchPool:
+    """
+    Minimaler Pool für die Flows (`selenium_pool=`): startet pro acquire einen
+    frischen Client über `factory` und beendet ihn bei release, wie ein Flow
+    ohne Pool. Alle Clients hängen am selben CommandProfiler.
+    """
+
+    def __init__(self, factory, profiler=None):
+        self._factory = factory
+        self.profiler = profiler
+        self.clients = []
+
+    def acquire(self, timeout=None):
+        client = self._factory()
+        if self.profiler is not None:
+            client.enable_profiler(self.profiler)
+        self.clients.append(client)
+        return client
+
+    def release(self, client, discard=False):
+        client.disable_profiler()
+        client.quit()
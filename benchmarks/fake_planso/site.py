@@ -0,0 +1,808 @@
+"""
+Nachbau der PlanSo-Seiten, die config.yaml anspricht: Login, Navigation und
+Schnellzugriff, jqGrid-artige Tabelle (N Zeilen x M Spalten) mit Suchleiste und
+Pager, Upload-Dialog, Detailansicht mit Teile-Tabelle.
+
+Der Zustand liegt in Python (FakePlanSo = Daten, Session = UI-Zustand eines
+Browsers). Dieselbe Session wird
+  - vom FakeConnection-Driver direkt als DOM abgefragt (ohne Chrome) und
+  - vom HTTP-Server als HTML mit etwas Vanilla-JS ausgeliefert (Chrome-Modus).
+Interaktive Elemente tragen data-action (Klick), data-change, data-enter
+(RETURN) oder data-input (Tippen) und lösen Session.dispatch aus.
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from fake_planso.dom import assign_keys, el
+
+DEFAULT_COLUMNS = (
+    "subgrid",
+    "ID",
+    "Kennzeichen",
+    "open_project_details",
+    "Dokumente",
+    "customer_category",
+    "Fahrername",
+    "Fahrzeug",
+    "Termin_vom",
+    "Auftragsnummer",
+)
+# Spalten, die jede Tabelle haben muss (Suche, Upload, Details)
+REQUIRED_COLUMNS = DEFAULT_COLUMNS[:5]
+
+
+class FakePlanSo:
+    """
+    Daten der Fake-Seite, geteilt von allen Sessions.
+
+    :param rows: Anzahl Aufträge (Tabellenzeilen)
+    :param columns: Spaltennamen wie in config.table_fields (ohne Präfix)
+    :param parts: Ersatzteile pro Auftrag (0 = "Keine Ersatzteile bekannt")
+    :param load_time: Sekunden, die die Tabelle nach Seitenwechsel/Filter lädt
+    :param upload_time: Sekunden, die blockUI nach einem Upload sichtbar ist
+    :param notice_time: Sekunden, die eine pnotify-Meldung sichtbar ist
+    :param jqgrid: jqGrid-Datenmodell für GRID_SEARCH/GRID_FILTER_SCRIPT
+        emulieren (nur Fake-Driver; im Chrome-Modus gibt es kein jQuery)
+    :param ignore_grid_filter: GRID_FILTER_SCRIPT lädt das Grid neu, ohne den
+        Filter anzuwenden (Backend wertet postData.filters nicht aus)
+    """
+
+    def __init__(
+        self,
+        rows=100,
+        columns=DEFAULT_COLUMNS,
+        parts=5,
+        table_id="3",
+        orga_table_id="7",
+        table_name="Auftragsliste",
+        orga_list_id="12",
+        page_size=20,
+        row_list=(10, 20, 50, 100),
+        load_time=0.3,
+        upload_time=0.2,
+        notice_time=3.0,
+        jqgrid=False,
+        ignore_grid_filter=False,
+    ):
+        missing = [c for c in REQUIRED_COLUMNS if c not in columns]
+        self.columns = list(missing) + list(columns)
+        self.table_id = table_id
+        self.orga_table_id = orga_table_id
+        self.table_name = table_name
+        self.orga_list_id = orga_list_id
+        self.page_size = page_size
+        self.row_list = list(row_list)
+        self.load_time = load_time
+        self.upload_time = upload_time
+        self.notice_time = notice_time
+        self.jqgrid = jqgrid
+        self.ignore_grid_filter = ignore_grid_filter
+        self.parts = parts
+        self.lock = threading.RLock()
+
+        self.rows = [self._row(i) for i in range(rows)]
+        self.documents = {}  # row id -> [Dateiname]
+        self.checked_parts = set()
+
+    def _row(self, i):
+        row = {}
+        for column in self.columns:
+            if column == "ID":
+                row[column] = str(1000 + i)
+            elif column == "Kennzeichen":
+                row[column] = plate(i)
+            elif column in ("subgrid", "open_project_details", "Dokumente"):
+                row[column] = ""
+            else:
+                row[column] = f"{column[:8]} {i}"
+        return row
+
+    def new_session(self):
+        return Session(self)
+
+    def parts_of(self, row_id):
+        projects = [f"P{row_id}", f"P{row_id}-2"] if self.parts >= 4 else [f"P{row_id}"]
+        result = []
+        for i in range(self.parts):
+            part_id = f"{row_id}{i:03d}"
+            result.append(
+                {
+                    "id": part_id,
+                    "name": f"Teil {i + 1}",
+                    "number": f"TN-{row_id}-{i + 1}",
+                    "price": f"{12 + i},50\xa0€",
+                    "quantity": "1",
+                    "bestellt": i % 2 == 0,
+                    "delivered": i % 3 == 0,
+                    "status": "bestellt" if i % 2 == 0 else "offen",
+                    "date": "01.10.2026",
+                    "project": projects[i % len(projects)],
+                    "checked": part_id in self.checked_parts,
+                }
+            )
+        return result, projects
+
+
+# deep_links für die config.yaml, passend zu Session._deep_link
+DEEP_LINKS = {
+    "table": "app?m=table&table=TABLE_ID",
+    "orga_list": "app?m=orga&list=ORGA_LIST_ID",
+    "details": "app?m=details&id=ORDER_ID",
+    "teile": "app?m=details&id=ORDER_ID&tab=teile",
+}
+
+
+def plate(i):
+    """Eindeutiges Kennzeichen, kein Kennzeichen ist Teilstring eines anderen."""
+    return f"B-PS {i:06d}"
+
+
+class Session:
+    """UI-Zustand eines Browsers (Cookie-Session im Chrome-Modus)."""
+
+    def __init__(self, site: FakePlanSo):
+        self.site = site
+        self.id = uuid.uuid4().hex
+        self.url = "about:blank"
+        self.cookies = {}
+        self.logged_in = False
+        self.values = {}  # data-key eines Inputs -> Wert
+        self._reset_view("blank")
+        self.version = 0
+        self._dom = None
+        self._dom_version = -1
+        self._dom_until = 0.0
+
+    def _reset_view(self, view):
+        self.view = view
+        self.grid = None
+        self.nav_open = False
+        self.schnell_open = False
+        self.page = 1
+        self.page_size = self.site.page_size
+        self.filters = {}
+        self.operator = "bw"
+        self.sopt_open = False
+        self.upload_row = None
+        self.details_row = None
+        self.teile_open = False
+        self.loading_until = 0.0
+        self.blocked_until = 0.0
+        self.notices = []  # (Text, sichtbar bis)
+
+    def _changed(self):
+        self.version += 1
+
+    def set_value(self, key, value):
+        """Wert eines Inputs (per data-key), wie durch Tippen/Leeren gesetzt."""
+        with self.site.lock:
+            self.values[key] = value
+            self._changed()
+
+    # ----- Navigation
+
+    def navigate(self, url):
+        with self.site.lock:
+            self.url = url
+            parsed = urlparse(url)
+            if parsed.scheme not in ("http", "https"):
+                self._reset_view("blank")
+            elif parse_qs(parsed.query).get("m") == ["logout"]:
+                self.logged_in = False
+                self._reset_view("login")
+            elif not self.logged_in:
+                self._reset_view("login")
+            else:
+                self._deep_link(parse_qs(parsed.query))
+            self._changed()
+
+    def _deep_link(self, query):
+        """
+        Direkt adressierbare Ansichten (DEEP_LINKS), alles andere landet auf
+        der Startseite:
+          ?m=table&table=<TABLE_ID>          Tabelle bzw. Orga-Tabelle
+          ?m=orga&list=<ORGA_LIST_ID>        Orga Liste
+          ?m=details&id=<ID>[&tab=teile]     Details eines Auftrags
+        """
+        m = query.get("m", [""])[0]
+        table = query.get("table", [""])[0]
+        if m == "table" and table in (self.site.table_id, self.site.orga_table_id):
+            self._open_grid("table" if table == self.site.table_id else "orga")
+        elif m == "orga" and query.get("list") == [self.site.orga_list_id]:
+            self._open_grid("orga")
+        elif m == "details" and query.get("id"):
+            self._on_details(query["id"][0], None)
+            self.teile_open = query.get("tab") == ["teile"]
+        else:
+            self._reset_view("home")
+
+    # ----- Aktionen
+
+    def dispatch(self, action, target=None, value=None):
+        """Führt eine Benutzeraktion aus. Gibt False zurück, wenn sich die Seite nicht ändert."""
+        with self.site.lock:
+            handler = getattr(self, f"_on_{action}", None)
+            if handler is None:
+                raise ValueError(f"unbekannte Aktion: {action}")
+            rerender = handler(target, value)
+            self._changed()
+            return rerender is not False
+
+    def _load(self):
+        self.loading_until = time.monotonic() + self.site.load_time
+        self.upload_row = None
+        self.sopt_open = False
+
+    def _on_login(self, target, value):
+        if not self.values.get("#system_login_username"):
+            return
+        self.logged_in = True
+        self._reset_view("home")
+
+    def _on_nav(self, target, value):
+        self.nav_open = True
+
+    def _on_schnell(self, target, value):
+        self.schnell_open = True
+
+    def _open_grid(self, grid):
+        self._reset_view("grid")
+        self.grid = grid
+        self._load()
+
+    def _on_open_table(self, target, value):
+        self._open_grid("table")
+
+    def _on_open_orga(self, target, value):
+        self._open_grid("orga")
+
+    def _on_sopt(self, target, value):
+        self.sopt_open = True
+
+    def _on_sopt_select(self, target, value):
+        self.operator = target
+        self.sopt_open = False
+
+    def _on_filter(self, target, value):
+        if value:
+            self.filters[target] = value
+        else:
+            self.filters.pop(target, None)
+        self.page = 1
+        self._load()
+
+    def _on_page(self, target, value):
+        try:
+            page = int(value)
+        except (TypeError, ValueError):
+            return False
+        self.page = max(1, min(page, self.last_page()))
+        self._load()
+
+    def _on_prev(self, target, value):
+        self.page = max(self.page - 1, 1)
+        self._load()
+
+    def _on_next(self, target, value):
+        self.page = min(self.page + 1, self.last_page())
+        self._load()
+
+    def _on_page_size(self, target, value):
+        self.page_size = int(value)
+        self.page = 1
+        self._load()
+
+    def _on_open_upload(self, target, value):
+        self.upload_row = target
+
+    def _on_upload(self, target, value):
+        now = time.monotonic()
+        documents = self.site.documents.setdefault(target, [])
+        self.blocked_until = now + self.site.upload_time
+        until = now + self.site.upload_time + self.site.notice_time
+        self.notices = [(t, u) for t, u in self.notices if u > now]
+        self.notices.append(("Datei wird hochgeladen", until))
+        for name in value:
+            if name in documents:
+                self.notices.append(
+                    (f"Das Bild konnte nicht hochgeladen werden: {name} existiert bereits", until)
+                )
+            else:
+                documents.append(name)
+
+    def _on_close_notice(self, target, value):
+        now = time.monotonic()
+        notices = [(t, u) for t, u in self.notices if u > now]
+        del notices[int(target)]
+        self.notices = notices
+
+    def _on_close_upload(self, target, value):
+        self.upload_row = None
+
+    def _on_details(self, target, value):
+        self._reset_view("details")
+        self.details_row = target
+
+    def _on_teile(self, target, value):
+        self.teile_open = True
+
+    def _on_check_part(self, target, value):
+        if value:
+            self.site.checked_parts.add(target)
+        else:
+            self.site.checked_parts.discard(target)
+        # Checkboxen ändern die Seite nicht, Element-Referenzen bleiben gültig
+        return False
+
+    # ----- Grid-Daten
+
+    def table_id(self):
+        return self.site.orga_table_id if self.grid == "orga" else self.site.table_id
+
+    def filtered_rows(self):
+        rows = self.site.rows
+        for column, needle in self.filters.items():
+            if self.operator == "eq":
+                rows = [r for r in rows if r.get(column) == needle]
+            elif self.operator == "bw":
+                rows = [r for r in rows if r.get(column, "").startswith(needle)]
+            else:
+                rows = [r for r in rows if needle in r.get(column, "")]
+        return rows
+
+    def last_page(self):
+        return max(1, -(-len(self.filtered_rows()) // self.page_size))
+
+    def page_rows(self):
+        start = (self.page - 1) * self.page_size
+        return self.filtered_rows()[start : start + self.page_size]
+
+    def is_loading(self):
+        return time.monotonic() < self.loading_until
+
+    def is_blocked(self):
+        return time.monotonic() < self.blocked_until
+
+    # ----- DOM
+
+    def document(self):
+        """Aktueller DOM; wird nur bei Zustandsänderung oder Ablauf eines Timers neu gebaut."""
+        with self.site.lock:
+            now = time.monotonic()
+            if self._dom is None or self._dom_version != self.version or now >= self._dom_until:
+                self._dom = assign_keys(self._render(now))
+                self._dom_index = {n.key: n for n in self._dom.iter()}
+                self._dom_index[self._dom.key] = self._dom
+                self._dom_version = self.version
+                deadlines = [
+                    t for t in [self.loading_until, self.blocked_until] + [u for _, u in self.notices]
+                    if t > now
+                ]
+                self._dom_until = min(deadlines) if deadlines else float("inf")
+            return self._dom
+
+    def node(self, key):
+        self.document()
+        return self._dom_index.get(key)
+
+    def _input(self, key, attrs, **kwargs):
+        node = el("input", attrs, key=key, **kwargs)
+        node.attrs["value"] = self.values.get(key, attrs.get("value", ""))
+        return node
+
+    def _render(self, now):
+        body = el("body")
+        html = el("html", None, el("head", None, el("title", text="PlanSo")), body)
+        if self.view == "blank":
+            return html
+        if self.view == "login":
+            body.append(
+                el(
+                    "form",
+                    {"id": "loginform", "onsubmit": "return false"},
+                    self._input("#system_login_username", {"id": "system_login_username", "type": "text"}),
+                    self._input("#system_login_password", {"id": "system_login_password", "type": "password"}),
+                    el("button", {"id": "ps_system_login", "type": "button", "data-action": "login"}, text="Anmelden"),
+                )
+            )
+            return html
+
+        body.append(el("div", {"class": "ps_system_preload"}, hidden=True))
+        body.append(el("div", {"id": "popup_overlay"}, hidden=True))
+        body.append(el("div", {"id": "main_left_menu_wrapper"}, hidden=True))
+        body.append(self._render_menu())
+
+        content = el("div", {"id": "content"})
+        body.append(content)
+        if self.view == "grid":
+            content.append(self._render_grid(now))
+        elif self.view == "details":
+            content.append(self._render_details())
+
+        notices = [(t, u) for t, u in self.notices if u > now]
+        if notices:
+            stack = el("div", {"class": "ui-pnotify-stack"})
+            for index, (text, until) in enumerate(notices):
+                stack.append(
+                    el(
+                        "div",
+                        {"class": "ui-pnotify", "data-hide-in": _ms(until - now)},
+                        el("div", {"class": "ui-pnotify-closer", "data-action": "close_notice", "data-target": str(index)}),
+                        el("div", {"class": "ui-pnotify-text"}, text=text),
+                    )
+                )
+            body.append(stack)
+        if self.blocked_until > now:
+            body.append(
+                el("div", {"class": "blockUI", "data-hide-in": _ms(self.blocked_until - now), "data-busy": "1"})
+            )
+        return html
+
+    def _render_menu(self):
+        site = self.site
+        menu = el("div", {"id": "menu"})
+        menu.append(el("h3", {"data-action": "nav"}, text="Navigation"))
+        if self.nav_open:
+            menu.append(
+                el(
+                    "ul",
+                    {"class": "nav_list"},
+                    el("li", None, el("a", {"title": site.table_name, "data-action": "open_table"}, text=site.table_name)),
+                )
+            )
+        menu.append(el("h3", {"data-action": "schnell"}, el("a", {"href": "#"}, text="Schnellzugriff")))
+        if self.schnell_open:
+            menu.append(
+                el(
+                    "div",
+                    {"class": "schnellzugriff"},
+                    el("button", {"data-id": site.orga_list_id, "data-action": "open_orga"}, text="Orga Liste"),
+                )
+            )
+        return menu
+
+    def _render_grid(self, now):
+        site = self.site
+        tid = f"baymis_{self.table_id()}"
+        loading = self.loading_until > now
+        box = el("div", {"id": f"gbox_{tid}", "class": "ui-jqgrid"})
+        box.append(
+            el(
+                "div",
+                {"id": f"load_{tid}", "class": "loading", "data-hide-in": _ms(self.loading_until - now), "data-busy": "1"},
+                text="Lädt...",
+                hidden=not loading,
+            )
+        )
+
+        labels = el("tr", {"class": "ui-jqgrid-labels"})
+        toolbar = el("tr", {"class": "ui-search-toolbar"})
+        for column in site.columns:
+            labels.append(el("th", {"id": f"{tid}_{column}"}, el("div", {"id": f"jqgh_{tid}_{column}"}, text=column)))
+            search = el(
+                "table",
+                {"class": "ui-search-table"},
+                el(
+                    "tbody",
+                    None,
+                    el(
+                    "tr",
+                    None,
+                    el(
+                        "td",
+                        {"class": "ui-search-oper"},
+                        el("a", {"class": "soptclass", "data-action": "sopt", "data-target": column}, text="^"),
+                    ),
+                    el(
+                        "td",
+                        {"class": "ui-search-input"},
+                        self._input(
+                            f"#gs_{column}",
+                            {"id": f"gs_{column}", "type": "text", "data-input": "filter", "data-target": column},
+                        ),
+                    ),
+                    ),
+                ),
+            )
+            toolbar.append(el("th", None, search))
+        box.append(el("table", {"class": "ui-jqgrid-htable"}, el("thead", None, labels, toolbar)))
+
+        tbody = el("tbody")
+        first = el("tr", {"class": "jqgfirstrow"})
+        for _ in site.columns:
+            first.append(el("td"))
+        tbody.append(first)
+        for row in self.page_rows():
+            tr = el("tr", {"id": row["ID"], "class": "jqgrow ui-row-ltr"})
+            for column in site.columns:
+                tr.append(self._render_cell(tid, row, column))
+            tbody.append(tr)
+        box.append(el("table", {"id": tid, "class": "ui-jqgrid-btable"}, tbody))
+
+        if self.sopt_open:
+            box.append(
+                el(
+                    "ul",
+                    {"id": "sopt_menu", "class": "ui-search-menu"},
+                    *[
+                        el("li", None, el("a", {"value": op, "data-action": "sopt_select", "data-target": op}, text=label))
+                        for op, label in (("eq", "gleich"), ("bw", "beginnt mit"), ("cn", "enthält"))
+                    ],
+                )
+            )
+
+        selbox = el("select", {"class": "ui-pg-selbox", "data-change": "page_size"})
+        for size in site.row_list:
+            option = el("option", {"value": str(size)}, text=str(size))
+            if size == self.page_size:
+                option.attrs["selected"] = True
+            selbox.append(option)
+        pager_input = self._input(f"#pg_input_{tid}", {"class": "ui-pg-input", "type": "text", "data-enter": "page"})
+        pager_input.attrs["value"] = str(self.page)
+        box.append(
+            el(
+                "div",
+                {"id": f"p{tid}", "class": "ui-jqgrid-pager"},
+                el(
+                    "table",
+                    {"class": "ui-pg-table"},
+                    el(
+                        "tbody",
+                        None,
+                        el(
+                            "tr",
+                            None,
+                            el("td", {"id": f"prev_p{tid}", "data-action": "prev"}, text="<"),
+                            el("td", None, pager_input),
+                            el("td", None, el("span", {"id": f"sp_1_p{tid}"}, text=str(self.last_page()))),
+                            el("td", {"id": f"next_p{tid}", "data-action": "next"}, text=">"),
+                            el("td", None, selbox),
+                        ),
+                    ),
+                ),
+            )
+        )
+        return box
+
+    def _render_cell(self, tid, row, column):
+        cell = el("td", {"role": "gridcell", "aria-describedby": f"{tid}_{column}"})
+        row_id = row["ID"]
+        if column == "open_project_details":
+            cell.append(
+                el("button", {"data-action": "details", "data-target": row_id}, el("span", None, text="Details"))
+            )
+        elif column == "Dokumente":
+            documents = self.site.documents.get(row_id, [])
+            cell.attrs.update({"data-action": "open_upload", "data-target": row_id})
+            cell.text = f"{len(documents)} Dokumente"
+            if self.upload_row == row_id:
+                cell.append(
+                    el(
+                        "div",
+                        {"class": "upload_dialog"},
+                        el("input", {"type": "file", "multiple": True, "data-change": "upload", "data-target": row_id}),
+                        el(
+                            "ul",
+                            {"id": "images_sortable"},
+                            *(el("li", {"class": "images_draggable"}, text=name) for name in documents),
+                        ),
+                        el(
+                            "button",
+                            {"type": "button", "data-action": "close_upload"},
+                            el("span", {"class": "fa fa-times-circle"}),
+                            el("span", None, text="Schließen"),
+                        ),
+                    )
+                )
+        else:
+            cell.text = row.get(column, "")
+        return cell
+
+    def _render_details(self):
+        site = self.site
+        details = el("div", {"id": "project_details", "data-id": self.details_row})
+        details.append(
+            el(
+                "ul",
+                {"class": "nav nav-tabs"},
+                el("li", {"aria-controls": "psrs_overview"}, el("a", {"href": "#"}, text="Übersicht")),
+                el("li", {"aria-controls": "psrs_parts"}, el("a", {"href": "#", "data-action": "teile"}, text="Teile")),
+            )
+        )
+        panel = el("div", {"id": "psrs_parts"}, hidden=not self.teile_open)
+        details.append(panel)
+        parts, projects = site.parts_of(self.details_row)
+        if not parts:
+            panel.append(el("p", None, text="Keine Ersatzteile bekannt"))
+            return details
+
+        tbody = el("tbody")
+        for part in parts:
+            checkbox = el(
+                "input",
+                {
+                    "type": "checkbox",
+                    "class": "price_checked spare_part_status",
+                    "data-change": "check_part",
+                    "data-target": part["id"],
+                },
+            )
+            if part["checked"]:
+                checkbox.attrs["checked"] = True
+            tbody.append(
+                el(
+                    "tr",
+                    {"class": "parts_single_row", "data-id": part["id"], "data-partid": part["id"], "data-pnum": part["number"]},
+                    el("td", {"class": "for_parts_edit"}, text=part["name"]),
+                    el("td", {"class": "teile_nr_fields", "data-prtnumber": part["number"]}, text=part["number"]),
+                    el("td", None, el("span", {"class": "rsp_price_for_parts"}, text=part["price"])),
+                    el("td", None, el("span", {"class": "rsp_menge_for_parts"}, text=part["quantity"])),
+                    el("td", {"class": "rsp_parts_total_price"}, text=part["price"]),
+                    el("td", None, _checkbox("bestellt", part["bestellt"])),
+                    el("td", None, _checkbox("delivered", part["delivered"])),
+                    el("td", {"class": "spare_part_main_status"}, el("i", {"title": part["status"]})),
+                    el("td", None, el("span", {"class": "rsvgp_bestelldate_td"}, text=part["date"])),
+                    el("td", {"class": "parts_project_num_td"}, text=part["project"]),
+                    el("td", None, checkbox),
+                )
+            )
+        panel.append(el("table", {"class": "parts_table"}, tbody))
+
+        sums = el("tbody")
+        for project in projects:
+            sums.append(el("tr", None, el("td", None, text=f"Ersatzteile {project}"), el("td", None, text="123,45\xa0€")))
+        sums.append(el("tr", None, el("td", None, text="Gesamt"), el("td", None, text=f"{123.45 * len(projects):.2f}\xa0€")))
+        panel.append(el("table", {"class": "table table-striped table-bordered"}, sums))
+        return details
+
+    def html(self):
+        """(ganze Seite, nur Body-Inhalt) für den Chrome-Modus."""
+        with self.site.lock:
+            document = self.document()
+            body = document.children[1]
+            return "<!doctype html>" + document.to_html().replace(
+                "</head>", f"<script>{PAGE_SCRIPT}</script></head>", 1
+            ), "".join(c.to_html() for c in body.children)
+
+
+def _checkbox(cls, checked):
+    node = el("input", {"type": "checkbox", "class": cls})
+    if checked:
+        node.attrs["checked"] = True
+    return node
+
+
+def _ms(seconds):
+    return str(max(0, int(seconds * 1000)))
+
+
+# Im Chrome-Modus: Aktionen an den Server schicken und den Body ersetzen
+# (wie ein Ajax-Reload). Sichtbarkeits-Timer (data-hide-in) und ein minimales
+# window.jQuery.active für settle() werden im Browser nachgebildet.
+PAGE_SCRIPT = """
+(function () {
+  window.jQuery = {active: 0};
+  function arm() {
+    document.querySelectorAll('[data-hide-in]').forEach(function (el) {
+      var ms = parseInt(el.getAttribute('data-hide-in'), 10);
+      el.removeAttribute('data-hide-in');
+      if (el.style.display === 'none') { return; }
+      var busy = el.hasAttribute('data-busy');
+      if (busy) { window.jQuery.active++; }
+      setTimeout(function () {
+        el.style.display = 'none';
+        if (busy) { window.jQuery.active--; }
+      }, ms);
+    });
+  }
+  function values() {
+    var v = {};
+    document.querySelectorAll('input[data-key]').forEach(function (el) {
+      if (el.type !== 'file' && el.type !== 'checkbox') { v[el.getAttribute('data-key')] = el.value; }
+    });
+    return v;
+  }
+  function send(el, action, value) {
+    window.jQuery.active++;
+    fetch('/action', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({action: action, target: el.getAttribute('data-target'), value: value, values: values()})
+    }).then(function (r) { return r.json(); }).then(function (data) {
+      if (data.body !== null) { document.body.innerHTML = data.body; arm(); }
+    }).finally(function () { window.jQuery.active--; });
+  }
+  document.addEventListener('click', function (e) {
+    var el = e.target.closest('[data-action]');
+    if (el) { e.preventDefault(); send(el, el.getAttribute('data-action'), null); }
+  });
+  document.addEventListener('change', function (e) {
+    var el = e.target, action = el.getAttribute('data-change');
+    if (!action) { return; }
+    var value = el.value;
+    if (el.type === 'file') { value = Array.prototype.map.call(el.files, function (f) { return f.name; }); }
+    if (el.type === 'checkbox') { value = el.checked; }
+    send(el, action, value);
+  });
+  document.addEventListener('keydown', function (e) {
+    var el = e.target, action = el.getAttribute && el.getAttribute('data-enter');
+    if (action && e.key === 'Enter') { e.preventDefault(); send(el, action, el.value); }
+  });
+  var timer = null;
+  document.addEventListener('keyup', function (e) {
+    var el = e.target, action = el.getAttribute && el.getAttribute('data-input');
+    if (!action || e.key === 'Enter') { return; }
+    if (timer === null) { window.jQuery.active++; } else { clearTimeout(timer); }
+    timer = setTimeout(function () { timer = null; send(el, action, el.value); window.jQuery.active--; }, 200);
+  });
+  document.addEventListener('DOMContentLoaded', arm);
+})();
+"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    site = None
+    sessions = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _session(self):
+        cookie = self.headers.get("Cookie", "")
+        sid = dict(
+            part.strip().split("=", 1) for part in cookie.split(";") if "=" in part
+        ).get("PLANSO_SID")
+        session = self.sessions.get(sid)
+        if session is None:
+            session = self.site.new_session()
+            self.sessions[session.id] = session
+        return session
+
+    def _send(self, session, status, content_type, payload):
+        data = payload.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Set-Cookie", f"PLANSO_SID={session.id}; Path=/")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        session = self._session()
+        if self.path.startswith("/favicon"):
+            self._send(session, 404, "text/plain", "")
+            return
+        session.navigate(f"http://{self.headers.get('Host', 'localhost')}{self.path}")
+        page, _ = session.html()
+        self._send(session, 200, "text/html; charset=utf-8", page)
+
+    def do_POST(self):
+        session = self._session()
+        if self.path != "/action":
+            self._send(session, 404, "text/plain", "")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length) or b"{}")
+        with self.site.lock:
+            session.values.update(data.get("values") or {})
+            changed = session.dispatch(data["action"], data.get("target"), data.get("value"))
+            body = session.html()[1] if changed else None
+        self._send(session, 200, "application/json", json.dumps({"body": body}))
+
+
+def serve(site: FakePlanSo, host="127.0.0.1", port=0):
+    """
+    Startet den HTTP-Server für den Chrome-Modus in einem Hintergrund-Thread.
+
+    :return: (server, base_url); beenden mit server.shutdown()
+    """
+    handler = type("Handler", (_Handler,), {"site": site, "sessions": {}})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/"
@@ -16,5 +16,9 @@ setup(
         "requests>=2.32.2",
         "pyyaml>=6.0.2"
     ],
+    extras_require={
+        # optional: AsyncRequestClient
+        "async": ["aiohttp>=3.9"],
+    },
     python_requires=">=3.12",    # Mindestversion von Python
 )
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# fake_planso (Nachbau von PlanSo + WebDriver) liegt unter benchmarks/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from web_scraper_operations.planso_scraper import download_files_from_links
+
+
+class _PlanSoStub(BaseHTTPRequestHandler):
+    """Login unter /x.de/app, Dateien unter /x.de/do?id=<n>; id=missing -> 404."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        file_id = parse_qs(urlsplit(self.path).query).get("id", [""])[0]
+        if file_id == "missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = f"datei {file_id}".encode() * 1000
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PlanSoStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/x.de"
+    server.shutdown()
+    server.server_close()
+
+
+def _links(base_url):
+    # gleiche Endung '/do' für alle, ein doppelter Link, ein 404
+    return [
+        f"{base_url}/do?m=file&id=1",
+        f"{base_url}/do?m=file&id=2",
+        f"{base_url}/do?m=file&id=1",
+        f"{base_url}/do?m=file&id=missing",
+        f"{base_url}/do?m=file&id=3",
+    ]
+
+
+def _check(results, links):
+    assert [r["link"] for r in results] == links
+    assert [r["ok"] for r in results] == [True, True, True, False, True]
+    assert [r["status_code"] for r in results] == [200, 200, 200, 404, 200]
+
+    paths = [r["path"] for r in results if r["ok"]]
+    assert len(set(paths)) == len(paths)
+    for result in results:
+        if result["ok"]:
+            file_id = parse_qs(urlsplit(result["link"]).query)["id"][0]
+            with open(result["path"], "rb") as f:
+                assert f.read() == f"datei {file_id}".encode() * 1000
+
+
+def test_download_files_from_links_unique_paths(base_url, tmp_path):
+    links = _links(base_url)
+    results = download_files_from_links("u", "p", links, max_workers=4, target_dir=tmp_path)
+    _check(results, links)
+
+
+def test_download_files_from_links_names(base_url, tmp_path):
+    links = _links(base_url)[:3]
+    results = download_files_from_links(
+        "u", "p", links, target_dir=tmp_path, names=["a.pdf", "a.pdf", "b.pdf"]
+    )
+    assert [r["path"] for r in results] == [
+        str(tmp_path / "0000_a.pdf"),
+        str(tmp_path / "0001_a.pdf"),
+        str(tmp_path / "0002_b.pdf"),
+    ]
+
+
+def test_download_files_from_links_content(base_url):
+    links = _links(base_url)
+    results = download_files_from_links("u", "p", links, max_workers=4)
+    assert [r["status_code"] for r in results] == [200, 200, 200, 404, 200]
+    assert results[2]["content"] == results[0]["content"] == b"datei 1" * 1000
+
+
+def test_async_download_files_from_links_unique_paths(base_url, tmp_path):
+    pytest.importorskip("aiohttp")
+    from web_scraper_operations.async_request_client import async_download_files_from_links
+
+    links = _links(base_url)
+    results = asyncio.run(
+        async_download_files_from_links("u", "p", links, max_concurrency=4, target_dir=tmp_path)
+    )
+    _check(results, links)
@@ -0,0 +1,65 @@
+import pytest
+
+from fake_planso.driver import BenchPool, FakeSeleniumClient
+from fake_planso.site import FakePlanSo, plate
+from web_scraper_operations.command_profiler import CommandProfiler
+from web_scraper_operations.planso_scraper import PlanSoMain
+
+
+@pytest.fixture
+def open_table():
+    planso_instances = []
+
+    def factory(**site_options):
+        site = FakePlanSo(rows=120, jqgrid=True, load_time=0.01, upload_time=0.01, **site_options)
+        pool = BenchPool(lambda: FakeSeleniumClient(site, latency=0), CommandProfiler())
+        planso = PlanSoMain(
+            username="u",
+            password="p",
+            table=site.table_id,
+            table_name=site.table_name,
+            base_url="http://planso.fake/",
+            selenium_pool=pool,
+        )
+        planso_instances.append(planso)
+        planso.open_base_url()
+        planso.login()
+        planso.goto_table()
+        return planso
+
+    yield factory
+    for planso in planso_instances:
+        planso.logout()
+
+
+@pytest.mark.parametrize("ignore_grid_filter", [False, True])
+def test_search_finds_row_on_later_page(open_table, ignore_grid_filter):
+    planso = open_table(ignore_grid_filter=ignore_grid_filter)
+    row_info = planso.find_element_with_search("Kennzeichen", plate(100))
+    assert row_info is not None
+    assert row_info["plate"] == plate(100)
+
+
+def test_search_miss_with_applied_filter(open_table):
+    planso = open_table()
+    assert planso._find_element_with_grid_filter("Kennzeichen", "X-XX 999999") is None
+
+
+def test_unapplied_filter_is_not_a_miss(open_table):
+    planso = open_table(ignore_grid_filter=True)
+    # ungefilterte Seite 1: kein Beweis, dass die Zeile fehlt -> Suchleiste
+    assert planso._find_element_with_grid_filter("Kennzeichen", plate(100)) is False
+
+
+def test_grid_search_restores_page_size(open_table):
+    planso = open_table()
+    page_size = planso.get_page_size()
+    row_info = planso.find_element("Kennzeichen", plate(100))
+    assert planso.get_page_size() == page_size
+    assert row_info["page_size"] == page_size
+    assert row_info["page"] == 100 // page_size + 1
+    rows = planso._selenium_client.find_elements(
+        planso._config.selenium.rows_of_table.locator_strategie,
+        planso._config.selenium.rows_of_table.selector,
+    )
+    assert plate(100) in rows[row_info["Zeile"]].text
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# wie benchmarks/bench_import_time.py; auf langsamen CI-Runnern per Umgebung anheben
+BUDGET_MS = float(os.environ.get("PLANSO_IMPORT_BUDGET_MS", "50"))
+HEAVY = ("selenium", "requests", "yaml", "aiohttp")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import(module):
+    """Importiert `module` in einem frischen Interpreter: (Zeit in ms, geladene schwere Module)."""
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        check=True,
+    )
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative = int(parts[1]) / 1000
+    assert cumulative is not None, f"keine importtime-Zeile für {module}"
+    return cumulative, [m for m in proc.stdout.strip().split(",") if m]
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["web_scraper_operations.planso_flows", "web_scraper_operations.planso_scraper"],
+)
+def test_import_is_lazy_and_within_budget(module):
+    runs = [_import(module) for _ in range(3)]
+    for _, heavy in runs:
+        assert heavy == [], f"{module} lädt eager: {', '.join(heavy)}"
+    best = min(ms for ms, _ in runs)
+    assert best <= BUDGET_MS, f"{module}: {best:.1f} ms > {BUDGET_MS} ms"
@@ -0,0 +1,28 @@
+import pytest
+
+from web_scraper_operations import instrumentation
+from web_scraper_operations.instrumentation import attach, timed_flow
+
+
+@timed_flow
+def _flow():
+    attach("network", {"requests": 3, "bytes_loaded": 1024, "blocked": 1, "blocked_by_type": {}})
+    return {"message": "ok"}
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_attach_adds_to_flow_result(enabled):
+    previous = instrumentation.is_enabled()
+    instrumentation.set_enabled(enabled)
+    try:
+        result = _flow()
+    finally:
+        instrumentation.set_enabled(previous)
+    assert result["message"] == "ok"
+    assert result["network"]["bytes_loaded"] == 1024
+    assert ("timings" in result) is enabled
+
+
+def test_attach_outside_flow_is_ignored():
+    attach("network", {})
+    assert _flow()["network"]["requests"] == 3
@@ -0,0 +1,78 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from web_scraper_operations.request_client import RequestClient, RetryPolicy
+
+
+class _FlakyStub(BaseHTTPRequestHandler):
+    """Antwortet mit dem Status aus dem Pfad, z.B. /503 oder /429?after=120."""
+
+    calls = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self):
+        type(self).calls += 1
+        path, _, query = self.path.partition("?")
+        self.send_response(int(path.strip("/")))
+        if query.startswith("after="):
+            self.send_header("Retry-After", query.split("=", 1)[1])
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond()
+
+
+@pytest.fixture
+def base_url():
+    _FlakyStub.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client():
+    return RequestClient(retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.01, jitter=0))
+
+
+def test_get_is_retried(base_url):
+    client = _client()
+    assert not client.request_get(f"{base_url}/503")
+    assert client.get_metrics()["attempts"] == 3
+
+
+def test_post_is_not_retried_by_default(base_url):
+    client = _client()
+    assert not client.request_post(f"{base_url}/503", headers=None, payload={"a": 1})
+    assert client.get_metrics()["attempts"] == 1
+
+
+def test_post_retried_on_opt_in(base_url):
+    client = _client()
+    assert not client.request_post(f"{base_url}/503", headers=None, payload={"a": 1}, retry=True)
+    assert client.get_metrics()["attempts"] == 3
+
+
+def test_retry_after_beyond_budget_stops(base_url):
+    client = RequestClient(retry_policy=RetryPolicy(backoff_max=1, budget=5))
+    assert not client.request_get(f"{base_url}/429?after=120")
+    assert client.get_metrics()["attempts"] == 1
+    assert client.get_metrics()["backoff_time"] == 0
+
+
+def test_retry_after_not_clamped():
+    class Response:
+        status_code = 503
+        headers = {"Retry-After": "45"}
+
+    assert RetryPolicy(backoff_max=30).backoff(1, Response()) == 45
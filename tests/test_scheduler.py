@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from web_scraper_operations.scheduler import DONE, EXPIRED, FlowScheduler, QueueFullError
+
+
+def _blocker():
+    """Flow, der läuft, bis das Event gesetzt wird."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def flow(**kwargs):
+        started.set()
+        release.wait(5)
+        return "blocker"
+
+    return flow, started, release
+
+
+def _record(log, name):
+    def flow(**kwargs):
+        log.append(name)
+        return name
+
+    flow.__name__ = name
+    return flow
+
+
+@pytest.fixture
+def scheduler_factory():
+    schedulers = []
+
+    def factory(**kwargs):
+        scheduler = FlowScheduler(**kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield factory
+    for scheduler in schedulers:
+        scheduler.shutdown()
+
+
+def test_queue_bound(scheduler_factory):
+    scheduler = scheduler_factory(workers=1, max_queue=2)
+    blocker, started, release = _blocker()
+    scheduler.submit(blocker, username="a")
+    assert started.wait(2)
+
+    scheduler.submit(_record([], "one"), username="a")
+    scheduler.submit(_record([], "two"), username="a")
+    with pytest.raises(QueueFullError):
+        scheduler.submit(_record([], "three"), username="a")
+    assert scheduler.stats()["rejected"] == 1
+    release.set()
+
+
+def test_priority(scheduler_factory):
+    scheduler = scheduler_factory(workers=1)
+    blocker, started, release = _blocker()
+    scheduler.submit(blocker, username="a")
+    assert started.wait(2)
+
+    log = []
+    low = scheduler.submit(_record(log, "low"), priority=0, username="a")
+    high = scheduler.submit(_record(log, "high"), priority=5, username="a")
+    release.set()
+    scheduler.wait(low, timeout=5)
+    scheduler.wait(high, timeout=5)
+    assert log == ["high", "low"]
+
+
+def test_deadline(scheduler_factory):
+    scheduler = scheduler_factory(workers=1)
+    blocker, started, release = _blocker()
+    scheduler.submit(blocker, username="a")
+    assert started.wait(2)
+
+    log = []
+    job_id = scheduler.submit(_record(log, "late"), deadline=0.1, username="a")
+    time.sleep(0.2)
+    release.set()
+    with pytest.raises(TimeoutError):
+        scheduler.wait(job_id, timeout=5)
+    assert scheduler.poll(job_id)["state"] == EXPIRED
+    assert log == []
+    assert scheduler.stats()[EXPIRED] == 1
+
+
+def test_per_account_limit(scheduler_factory):
+    scheduler = scheduler_factory(workers=3, per_account_limit=1)
+    blocker, started, release = _blocker()
+    scheduler.submit(blocker, username="a")
+    assert started.wait(2)
+
+    log = []
+    same = scheduler.submit(_record(log, "same_account"), username="a")
+    other = scheduler.submit(_record(log, "other_account"), username="b")
+    assert scheduler.wait(other, timeout=5) == "other_account"
+    # freie Worker, aber Account "a" ist belegt
+    time.sleep(0.2)
+    assert scheduler.poll(same)["state"] == "queued"
+    assert scheduler.stats()["accounts_running"] == {"jvg/a": 1}
+
+    release.set()
+    assert scheduler.wait(same, timeout=5) == "same_account"
+
+
+def test_finished_jobs_are_pruned_by_history(scheduler_factory):
+    scheduler = scheduler_factory(workers=1, history=2)
+    job_ids = []
+    for i in range(3):
+        job_ids.append(scheduler.submit(_record([], f"job{i}"), username="a"))
+        scheduler.wait(job_ids[-1], timeout=5)
+
+    with pytest.raises(KeyError):
+        scheduler.poll(job_ids[0])
+    assert [scheduler.poll(job_id)["state"] for job_id in job_ids[1:]] == [DONE, DONE]
+
+
+def test_finished_jobs_are_pruned_by_ttl(scheduler_factory):
+    scheduler = scheduler_factory(workers=1, result_ttl=0.1)
+    first = scheduler.submit(_record([], "first"), username="a")
+    scheduler.wait(first, timeout=5)
+    assert scheduler.poll(first)["state"] == DONE
+
+    time.sleep(0.2)
+    second = scheduler.submit(_record([], "second"), username="a")
+    with pytest.raises(KeyError):
+        scheduler.poll(first)
+    scheduler.wait(second, timeout=5)
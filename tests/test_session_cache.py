@@ -0,0 +1,39 @@
+import os
+
+from web_scraper_operations.session_cache import SessionCache
+
+KEY = ("jvg", "https://jvgpremium.planso.de", "user")
+COOKIES = [{"name": "PHPSESSID", "value": "abc"}]
+
+
+def test_same_credentials_hit(tmp_path):
+    cache = SessionCache(cache_dir=str(tmp_path))
+    cache.set(*KEY, "secret", COOKIES)
+    assert cache.get(*KEY, "secret") == COOKIES
+
+
+def test_different_password_misses(tmp_path):
+    cache = SessionCache(cache_dir=str(tmp_path))
+    cache.set(*KEY, "secret", COOKIES)
+    assert cache.get(*KEY, "wrong") is None
+    # der Eintrag des richtigen Passworts bleibt unberührt
+    assert cache.get(*KEY, "secret") == COOKIES
+
+
+def test_file_name_does_not_contain_plain_key(tmp_path):
+    cache = SessionCache(cache_dir=str(tmp_path))
+    cache.set(*KEY, "secret", COOKIES)
+    (name,) = os.listdir(tmp_path)
+    assert "secret" not in name and "user" not in name
+
+
+def test_evict_and_ttl(tmp_path):
+    cache = SessionCache(cache_dir=str(tmp_path), ttl=-1)
+    cache.set(*KEY, "secret", COOKIES)
+    assert cache.get(*KEY, "secret") is None
+    assert os.listdir(tmp_path) == []
+
+    cache = SessionCache(cache_dir=str(tmp_path))
+    cache.set(*KEY, "secret", COOKIES)
+    cache.evict(*KEY, "secret")
+    assert cache.get(*KEY, "secret") is None
@@ -0,0 +1,41 @@
+from fake_planso.driver import BenchPool, FakeSeleniumClient
+from fake_planso.site import FakePlanSo, plate
+from web_scraper_operations.command_profiler import CommandProfiler
+from web_scraper_operations.planso_scraper import PlanSoMain
+
+
+def open_teile(site):
+    pool = BenchPool(lambda: FakeSeleniumClient(site, latency=0), CommandProfiler())
+    planso = PlanSoMain(
+        username="u",
+        password="p",
+        table=site.orga_table_id,
+        orga_list_id=site.orga_list_id,
+        base_url="http://planso.fake/",
+        selenium_pool=pool,
+    )
+    planso.open_base_url()
+    planso.login()
+    planso.goto_orga_list()
+    planso.open_order_teile(planso.find_element_with_search("Kennzeichen", plate(7)))
+    return planso
+
+
+def test_script_and_element_path_read_the_same_parts():
+    site = FakePlanSo(rows=20, parts=5, load_time=0.01, upload_time=0.01)
+    planso = open_teile(site)
+    try:
+        teile_elements = planso._config.selenium.teile_elements
+        rows = planso._selenium_client.find_elements(
+            teile_elements.locator_strategie, teile_elements.selector
+        )
+        assert rows
+        by_script = planso._get_teile_info_script(rows)
+        by_elements = planso._get_teile_info_elements(rows)
+    finally:
+        planso.logout()
+
+    assert by_script == by_elements
+    # Preise stehen mit geschütztem Leerzeichen in der Seite, wie in PlanSo
+    assert by_script[0]["price"] == "12,50 €"
+    assert by_script[-1] == {"gesamtpreis": "246.90 €"}
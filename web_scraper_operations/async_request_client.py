@@ -0,0 +1,246 @@
+import asyncio
+import logging
+import time
+
+from web_scraper_operations.request_client import RetryPolicy, download_path, handle_response
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """Gelesene Antwort mit derselben Schnittstelle wie requests.Response."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+
+class _FileSink:
+    """Schreibt Blöcke in eine Datei; reset() beginnt bei einem Retry von vorn."""
+
+    def __init__(self, f):
+        self._f = f
+        self.bytes = 0
+
+    def reset(self):
+        self._f.seek(0)
+        self._f.truncate()
+        self.bytes = 0
+
+    def write(self, chunk):
+        self._f.write(chunk)
+        self.bytes += len(chunk)
+
+
+class AsyncRequestClient:
+    """
+    asyncio-Variante von RequestClient auf Basis von aiohttp (optional:
+    pip install web_scraper_operations[async]).
+
+    Alle Requests teilen sich einen Connection-Pool; `max_concurrency` begrenzt
+    die gleichzeitig laufenden Requests. Muss innerhalb eines Event-Loops
+    benutzt und mit `await client.close()` (oder `async with`) beendet werden.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 100,
+        max_concurrency: int = 100,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        retry_policy: RetryPolicy = None,
+    ):
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "AsyncRequestClient benötigt aiohttp (pip install aiohttp)"
+            ) from e
+
+        logger.info(f"AsyncRequestClient gestartet")
+        self._aiohttp = aiohttp
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=pool_size),
+            timeout=aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._response = None
+        self._metrics = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        await self._session.close()
+
+    async def request_post(self, url, headers, payload, retry: bool = None):
+        """Mit `retry=True` wird der POST wiederholt wie ein GET (nur wenn idempotent!)."""
+        logger.info(f"request_post")
+        self._response = await self._send("POST", url, retry=retry, data=payload, headers=headers)
+        return self._handle_response()
+
+    async def request_get(self, url: str):
+        logger.info(f"request_get")
+        self._response = await self._send("GET", url)
+        return self._handle_response()
+
+    def get_response(self):
+        logger.info(f"get_response")
+        return self._response
+
+    def get_metrics(self):
+        """Metriken des letzten Aufrufs: attempts und backoff_time."""
+        return dict(self._metrics)
+
+    def _handle_response(self):
+        return handle_response(self._response)
+
+    async def _send(self, method, url, **kwargs):
+        response, metrics = await self._request(method, url, **kwargs)
+        self._metrics = metrics
+        return response
+
+    async def _request(self, method, url, sink=None, chunk_size=64 * 1024, retry=None, **kwargs):
+        """
+        Führt einen Request mit RetryPolicy aus. Mit `sink` (_FileSink) wird
+        der Body blockweise weitergereicht statt gepuffert.
+        Gibt (AsyncResponse, metrics) zurück; ohne gemeinsamen Zustand, damit
+        parallele Aufrufe sich nicht gegenseitig überschreiben.
+        """
+        aiohttp = self._aiohttp
+        policy = self._retry_policy
+        retryable = policy.retries_method(method, retry)
+        start = time.monotonic()
+        attempts = 0
+        backoff_time = 0.0
+
+        while True:
+            attempts += 1
+            error = None
+            response = None
+            try:
+                async with self._semaphore:
+                    async with self._session.request(method, url, **kwargs) as r:
+                        content = b""
+                        if sink is not None and r.status == 200:
+                            sink.reset()
+                            async for chunk in r.content.iter_chunked(chunk_size):
+                                sink.write(chunk)
+                        else:
+                            content = await r.read()
+                        response = AsyncResponse(r.status, r.headers, content)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+
+            failed = error is not None or policy.should_retry(response.status_code)
+            if not failed or not retryable or attempts >= policy.max_attempts:
+                break
+            delay = policy.backoff(attempts, response)
+            if time.monotonic() - start + delay > policy.budget:
+                logger.warning("Retry-Budget von %.1fs erschöpft", policy.budget)
+                break
+            logger.warning(
+                "Versuch %d fehlgeschlagen (%s), nächster Versuch in %.2fs",
+                attempts,
+                error if error is not None else response.status_code,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            backoff_time += delay
+
+        metrics = {"attempts": attempts, "backoff_time": backoff_time}
+        if error is not None:
+            raise error
+        return response, metrics
+
+    async def download(self, url, target=None, chunk_size=64 * 1024):
+        """
+        Lädt `url` herunter. Ohne `target` wird der Inhalt zurückgegeben, mit
+        `target` (Pfad) wird blockweise in die Datei geschrieben.
+
+        :return: {"link", "ok", "status_code", "bytes", "content" | "path", "error"}
+        """
+        result = {"link": url, "ok": False, "status_code": None, "bytes": 0, "error": None}
+        try:
+            if target is None:
+                response, _ = await self._request("GET", url)
+                result["status_code"] = response.status_code
+                if response.status_code == 200:
+                    result.update(ok=True, content=response.content, bytes=len(response.content))
+            else:
+                with open(target, "wb") as f:
+                    sink = _FileSink(f)
+                    response, _ = await self._request(
+                        "GET", url, sink=sink, chunk_size=chunk_size
+                    )
+                result["status_code"] = response.status_code
+                if response.status_code == 200:
+                    result.update(ok=True, path=target, bytes=sink.bytes)
+            if not result["ok"]:
+                logger.info("Download fehlgeschlagen: '%s'", result["status_code"])
+        except Exception as e:
+            logger.warning("Download von '%s' fehlgeschlagen: %s", url, e)
+            result["error"] = str(e)
+        return result
+
+    async def download_many(self, links, target_dir=None, chunk_size=64 * 1024, names=None):
+        """
+        Lädt alle Links nebenläufig (begrenzt durch max_concurrency). Zielpfade
+        wie bei request_client.download_path, `names` optional pro Link.
+        """
+
+        def target(index, link):
+            if target_dir is None:
+                return None
+            return download_path(target_dir, link, index, names[index] if names else None)
+
+        return await asyncio.gather(
+            *(self.download(link, target(i, link), chunk_size) for i, link in enumerate(links))
+        )
+
+
+async def async_download_files_from_links(
+    user_name, password, links, max_concurrency=50, target_dir=None, names=None
+):
+    """
+    Async-Gegenstück zu planso_scraper.download_files_from_links: ein Login pro
+    Base-URL, danach alle Downloads nebenläufig über einen gemeinsamen Pool.
+    """
+    groups = {}
+    for index, link in enumerate(links):
+        groups.setdefault(link.split(".de")[0], []).append(index)
+
+    results = [None] * len(links)
+    for base, indices in groups.items():
+        async with AsyncRequestClient(
+            pool_size=max_concurrency, max_concurrency=max_concurrency
+        ) as client:
+            payload = {
+                "system_login_username": user_name,
+                "system_login_password": password,
+                "user_lat": "",
+                "user_lng": "",
+                "user_accuracy": "",
+            }
+            if await client.request_post(base + ".de/app", headers=None, payload=payload):
+                logger.info("login bei '%s' erfolgreich", base + ".de/app")
+
+            def target(index):
+                if target_dir is None:
+                    return None
+                return download_path(
+                    target_dir, links[index], index, names[index] if names else None
+                )
+
+            group_results = await asyncio.gather(
+                *(client.download(links[i], target(i)) for i in indices)
+            )
+            for index, result in zip(indices, group_results):
+                results[index] = result
+    return results
@@ -0,0 +1,127 @@
+import logging
+import sys
+import threading
+import time
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+# Aufrufer werden in diesem Modul gesucht (PlanSoMain-Methoden)
+CALLER_MODULE = "planso_scraper.py"
+
+
+def _caller():
+    """Name der innersten PlanSoMain-Methode im Stack, sonst '<extern>'."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.endswith(CALLER_MODULE):
+            return getattr(code, "co_qualname", code.co_name)
+        frame = frame.f_back
+    return "<extern>"
+
+
+class CommandProfiler:
+    """
+    Zählt WebDriver-Kommandos (= chromedriver Round Trips) nach Typ und
+    aufrufender PlanSoMain-Methode und misst ihre Latenz. Wird über
+    `attach(driver)` in `driver.command_executor.execute` eingehängt.
+
+    Beispiel:
+        profiler = client.enable_profiler()
+        ...
+        logger.info(profiler.report())
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._attached = []
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.total = 0
+            self.total_time = 0.0
+            self._by_command = {}
+            self._by_caller = {}
+            self._by_pair = {}
+
+    def attach(self, driver):
+        executor = driver.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                self.record(command, _caller(), time.perf_counter() - start)
+
+        executor.execute = execute
+        self._attached.append((executor, original))
+
+    def detach(self):
+        while self._attached:
+            executor, original = self._attached.pop()
+            executor.execute = original
+
+    def record(self, command, caller, seconds):
+        with self._lock:
+            self.total += 1
+            self.total_time += seconds
+            for stats, key in (
+                (self._by_command, command),
+                (self._by_caller, caller),
+                (self._by_pair, (caller, command)),
+            ):
+                entry = stats.get(key)
+                if entry is None:
+                    stats[key] = [1, seconds, seconds]
+                else:
+                    entry[0] += 1
+                    entry[1] += seconds
+                    entry[2] = max(entry[2], seconds)
+
+    @staticmethod
+    def _ranked(stats):
+        return sorted(stats.items(), key=lambda item: (-item[1][0], -item[1][1]))
+
+    def as_dict(self):
+        def rows(stats):
+            return [
+                {
+                    "name": name if isinstance(name, str) else " / ".join(name),
+                    "count": count,
+                    "total": round(total, 4),
+                    "avg_ms": round(total / count * 1000, 2),
+                    "max_ms": round(peak * 1000, 2),
+                }
+                for name, (count, total, peak) in self._ranked(stats)
+            ]
+
+        with self._lock:
+            return {
+                "commands": self.total,
+                "time": round(self.total_time, 4),
+                "by_command": rows(self._by_command),
+                "by_caller": rows(self._by_caller),
+                "by_caller_command": rows(self._by_pair),
+            }
+
+    def report(self, top: int = 15) -> str:
+        """Rangliste als Text (meiste Kommandos zuerst)."""
+        data = self.as_dict()
+        lines = [f"WebDriver-Kommandos: {data['commands']} in {data['time']:.3f}s"]
+        for title, key in (
+            ("nach Kommando", "by_command"),
+            ("nach PlanSoMain-Methode", "by_caller"),
+            ("nach Methode / Kommando", "by_caller_command"),
+        ):
+            lines.append(f"-- {title}")
+            lines.append(f"{'anzahl':>8}{'summe [s]':>11}{'avg [ms]':>10}{'max [ms]':>10}  name")
+            for row in data[key][:top]:
+                lines.append(
+                    f"{row['count']:8d}{row['total']:11.3f}{row['avg_ms']:10.2f}"
+                    f"{row['max_ms']:10.2f}  {row['name']}"
+                )
+        return "\n".join(lines)
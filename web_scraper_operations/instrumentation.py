@@ -0,0 +1,255 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+# Abschalten mit PLANSO_INSTRUMENTATION=0 oder set_enabled(False)
+_enabled = os.environ.get("PLANSO_INSTRUMENTATION", "1") != "0"
+
+# Obergrenzen der Histogramm-Buckets in Sekunden
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+METRIC_NAME = "planso_span_duration_seconds"
+
+_local = threading.local()
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class Histogram:
+    """Kumuliertes Histogramm einer Span-Dauer (Prometheus-kompatibel)."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.sum += seconds
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": {str(bound): n for bound, n in self.cumulative()},
+        }
+
+
+class Registry:
+    """Sammelt Histogramme pro Span-Name, threadsicher."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def to_json(self) -> str:
+        with self._lock:
+            data = {name: h.as_dict() for name, h in sorted(self._histograms.items())}
+        return json.dumps(data)
+
+    def to_prometheus(self) -> str:
+        lines = [
+            f"# HELP {METRIC_NAME} Dauer instrumentierter PlanSo-Schritte",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for name, h in sorted(self._histograms.items()):
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                for bound, total in h.cumulative():
+                    lines.append(f'{METRIC_NAME}_bucket{{span="{label}",le="{bound}"}} {total}')
+                lines.append(f'{METRIC_NAME}_bucket{{span="{label}",le="+Inf"}} {h.count}')
+                lines.append(f'{METRIC_NAME}_sum{{span="{label}"}} {h.sum:.6f}')
+                lines.append(f'{METRIC_NAME}_count{{span="{label}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class Recorder:
+    """Zeitaufschlüsselung eines einzelnen Flow-Aufrufs (pro Thread)."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.spans = {}
+        # zusätzliche Ergebnisse des Flows (siehe attach)
+        self.extras = {}
+
+    def add(self, name, seconds):
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def as_dict(self):
+        return {
+            "total": round(time.perf_counter() - self.start, 3),
+            "spans": {
+                name: {"count": count, "total": round(total, 3)}
+                for name, (count, total) in self.spans.items()
+            },
+        }
+
+
+class span:
+    """
+    Misst die Dauer eines Schritts; als Context-Manager oder Decorator:
+
+        with span("PlanSoMain.login"):
+            ...
+
+        @span("download")
+        def download(...): ...
+    """
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = None
+
+    def __enter__(self):
+        if _enabled:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self._start is not None:
+            _record(self.name, time.perf_counter() - self._start)
+            self._start = None
+        return False
+
+    def __call__(self, func):
+        return _wrap(func, self.name)
+
+
+def _record(name, seconds):
+    REGISTRY.observe(name, seconds)
+    recorder = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.add(name, seconds)
+
+
+def attach(key: str, value):
+    """
+    Hängt `value` unter `key` an das Ergebnis des laufenden Flows (timed_flow)
+    an, z.B. den Network-Report des Browsers. Außerhalb eines Flows ohne Wirkung.
+    """
+    recorder = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.extras[key] = value
+
+
+def _wrap(func, name):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def instrument(cls=None, *, include=None):
+    """
+    Klassen-Decorator: umschließt öffentliche Methoden mit einem Span
+    "<Klasse>.<Methode>". `include(name)` kann die Auswahl einschränken.
+    """
+
+    def decorate(cls):
+        for name, attr in list(vars(cls).items()):
+            if name.startswith("_") or not callable(attr):
+                continue
+            if include is not None and not include(name):
+                continue
+            setattr(cls, name, _wrap(attr, f"{cls.__name__}.{name}"))
+        return cls
+
+    return decorate(cls) if cls is not None else decorate
+
+
+@contextmanager
+def recording():
+    """Sammelt alle Spans des aktuellen Threads für eine Zeitaufschlüsselung."""
+    previous = getattr(_local, "recorder", None)
+    recorder = Recorder()
+    _local.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _local.recorder = previous
+
+
+def timed_flow(func):
+    """
+    Decorator für Flows: misst den gesamten Flow und hängt bei dict-Ergebnissen
+    die Aufschlüsselung unter "timings" an, dazu alles, was per attach()
+    angehängt wurde.
+    """
+    name = f"flow.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with recording() as recorder:
+            result = func(*args, **kwargs)
+        if isinstance(result, dict):
+            result.update(recorder.extras)
+        if not _enabled:
+            return result
+        _record(name, time.perf_counter() - recorder.start)
+        timings = recorder.as_dict()
+        if isinstance(result, dict):
+            result["timings"] = timings
+        return result
+
+    return wrapper
+
+
+def export_prometheus() -> str:
+    return REGISTRY.to_prometheus()
+
+
+def export_json() -> str:
+    return REGISTRY.to_json()
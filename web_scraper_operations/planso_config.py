@@ -0,0 +1,167 @@
+import logging
+import os
+import threading
+from functools import lru_cache
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+# Platzhalter, die pro PlanSoMain-Instanz ersetzt werden
+PLACEHOLDERS = ("TABLE_ID", "TABLE_NAME", "ORGA_LIST_ID")
+# Platzhalter, der pro Aufruf (Suchspalte) ersetzt wird
+FIELD_PLACEHOLDER = "SEARCH_FIELD_STRING"
+# Platzhalter für die Auftrags-ID in deep_links
+ORDER_PLACEHOLDER = "ORDER_ID"
+
+# (path, mtime, client) -> kompilierte Vorlage
+_CONFIG_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+class _Template(str):
+    """String mit mindestens einem Platzhalter aus PLACEHOLDERS."""
+
+    __slots__ = ()
+
+
+def _compile(value):
+    """
+    Wandelt den YAML-Baum einmalig in eine Vorlage um: Strings mit Platzhaltern
+    werden markiert, damit ConfigView nur diese beim Zugriff ersetzen muss.
+    """
+    if isinstance(value, dict):
+        return {k: _compile(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_compile(v) for v in value]
+    if isinstance(value, str) and any(p in value for p in PLACEHOLDERS):
+        return _Template(value)
+    return value
+
+
+def _render(template, replacements):
+    for placeholder, replace in replacements:
+        template = template.replace(placeholder, replace)
+    return str(template)
+
+
+@lru_cache(maxsize=1024)
+def render_selector(template: str, field_name: str) -> str:
+    """
+    Setzt `field_name` für FIELD_PLACEHOLDER in eine Selector-Vorlage ein.
+    Die Vorlage in der Konfiguration bleibt unverändert.
+    """
+    return template.replace(FIELD_PLACEHOLDER, field_name)
+
+
+class ConfigView:
+    """
+    Sicht einer PlanSoMain-Instanz auf die geteilte Vorlage. Platzhalter werden
+    erst beim ersten Zugriff auf einen Wert ersetzt und danach gemerkt.
+    Zuweisungen (z.B. Login-Daten) landen nur in dieser Sicht, die geteilte
+    Vorlage bleibt unverändert.
+    """
+
+    def __init__(self, node, replacements):
+        self.__dict__["_node"] = node
+        self.__dict__["_replacements"] = replacements
+
+    def __getattr__(self, name):
+        try:
+            value = self._node[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = self._resolve(value)
+        self.__dict__[name] = value
+        return value
+
+    def _resolve(self, value):
+        if isinstance(value, dict):
+            return ConfigView(value, self._replacements)
+        if isinstance(value, list):
+            return [self._resolve(v) for v in value]
+        if isinstance(value, _Template):
+            return _render(value, self._replacements)
+        return value
+
+    def __repr__(self):
+        return f"ConfigView({sorted(self._node)})"
+
+
+def _load_template(path: str, client: str):
+    mtime = os.stat(path).st_mtime_ns
+    key = (path, mtime, client)
+    template = _CONFIG_CACHE.get(key)
+    if template is not None:
+        return template
+    with _CACHE_LOCK:
+        template = _CONFIG_CACHE.get(key)
+        if template is None:
+            # yaml erst beim ersten Laden importieren
+            import yaml
+
+            logger.debug("Lade Konfigurationsdatei: %s", path)
+            with open(path, "r") as f:
+                data = yaml.safe_load(f)
+            # veraltete Einträge (ältere mtime) derselben Datei verwerfen
+            for old_key in [k for k in _CONFIG_CACHE if k[0] == path and k[1] != mtime]:
+                del _CONFIG_CACHE[old_key]
+            for name, client_config in data.items():
+                _CONFIG_CACHE[(path, mtime, name)] = _compile(client_config)
+            template = _CONFIG_CACHE[key]
+    return template
+
+
+def load_config(path: str, client: str, **replacements) -> ConfigView:
+    """
+    Gibt die Konfiguration von `client` aus `path` zurück. Die YAML-Datei wird
+    pro (path, mtime) nur einmal geparst und vorkompiliert.
+
+    :param replacements: Werte für die Platzhalter, z.B. TABLE_ID="123"
+    """
+    template = _load_template(os.path.abspath(path), client)
+    return ConfigView(
+        template, tuple((p, replacements.get(p, "")) for p in PLACEHOLDERS)
+    )
+
+
+def browser_options(config) -> dict:
+    """
+    Liest den optionalen Abschnitt `browser` einer Konfiguration als Keyword-
+    Argumente für SeleniumClient (bzw. `client_options` des SeleniumClientPool).
+    Ohne Abschnitt bleibt es bei den Defaults von SeleniumClient.
+    """
+    browser = getattr(config, "browser", None)
+    if browser is None:
+        return {}
+    options = {}
+    page_load_strategy = getattr(browser, "page_load_strategy", None)
+    if page_load_strategy:
+        options["page_load_strategy"] = page_load_strategy
+    policy = getattr(browser, "resource_policy", None)
+    if policy is not None:
+        options["resource_policy"] = {
+            "block_types": list(getattr(policy, "block_types", None) or []),
+            "block_urls": list(getattr(policy, "block_urls", None) or []),
+            "report": bool(getattr(policy, "report", False)),
+        }
+    launch = getattr(browser, "launch", None)
+    if launch is not None:
+        options["launch"] = {
+            "profile": getattr(launch, "profile", None) or "default",
+            "window_size": getattr(launch, "window_size", None) or "",
+            "v8_heap_mb": getattr(launch, "v8_heap_mb", None) or 0,
+        }
+    driver = getattr(browser, "driver", None)
+    if driver is not None:
+        options["shared_service"] = bool(getattr(driver, "shared_service", False))
+        options["chromedriver_path"] = getattr(driver, "chromedriver_path", None) or ""
+        options["chrome_binary"] = getattr(driver, "chrome_binary", None) or ""
+    template = getattr(browser, "profile_template", None)
+    if template is not None and getattr(template, "enabled", False):
+        options["profile_template"] = {
+            "dir": template.dir,
+            # ohne eigene Liste reicht die Login-Seite (ohne Anmeldung erreichbar)
+            "warm_urls": list(getattr(template, "warm_urls", None) or [config.login_url]),
+            "max_age": getattr(template, "max_age", 86400),
+        }
+    return options
@@ -1,13 +1,14 @@
-import os
 import logging
 import time
 
+from web_scraper_operations.instrumentation import timed_flow
 from web_scraper_operations.planso_scraper import PlanSoMain
 
 # Logging-Konfiguration (wird extern in app.py gesetzt)
 logger = logging.getLogger(__name__)
 
 
+@timed_flow
 def planso_upload_flow(
     field_name: str,
     search_field_name: str,
@@ -20,7 +21,9 @@ def planso_upload_flow(
     base_url: str = None,
     config: str = None,
     client: str = "jvg",
-    headless_mode:bool = True
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None
 ):
     """
     Vollständiger Ablauf für den Datei-Upload: Login, Navigation, Dateiupload, Logout.
@@ -35,15 +38,15 @@ def planso_upload_flow(
         base_url=base_url,
         config=config,
         client=client,
-        headless_mode=headless_mode
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
         )
 
     try:
         planso.open_base_url()
         planso.login()
-        planso.open_navigation()
-        planso.open_table()
-        time.sleep(1)
+        planso.goto_table()
 
         logger.debug("Suche Zielzeile für den Upload...")
         # self.set_page_size(self._page_size)
@@ -71,8 +74,8 @@ def planso_upload_flow(
             planso.logout()
         except Exception:
             logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")
-        time.sleep(0.3)
     
+@timed_flow
 def planso_bulk_upload(
     field_name: str,
     search_field_name: str,
@@ -85,7 +88,9 @@ def planso_bulk_upload(
     base_url: str = None,
     config: str = None,
     client: str = "jvg",
-    headless_mode:bool = True
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None
 ):
     """
     Vollständiger Ablauf für den Datei-Upload: Login, Navigation, Dateiupload, Logout.
@@ -100,15 +105,15 @@ def planso_bulk_upload(
         base_url=base_url,
         config=config,
         client=client,
-        headless_mode=headless_mode
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
         )
 
     try:
         planso.open_base_url()
         planso.login()
-        planso.open_navigation()
-        planso.open_table()
-        time.sleep(1)
+        planso.goto_table()
 
         logger.debug("Suche Zielzeile für den Upload...")
 
@@ -118,13 +123,9 @@ def planso_bulk_upload(
 
         if row_info:
             logger.info("Starte Bulk-Upload...")
-            file_status = {}
-            for file_path in path_list:
-                status = planso.upload_file(file_path, row_info, field_name)
-                file_status[os.path.basename(file_path)] = status
-                logger.info("'%s' return of status '%s'", os.path.basename(file_path), status)
-                time.sleep(1)
-            logger.debug("Schließe Upload-Dialog...")
+            # alle Dateien über einen Upload-Dialog
+            file_status = planso.upload_files(path_list, row_info, field_name)
+            logger.info("return of status '%s'", file_status)
         else:
             file_status = f"{search_string} ist nicht im Feld {search_field_name}"
         return {"message": file_status}
@@ -136,8 +137,8 @@ def planso_bulk_upload(
             planso.logout()
         except Exception:
             logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")
-        time.sleep(0.3)
 
+@timed_flow
 def planso_invoice_positions_flow(
     search_field_name: str,
     search_string: str,
@@ -148,10 +149,14 @@ def planso_invoice_positions_flow(
     base_url: str = None,
     config: str = None,
     client: str = "jvg",
-    headless_mode:bool = True
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None,
+    order_id: str = None
 ):
     """
     Vollständiger Ablauf zum auslesen von Ersatzteil Positionen bezogen auf ein Nummernschild
+    order_id: ID des Auftrags, falls bekannt; mit deep_links entfällt dann die Suche
     """
     logger.info("Starte Invoice Flow")
 
@@ -163,20 +168,20 @@ def planso_invoice_positions_flow(
         base_url=base_url,
         config=config,
         client=client,
-        headless_mode=headless_mode
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
         )
     try:
         planso.open_base_url()
         planso.login()
-        planso.open_schnellzugriff()
-        planso.open_orga_list()
-        time.sleep(1)
-        logger.debug("Suche Zielzeile für Details...")
-        row_info = planso.find_element_with_search(search_field_name, search_string)
-        logger.debug("row found: '%s'", row_info)
-
-        planso.open_details(row_nr=row_info["Zeile"])
-        planso.open_teile()
+        # Mit bekannter Auftrags-ID (und deep_links) ohne Suche direkt zu den Teilen
+        if not (order_id and planso.open_order_direct(order_id)):
+            planso.goto_orga_list()
+            logger.debug("Suche Zielzeile für Details...")
+            row_info = planso.find_element_with_search(search_field_name, search_string)
+            logger.debug("row found: '%s'", row_info)
+            planso.open_order_teile(row_info)
         teile_info = planso.get_teile_info()  # inkl. Gesamtpreis
         return {"parts": teile_info}
     except Exception as e:
@@ -187,8 +192,8 @@ def planso_invoice_positions_flow(
             planso.logout()
         except Exception:
             logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")
-        time.sleep(0.3)
 
+@timed_flow
 def planso_spareparts_ok(
     search_field_name: str,
     search_string: str,
@@ -200,10 +205,14 @@ def planso_spareparts_ok(
     base_url: str = None,
     config: str = None,
     client: str = "jvg",
-    headless_mode:bool = True):
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None,
+    order_id: str = None):
     """
     if positions string is '', all positions get checked
     positions = "Positin1;posisiton2" Semilcolon separated
+    order_id: ID des Auftrags, falls bekannt; mit deep_links entfällt dann die Suche
 
     """
     logger.info("Starte planso_spareparts_ok Flow")
@@ -216,19 +225,20 @@ def planso_spareparts_ok(
         base_url=base_url,
         config=config,
         client=client,
-        headless_mode=headless_mode
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
         )
     try:
         planso.open_base_url()
         planso.login()
-        planso.open_schnellzugriff()
-        planso.open_orga_list()
-        time.sleep(1)
-        logger.debug("Suche Zielzeile für Details...")
-        row_info = planso.find_element_with_search(search_field_name, search_string)
-        logger.debug("row found: '%s'", row_info)
-        planso.open_details(row_nr=row_info["Zeile"])
-        planso.open_teile()
+        # Mit bekannter Auftrags-ID (und deep_links) ohne Suche direkt zu den Teilen
+        if not (order_id and planso.open_order_direct(order_id)):
+            planso.goto_orga_list()
+            logger.debug("Suche Zielzeile für Details...")
+            row_info = planso.find_element_with_search(search_field_name, search_string)
+            logger.debug("row found: '%s'", row_info)
+            planso.open_order_teile(row_info)
 
         # check boxes
         result = planso.check_sparepart_boxes(positions=positions)
@@ -241,9 +251,9 @@ def planso_spareparts_ok(
             planso.logout()
         except Exception:
             logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")#
-        time.sleep(0.3)
     
 
+@timed_flow
 def planso_trash_documents(
     field_name: str,
     search_field_name: str,
@@ -255,7 +265,9 @@ def planso_trash_documents(
     base_url: str = None,
     config: str = None,
     client: str = "jvg",
-    headless_mode:bool = True
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None
     ):
     """
     Vollständiger Ablauf zum löschen der Dokumente
@@ -270,14 +282,14 @@ def planso_trash_documents(
         base_url=base_url,
         config=config,
         client=client,
-        headless_mode=headless_mode
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
         )
     try:
         planso.open_base_url()
         planso.login()
-        planso.open_navigation()
-        planso.open_table()
-        time.sleep(1)
+        planso.goto_table()
 
         logger.debug("Suche Zielzeile für den Upload...")
 
@@ -296,4 +308,191 @@ def planso_trash_documents(
             planso.logout()
         except Exception:
             logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")#
-        time.sleep(0.3)
\ No newline at end of file
+
+def _run_batch(jobs, run_job):
+    """
+    Führt `run_job(search_string, payload)` für jeden Job aus. Ein fehlerhafter
+    Job bricht den Batch nicht ab; pro Job werden Ergebnis und Dauer geliefert.
+    """
+    results = []
+    for search_string, payload in jobs:
+        start = time.perf_counter()
+        entry = {"search_string": search_string}
+        try:
+            entry["result"] = run_job(search_string, payload)
+        except Exception:
+            logger.exception("Job '%s' fehlgeschlagen", search_string)
+            entry["error"] = f"Job '{search_string}' fehlgeschlagen"
+        entry["duration"] = round(time.perf_counter() - start, 3)
+        results.append(entry)
+    return results
+
+
+@timed_flow
+def planso_upload_batch_flow(
+    field_name: str,
+    search_field_name: str,
+    jobs: list[tuple[str, str | list[str]]],
+    username: str,
+    password: str,
+    table: str,
+    table_name: str,
+    base_url: str = None,
+    config: str = None,
+    client: str = "jvg",
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None
+):
+    """
+    Upload für viele Zeilen mit einem Login.
+    jobs = [(search_string, path | [path, ...]), ...]
+    """
+    logger.info("Starte Upload-Batch mit %d Jobs", len(jobs))
+
+    planso = PlanSoMain(
+        username=username, 
+        password=password, 
+        table=table, 
+        table_name=table_name,
+        base_url=base_url,
+        config=config,
+        client=client,
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
+        )
+
+    def run_job(search_string, paths):
+        if isinstance(paths, str):
+            paths = [paths]
+        planso.ensure_table_open()
+        row_info = planso.find_element_with_search(search_field_name, search_string)
+        logger.debug("row found: '%s'", row_info)
+        if not row_info:
+            return f"{search_string} ist nicht im Feld {search_field_name}"
+        return planso.upload_files(paths, row_info, field_name)
+
+    try:
+        planso.open_base_url()
+        planso.login()
+        planso.goto_table()
+        return {"jobs": _run_batch(jobs, run_job)}
+    except Exception as e:
+        logger.exception("Error im planso_upload_batch_flow")
+        return {"error": "Error im planso_upload_batch_flow"}
+    finally:
+        try:
+            planso.logout()
+        except Exception:
+            logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")
+
+
+@timed_flow
+def planso_invoice_positions_batch_flow(
+    search_field_name: str,
+    jobs: list[tuple[str, object]],
+    username: str,
+    password: str,
+    table: str ='',
+    orga_list_id: str = '',
+    base_url: str = None,
+    config: str = None,
+    client: str = "jvg",
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None
+):
+    """
+    Ersatzteil Positionen für viele Nummernschilder mit einem Login.
+    jobs = [(search_string, None), ...] (payload wird nicht benötigt)
+    """
+    logger.info("Starte Invoice-Batch mit %d Jobs", len(jobs))
+
+    planso = PlanSoMain(
+        username=username, 
+        password=password, 
+        table=table, 
+        orga_list_id=orga_list_id,
+        base_url=base_url,
+        config=config,
+        client=client,
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
+        )
+
+    def run_job(search_string, _payload):
+        planso.ensure_orga_list_open()
+        row_info = planso.find_element_with_search(search_field_name, search_string)
+        logger.debug("row found: '%s'", row_info)
+        planso.open_order_teile(row_info)
+        return {"parts": planso.get_teile_info()}
+
+    try:
+        planso.open_base_url()
+        planso.login()
+        return {"jobs": _run_batch(jobs, run_job)}
+    except Exception as e:
+        logger.exception("Error im planso_invoice_positions_batch_flow")
+        return {"Error": "Error im planso_invoice_positions_batch_flow"}
+    finally:
+        try:
+            planso.logout()
+        except Exception:
+            logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")
+
+
+@timed_flow
+def planso_spareparts_ok_batch_flow(
+    search_field_name: str,
+    jobs: list[tuple[str, str]],
+    username: str,
+    password: str,
+    table: str ='',
+    orga_list_id: str = '',
+    base_url: str = None,
+    config: str = None,
+    client: str = "jvg",
+    headless_mode:bool = True,
+    selenium_pool=None,
+    session_cache=None
+):
+    """
+    Ersatzteil check boxen für viele Nummernschilder mit einem Login.
+    jobs = [(search_string, positions), ...], positions wie bei planso_spareparts_ok
+    """
+    logger.info("Starte planso_spareparts_ok Batch mit %d Jobs", len(jobs))
+
+    planso = PlanSoMain(
+        username=username, 
+        password=password, 
+        table=table, 
+        orga_list_id=orga_list_id,
+        base_url=base_url,
+        config=config,
+        client=client,
+        headless_mode=headless_mode,
+        selenium_pool=selenium_pool,
+        session_cache=session_cache,
+        )
+
+    def run_job(search_string, positions):
+        planso.ensure_orga_list_open()
+        row_info = planso.find_element_with_search(search_field_name, search_string)
+        logger.debug("row found: '%s'", row_info)
+        planso.open_order_teile(row_info)
+        return {"parts": planso.check_sparepart_boxes(positions=positions or "")}
+
+    try:
+        planso.open_base_url()
+        planso.login()
+        return {"jobs": _run_batch(jobs, run_job)}
+    except Exception as e:
+        logger.exception("Error im planso_spareparts_ok_batch_flow")
+        return {"Error": "Error im planso_spareparts_ok_batch_flow"}
+    finally:
+        try:
+            planso.logout()
+        except Exception:
+            logger.warning("Logout fehlgeschlagen oder planso nicht initialisiert")
@@ -1,15 +1,151 @@
 import os
 from urllib.parse import urljoin
 import logging
-import time
-from types import SimpleNamespace
-import yaml
 
-from web_scraper_operations.selenium_client import SeleniumClient
+from web_scraper_operations.instrumentation import attach, instrument, span
+from web_scraper_operations.planso_config import ORDER_PLACEHOLDER, browser_options, load_config, render_selector
 
 # Logging-Konfiguration (wird extern in app.py gesetzt)
 logger = logging.getLogger(__name__)
 
+# Spalten-Index Cache: (client, table_id) -> {aria-describedby: index}
+_COLUMN_MAP_CACHE = {}
+
+# Baut aus der ersten Datenzeile der Tabelle arguments[0] die Zuordnung
+# aria-describedby -> Spaltenindex (wie td-Index in find_elements(TAG, "td")).
+COLUMN_MAP_SCRIPT = """
+var table = document.getElementById(arguments[0]);
+if (!table) { return null; }
+var rows = table.getElementsByTagName('tbody')[0];
+rows = rows ? rows.getElementsByTagName('tr') : [];
+if (rows.length < 2) { return null; }
+var tds = rows[1].getElementsByTagName('td');
+var map = {};
+for (var i = 0; i < tds.length; i++) {
+    var id = tds[i].getAttribute('aria-describedby');
+    if (id !== null && !(id in map)) { map[id] = i; }
+}
+return map;
+"""
+
+# Durchsucht die aktuelle Seite eines jqGrid über dessen Datenmodell
+# (getDataIDs/getRowData) statt über die DOM-Zeilen. Gibt null zurück, wenn
+# die Tabelle kein jqGrid ist.
+# arguments: table_id, Spaltenname Suchfeld, Spaltenname ID, Suchbegriff
+GRID_SEARCH_SCRIPT = """
+var $ = window.jQuery;
+if (!$ || !$.fn || !$.fn.jqGrid) { return null; }
+var grid = $('#' + arguments[0]);
+if (!grid.length || !grid[0].grid) { return null; }
+var field = arguments[1], idField = arguments[2], needle = arguments[3];
+var result = {
+    page: parseInt(grid.jqGrid('getGridParam', 'page'), 10) || 1,
+    last_page: parseInt(grid.jqGrid('getGridParam', 'lastpage'), 10) || 1,
+    page_size: parseInt(grid.jqGrid('getGridParam', 'rowNum'), 10),
+    row_list: grid.jqGrid('getGridParam', 'rowList') || [],
+    records: parseInt(grid.jqGrid('getGridParam', 'records'), 10) || 0,
+    all_equal: true,
+    match: null
+};
+var ids = grid.jqGrid('getDataIDs');
+for (var i = 0; i < ids.length; i++) {
+    var data = grid.jqGrid('getRowData', ids[i]);
+    if (String(data[field]).trim() !== needle) { result.all_equal = false; }
+    if (result.match) { continue; }
+    var hit = false;
+    for (var key in data) {
+        if (String(data[key]).indexOf(needle) !== -1) { hit = true; break; }
+    }
+    if (hit) {
+        var tr = grid[0].rows.namedItem(ids[i]);
+        result.match = {
+            row: tr ? Array.prototype.indexOf.call(tr.parentNode.rows, tr) : i + 1,
+            plate: data[field] === undefined ? null : String(data[field]),
+            id: data[idField] === undefined ? null : String(data[idField])
+        };
+    }
+}
+return result;
+"""
+
+# Setzt einen "ist gleich"-Filter auf eine Spalte und lädt das Grid einmal neu.
+# arguments: table_id, Spaltenname, Suchbegriff, id des Suchleisten-Feldes (optional)
+# Gibt die Anzahl Datensätze vor dem Filter zurück ({records}) oder false.
+GRID_FILTER_SCRIPT = """
+var $ = window.jQuery;
+if (!$ || !$.fn || !$.fn.jqGrid) { return false; }
+var grid = $('#' + arguments[0]);
+if (!grid.length || !grid[0].grid) { return false; }
+var records = parseInt(grid.jqGrid('getGridParam', 'records'), 10) || 0;
+var filters = {groupOp: 'AND', rules: [{field: arguments[1], op: 'eq', data: arguments[2]}]};
+if (arguments[3]) { $(document.getElementById(arguments[3])).val(arguments[2]); }
+grid.jqGrid('setGridParam', {search: true, page: 1, postData: {filters: JSON.stringify(filters)}});
+grid.trigger('reloadGrid', [{page: 1}]);
+return {records: records};
+"""
+
+# Liest alle Teile-Zeilen (arguments[0]) und die Summen-Tabelle in einem Aufruf.
+# arguments[1] enthält die css-Selektoren aus config.teile_tabelle.
+# Wie WebElement.text liefern nicht dargestellte Elemente (keine Layout-Box,
+# visibility:hidden, opacity:0 an sich oder einem Vorfahren) "" statt ihres
+# Textinhalts wie innerText.
+TEILE_INFO_SCRIPT = """
+var rows = arguments[0], sel = arguments[1];
+function shown(el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') { return false; }
+    for (var e = el; e && e.nodeType === 1; e = e.parentElement) {
+        if (window.getComputedStyle(e).opacity === '0') { return false; }
+    }
+    return true;
+}
+// wie WebElement.text: geschützte Leerzeichen als normale, jede Zeile getrimmt
+function visibleText(el) {
+    if (!shown(el)) { return ''; }
+    var lines = el.innerText.replace(/\\u00a0/g, ' ').split('\\n');
+    for (var k = 0; k < lines.length; k++) { lines[k] = lines[k].trim(); }
+    return lines.join('\\n').trim();
+}
+function q(row, s) { return row.querySelector(s); }
+function text(row, s) { var el = q(row, s); return el ? visibleText(el) : null; }
+function attr(row, s, name) { var el = q(row, s); return el ? el.getAttribute(name) : null; }
+function checked(row, s) { var el = q(row, s); return el ? el.checked === true : null; }
+var out = [];
+for (var i = 0; i < rows.length; i++) {
+    var r = rows[i];
+    out.push({
+        data_id: r.getAttribute('data-id'),
+        data_partid: r.getAttribute('data-partid'),
+        data_pnum: r.getAttribute('data-pnum'),
+        name: text(r, sel.name),
+        part_number: attr(r, sel.part_nr, 'data-prtnumber'),
+        price: text(r, sel.price),
+        quantity: text(r, sel.quantity),
+        total_price: text(r, sel.total_price),
+        bestellt: checked(r, sel.bestellt),
+        delivered: checked(r, sel.delivered),
+        status: attr(r, sel.status, 'title'),
+        bestelldatum: text(r, sel.bestelldatum),
+        project_num: text(r, sel.project_num)
+    });
+}
+var sums = [], gesamtpreis = null;
+var table = document.querySelector(sel.bottom_line);
+if (table) {
+    var trs = table.querySelectorAll(sel.bottom_line_tr);
+    for (var j = 0; j < trs.length; j++) {
+        var tds = trs[j].querySelectorAll(sel.bottom_line_td);
+        sums.push(tds.length > 1 ? visibleText(tds[1]) : null);
+    }
+    if (trs.length) {
+        var lastTds = trs[trs.length - 1].querySelectorAll(sel.bottom_line_td);
+        if (lastTds.length) { gesamtpreis = visibleText(lastTds[lastTds.length - 1]); }
+    }
+}
+return {rows: out, sums: sums, gesamtpreis: gesamtpreis};
+"""
+
 
 def download_files_from_link(user_name, password, path_link):
     import requests
@@ -42,10 +178,338 @@ def download_files_from_link(user_name, password, path_link):
             logger.info("Download fehlgeschlagen: '%s'", r.status_code)
 
 
+class DownloadSizeExceeded(Exception):
+    """Die Datei ist größer als das erlaubte max_bytes."""
+
+
+def _login_session(user_name, password, path_link, pool_size=None):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    login_url = path_link.split(".de")[0] + ".de/app"
+    payload = {
+        "system_login_username": user_name,
+        "system_login_password": password,
+        "user_lat": "",
+        "user_lng": "",
+        "user_accuracy": "",
+    }
+    session = requests.Session()
+    if pool_size:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    r = session.post(login_url, data=payload)
+    if r.status_code == 200:
+        logger.info("login bei '%s' erfolgreich", login_url)
+    else:
+        logger.info("Login fehlgeschlagen: '%s'", r.status_code)
+    return session
+
+
+def _validator(response):
+    """Starke ETag oder Last-Modified einer Antwort für If-Range, sonst None."""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _stream_chunks(
+    session,
+    url,
+    chunk_size,
+    max_bytes,
+    start=0,
+    retries=3,
+    timeout=60,
+    validator=None,
+    on_response=None,
+    on_restart=None,
+):
+    """
+    Liefert die Datei in Blöcken. Bricht die Verbindung ab, wird per
+    Range-Header ab dem bereits gelesenen Byte fortgesetzt.
+
+    :param validator: ETag/Last-Modified des bereits geladenen Teils, wird als
+        If-Range mitgeschickt. Hat sich die Datei geändert, antwortet der
+        Server mit 200 und der kompletten Datei.
+    :param on_response: wird mit dem Validator jeder vollständigen (200)
+        Antwort aufgerufen, z.B. um ihn für einen späteren Resume zu speichern
+    :param on_restart: wird aufgerufen, wenn ein Resume mit 200 statt 206
+        beantwortet wird (Range ignoriert oder Datei geändert). Der Aufrufer
+        verwirft dann alles bisher Geschriebene, danach folgt die komplette
+        Datei. Ohne on_restart wird in diesem Fall abgebrochen.
+    """
+    import requests
+
+    received = start
+    attempt = 0
+    while True:
+        headers = {}
+        if received:
+            headers["Range"] = f"bytes={received}-"
+            if validator:
+                headers["If-Range"] = validator
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as r:
+                if received and r.status_code == 416:
+                    # .part war bereits vollständig
+                    return
+                if received and r.status_code == 200:
+                    if on_restart is None:
+                        raise requests.exceptions.RequestException(
+                            f"Server unterstützt kein Fortsetzen (Status {r.status_code})"
+                        )
+                    logger.info("Server liefert die komplette Datei (Status 200), lade neu")
+                    on_restart()
+                    received = 0
+                elif received and r.status_code != 206:
+                    raise requests.exceptions.HTTPError(
+                        f"Download fehlgeschlagen: '{r.status_code}'", response=r
+                    )
+                if not received and r.status_code != 200:
+                    raise requests.exceptions.HTTPError(
+                        f"Download fehlgeschlagen: '{r.status_code}'", response=r
+                    )
+                if r.status_code == 200:
+                    validator = _validator(r)
+                    if on_response is not None:
+                        on_response(validator)
+                length = r.headers.get("Content-Length")
+                if max_bytes is not None and length and received + int(length) > max_bytes:
+                    raise DownloadSizeExceeded(
+                        f"Datei ist {received + int(length)} Bytes groß (max. {max_bytes})"
+                    )
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    received += len(chunk)
+                    if max_bytes is not None and received > max_bytes:
+                        raise DownloadSizeExceeded(
+                            f"Datei überschreitet {max_bytes} Bytes"
+                        )
+                    yield chunk
+                return
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            attempt += 1
+            if attempt > retries:
+                raise
+            logger.warning(
+                "Download abgebrochen bei %d Bytes (%s), setze fort (Versuch %d/%d)",
+                received,
+                e,
+                attempt,
+                retries,
+            )
+
+
+def iter_download_chunks(
+    user_name,
+    password,
+    path_link,
+    chunk_size=64 * 1024,
+    max_bytes=None,
+    hasher=None,
+    retries=3,
+):
+    """
+    Generator-Variante von download_files_from_link: loggt sich ein und liefert
+    die Datei in Blöcken fester Größe, ohne sie komplett im Speicher zu halten.
+    Damit kann z.B. Flask die Antwort direkt durchreichen.
+
+    :param hasher: optionales hashlib-Objekt, das beim Streamen aktualisiert wird
+    """
+    with _login_session(user_name, password, path_link) as session:
+        for chunk in _stream_chunks(session, path_link, chunk_size, max_bytes, retries=retries):
+            if hasher is not None:
+                hasher.update(chunk)
+            yield chunk
+
+
+def download_file_to(
+    user_name,
+    password,
+    path_link,
+    target,
+    chunk_size=64 * 1024,
+    max_bytes=None,
+    retries=3,
+):
+    """
+    Lädt eine Datei gestreamt in `target` (Pfad oder beschreibbares Datei-Objekt).
+    Bei einem Pfad wird zuerst in '<target>.part' geschrieben; eine vorhandene
+    .part-Datei wird per Range-Request fortgesetzt, aber nur mit If-Range auf
+    die ETag/Last-Modified des ersten Abrufs ('<target>.part.json'). Ohne
+    Validator oder wenn der Server Range ignoriert, wird neu geladen.
+
+    :return: {"bytes": int, "sha256": str, "path": str | None}
+    """
+    import hashlib
+    import json
+
+    if not isinstance(target, (str, os.PathLike)):
+        hasher = hashlib.sha256()
+        with _login_session(user_name, password, path_link) as session:
+            written = 0
+            for chunk in _stream_chunks(session, path_link, chunk_size, max_bytes, retries=retries):
+                target.write(chunk)
+                hasher.update(chunk)
+                written += len(chunk)
+        return {"bytes": written, "sha256": hasher.hexdigest(), "path": None}
+
+    part_path = f"{os.fspath(target)}.part"
+    meta_path = f"{part_path}.json"
+    state = {"hasher": hashlib.sha256(), "written": 0}
+    validator = None
+    if os.path.exists(part_path):
+        try:
+            with open(meta_path, "r") as f:
+                validator = json.load(f).get("validator")
+        except (OSError, ValueError):
+            validator = None
+        if validator:
+            # bereits geladenen Teil in die Prüfsumme aufnehmen und dahinter weitermachen
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(chunk_size), b""):
+                    state["hasher"].update(block)
+                    state["written"] += len(block)
+            logger.info("Setze Download von '%s' bei %d Bytes fort", part_path, state["written"])
+        else:
+            logger.info("'%s' ohne ETag/Last-Modified, lade neu", part_path)
+            os.remove(part_path)
+
+    def remember(new_validator):
+        if new_validator:
+            with open(meta_path, "w") as f:
+                json.dump({"validator": new_validator}, f)
+        elif os.path.exists(meta_path):
+            os.remove(meta_path)
+
+    with _login_session(user_name, password, path_link) as session:
+        try:
+            with open(part_path, "ab") as f:
+
+                def restart():
+                    f.seek(0)
+                    f.truncate()
+                    state["hasher"] = hashlib.sha256()
+                    state["written"] = 0
+
+                chunks = _stream_chunks(
+                    session,
+                    path_link,
+                    chunk_size,
+                    max_bytes,
+                    start=state["written"],
+                    retries=retries,
+                    validator=validator,
+                    on_response=remember,
+                    on_restart=restart,
+                )
+                for chunk in chunks:
+                    f.write(chunk)
+                    state["hasher"].update(chunk)
+                    state["written"] += len(chunk)
+        except DownloadSizeExceeded:
+            os.remove(part_path)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            raise
+    os.replace(part_path, target)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    written = state["written"]
+    logger.info("Download nach '%s' fertig (%d Bytes)", target, written)
+    return {"bytes": written, "sha256": state["hasher"].hexdigest(), "path": os.fspath(target)}
+
+
+def download_files_from_links(
+    user_name,
+    password,
+    links,
+    max_workers=8,
+    target_dir=None,
+    chunk_size=64 * 1024,
+    max_bytes=None,
+    names=None,
+):
+    """
+    Lädt viele Links parallel herunter. Pro Base-URL wird nur einmal eingeloggt;
+    alle Downloads laufen über diese eine Session mit einem Connection-Pool
+    der Größe `max_workers`.
+
+    :param target_dir: wenn gesetzt, werden die Dateien dorthin gestreamt
+        (Pfad siehe request_client.download_path), sonst wird der Inhalt wie
+        bei download_files_from_link zurückgegeben
+    :param names: optionale Dateinamen, einer pro Link
+    :return: Liste in Reihenfolge von `links` mit
+        {"link", "ok", "status_code", "content" | "path", "bytes", "error"}
+    """
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+
+    from web_scraper_operations.request_client import download_path
+
+    def fetch(session, index, link):
+        result = {"link": link, "ok": False, "status_code": None, "bytes": 0, "error": None}
+        try:
+            if target_dir is not None:
+                path = download_path(target_dir, link, index, names[index] if names else None)
+                written = 0
+                with open(path, "wb") as f:
+                    for chunk in _stream_chunks(session, link, chunk_size, max_bytes):
+                        f.write(chunk)
+                        written += len(chunk)
+                result.update(ok=True, status_code=200, path=path, bytes=written)
+            else:
+                r = session.get(link, timeout=60)
+                result["status_code"] = r.status_code
+                if r.status_code == 200:
+                    result.update(ok=True, content=r.content, bytes=len(r.content))
+                else:
+                    logger.info("Download fehlgeschlagen: '%s'", r.status_code)
+        except Exception as e:
+            logger.warning("Download von '%s' fehlgeschlagen: %s", link, e)
+            if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+                result["status_code"] = e.response.status_code
+            result["error"] = str(e)
+        return result
+
+    # ein Login pro Base-URL
+    groups = {}
+    for index, link in enumerate(links):
+        groups.setdefault(link.split(".de")[0], []).append(index)
+
+    results = [None] * len(links)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for indices in groups.values():
+            session = _login_session(user_name, password, links[indices[0]], pool_size=max_workers)
+            try:
+                for index, result in zip(
+                    indices, executor.map(lambda i: fetch(session, i, links[i]), indices)
+                ):
+                    results[index] = result
+            finally:
+                session.close()
+
+    logger.info(
+        "%d von %d Downloads erfolgreich",
+        sum(1 for r in results if r["ok"]),
+        len(links),
+    )
+    return results
+
+
+@instrument
 class PlanSoMain:
     """
     Hauptklasse zur Automatisierung der Interaktion mit der PlanSo-Webanwendung via Selenium.
-    Die Konfiguration wird aus einer YAML-Datei geladen und in ein Namespace-Objekt umgewandelt.
+    Die Konfiguration wird aus einer YAML-Datei geladen (siehe planso_config.load_config).
 
     Sicherheitshinweis: Keine Zugangsdaten im Code speichern!
     """
@@ -61,19 +525,19 @@ class PlanSoMain:
         config: str = None,
         client: str = "jvg",
         headless_mode: bool = True,
+        selenium_pool=None,
+        session_cache=None,
     ):
         logger.info(
             "Initialisiere PlanSoMain mit Table-ID: %s und Client: %s", table, client
         )
         self._headless_mode = headless_mode
+        self._client = client
+        self._session_cache = session_cache
         if config is None:
             config = self._get_config_path()
 
-        self._load_cofig(config, client)
-        self._config = self._replace_in_dict(self._config, "TABLE_ID", table)
-        self._config = self._replace_in_dict(self._config, "TABLE_NAME", table_name)
-        self._config = self._replace_in_dict(self._config, "ORGA_LIST_ID", orga_list_id)
-        self._config = self._dict_to_namespace(self._config)
+        self._load_cofig(config, client, table, table_name, orga_list_id)
 
         if base_url is not None:
             self._config.base_url = base_url
@@ -82,18 +546,43 @@ class PlanSoMain:
 
         self._page_size = "100"
 
-        self._selenium_client = SeleniumClient(headless=self._headless_mode)
+        # Mit Pool wird ein warmer Browser ausgeliehen statt ein neuer gestartet,
+        # der Abschnitt `browser` gilt dann über die client_options des Pools
+        self._selenium_pool = selenium_pool
+        with span("PlanSoMain.start_browser"):
+            if selenium_pool is not None:
+                self._selenium_client = selenium_pool.acquire()
+            else:
+                # selenium erst hier laden, reine HTTP-Downloads brauchen es nicht
+                from web_scraper_operations.selenium_client import SeleniumClient
+
+                self._selenium_client = SeleniumClient(
+                    headless=self._headless_mode, **browser_options(self._config)
+                )
+
+        # Opt-in: WebDriver-Kommandos zählen, Report beim Logout
+        self._profiler = None
+        self._network_report = None
+        if os.environ.get("PLANSO_COMMAND_PROFILE", "0") == "1":
+            self._profiler = self._selenium_client.enable_profiler()
 
         # Login-Daten setzen (aus Sicherheitsgründen nicht loggen!)
         self._config.login_payload.system_login_username = username
         self._config.login_payload.system_login_password = password
 
-    def _load_cofig(self, config: str, client: str):
-        logger.debug("Lade Konfigurationsdatei: %s", config)
-        with open(config, "r") as f:
-            self._config = yaml.safe_load(f)[client]
+    def _load_cofig(self, config: str, client: str, table="", table_name="", orga_list_id=""):
+        # YAML wird pro Prozess nur einmal geparst, Platzhalter erst beim Zugriff ersetzt
+        self._config = load_config(
+            config,
+            client,
+            TABLE_ID=table,
+            TABLE_NAME=table_name,
+            ORGA_LIST_ID=orga_list_id,
+        )
 
     def login(self):
+        if self._session_cache is not None and self._restore_session():
+            return True
         try:
             logger.info("Beginne Login-Prozess...")
 
@@ -123,7 +612,7 @@ class PlanSoMain:
                 self._config.selenium.preload_video.selector,
             )
 
-            time.sleep(1)
+            self.settle("login")
             logging.debug("Warte dass popup verschwindet")
             self._selenium_client.wait_for_overlay_to_disappear(
                 by=self._config.selenium.wait_popup.locator_strategie,
@@ -131,22 +620,138 @@ class PlanSoMain:
             )
 
             logger.info("Login erfolgreich.")
+            if self._session_cache is not None:
+                self._store_session()
             return True
 
         except Exception as e:
             logger.error("Login fehlgeschlagen: %s", str(e))
             return False
 
+    def _session_key(self):
+        return (
+            self._client,
+            self._config.base_url,
+            self._config.login_payload.system_login_username,
+            self._config.login_payload.system_login_password,
+        )
+
+    def _store_session(self):
+        try:
+            self._session_cache.set(
+                *self._session_key(), self._selenium_client.get_cookies()
+            )
+        except Exception as e:
+            logger.warning("Session konnte nicht gecacht werden: %s", e)
+
+    def _restore_session(self):
+        """
+        Versucht, eine gecachte Session per Cookies wiederherzustellen.
+        Erwartet, dass die Base-URL bereits geöffnet ist (Cookie-Domain).
+        """
+        cookies = self._session_cache.get(*self._session_key())
+        if not cookies:
+            return False
+        logger.info("Versuche gecachte Session wiederzuverwenden...")
+        try:
+            self._selenium_client.add_cookies(cookies)
+            self.open_base_url()
+            if self.check_login_page():
+                return False
+            if not self._selenium_client.is_present(
+                self._config.selenium.navigation.locator_strategie,
+                self._config.selenium.navigation.selector,
+            ):
+                self._session_cache.evict(*self._session_key())
+                return False
+            self._selenium_client.wait_for_overlay_to_disappear(
+                by=self._config.selenium.wait_popup.locator_strategie,
+                selector=self._config.selenium.wait_popup.selector,
+            )
+            logger.info("Gecachte Session gültig, Login übersprungen.")
+            return True
+        except Exception as e:
+            logger.warning("Gecachte Session nicht nutzbar: %s", e)
+            self._session_cache.evict(*self._session_key())
+            self._selenium_client.delete_all_cookies()
+            self.open_base_url()
+            return False
+
+    def check_login_page(self):
+        """
+        True, wenn der Browser auf der Login-Seite gelandet ist (Session abgelaufen).
+        Ein gecachter Session-Eintrag wird in diesem Fall verworfen.
+        """
+        on_login_page = self._selenium_client.is_present(
+            self._config.selenium.login_username_field.locator_strategie,
+            self._config.selenium.login_username_field.selector,
+            timeout=0,
+        )
+        if on_login_page and self._session_cache is not None:
+            self._session_cache.evict(*self._session_key())
+        return on_login_page
+
     def logout(self):
         logger.info("Führe Logout durch...")
+        failed = False
         try:
-            self._selenium_client.open_url(url=self._config.logout_url)
-            time.sleep(0.5)
+            # Mit Session-Cache nicht serverseitig ausloggen, sonst wären die
+            # gecachten Cookies sofort ungültig.
+            if self._session_cache is None:
+                self._selenium_client.open_url(url=self._config.logout_url)
+                self.settle("logout")
             logger.info("Schließe Client")
         except:
+            failed = True
             logger.error("Problem beim ausloggen...")
         finally:
-            self._selenium_client.quit()
+            if self._profiler is not None:
+                logger.info("\n%s", self._profiler.report())
+                self._selenium_client.disable_profiler()
+            # vor release/quit auslesen, das Performance-Log gehört zum Browser
+            self._network_report = self._selenium_client.network_report()
+            if self._network_report is not None:
+                logger.info(
+                    "Netzwerk: %d Requests, %d Bytes geladen, %d blockiert %s",
+                    self._network_report["requests"],
+                    self._network_report["bytes_loaded"],
+                    self._network_report["blocked"],
+                    self._network_report["blocked_by_type"],
+                )
+                # landet im Ergebnis des Flows unter "network"
+                attach("network", self._network_report)
+            if self._selenium_pool is not None:
+                self._selenium_pool.release(self._selenium_client, discard=failed)
+            else:
+                self._selenium_client.quit()
+
+    def get_command_profile(self):
+        """Ergebnis des CommandProfilers (PLANSO_COMMAND_PROFILE=1) oder None."""
+        if self._profiler is None:
+            return None
+        return self._profiler.as_dict()
+
+    def get_network_report(self):
+        """Network-Report des Browsers (browser.resource_policy.report) nach dem Logout oder None."""
+        return self._network_report
+
+    def settle(self, step: str, target=None):
+        """
+        Wartet auf das echte Bereitschaftssignal der Seite (siehe
+        SeleniumClient.settle). `target` ist ein Config-Eintrag mit
+        `locator_strategie`/`selector` oder ein Tupel (locator_strategie, selector),
+        dessen Element stabil sein muss.
+        Eine Mindestpause pro Schritt kann unter `timing.min_delay` gesetzt werden.
+        """
+        timing = getattr(self._config, "timing", None)
+        min_delay = getattr(getattr(timing, "min_delay", None), step, 0) or 0
+        if target is None:
+            return self._selenium_client.settle(min_delay=min_delay)
+        if isinstance(target, tuple):
+            by, selector = target
+        else:
+            by, selector = target.locator_strategie, target.selector
+        return self._selenium_client.settle(by=by, selector=selector, min_delay=min_delay)
 
     def open_url(self, url):
         self._selenium_client.open_url(url=url)
@@ -155,40 +760,18 @@ class PlanSoMain:
         self.open_url(url=self._config.base_url)
 
     def open_dialog(self, row_info, target_field="Dokumente"):
-        self._config.file_upload.selector = self._config.file_upload.selector.replace(
-            "SEARCH_FIELD_STRING", target_field
-        )
         try:
             self.set_page(row_info["page"])
             rows = self._selenium_client.find_elements(
                 by=self._config.selenium.rows_of_table.locator_strategie,
                 selector=self._config.selenium.rows_of_table.selector,
             )
-            target_field_idx = -1
-            for idx, row in enumerate(rows):
-                if idx == 1 and target_field_idx == -1:
-                    tds = self._selenium_client.find_elements(
-                        by=self._config.selenium.field_count.locator_strategie,
-                        selector=self._config.selenium.field_count.selector,
-                        element=row,
-                    )
-                    for i, td in enumerate(tds):
-                        td_id = td.get_attribute("aria-describedby")
-                        if td_id == getattr(self._config.table_fields, target_field):
-                            target_field_idx = i + 1
-                            logger.debug(
-                                "Feld '%s' hat Index %d", target_field, target_field_idx
-                            )
-
+            for row in rows:
                 if row_info["plate"] in row.text:
                     logger.debug("Klicke trash")
-                    dialog_cell = row.find_element(
-                        self._config.selenium.upload_cell_prepare.locator_strategie,
-                        self._config.selenium.upload_cell_prepare.selector
-                        + f"[{target_field_idx}]",
-                    )
+                    dialog_cell = self._column_cell(row, target_field)
                     dialog_cell.click()
-                    time.sleep(1)
+                    self.settle("dialog")
                     break
         except Exception as e:
             logger.error("Trash fehlgeschlagen: %s", str(e))
@@ -202,9 +785,6 @@ class PlanSoMain:
 
     def upload_file(self, path, row_info, target_field="Dokumente"):
         logger.info("Starte Datei-Upload für Ziel-Feld: %s", target_field)
-        self._config.file_upload.selector = self._config.file_upload.selector.replace(
-            "SEARCH_FIELD_STRING", target_field
-        )
         try:
             self.set_page(row_info["page"])
             rows = self._selenium_client.find_elements(
@@ -212,31 +792,12 @@ class PlanSoMain:
                 selector=self._config.selenium.rows_of_table.selector,
             )
 
-            target_field_idx = -1
-            for idx, row in enumerate(rows):
-                if idx == 1 and target_field_idx == -1:
-                    tds = self._selenium_client.find_elements(
-                        by=self._config.selenium.field_count.locator_strategie,
-                        selector=self._config.selenium.field_count.selector,
-                        element=row,
-                    )
-                    for i, td in enumerate(tds):
-                        td_id = td.get_attribute("aria-describedby")
-                        if td_id == getattr(self._config.table_fields, target_field):
-                            target_field_idx = i + 1
-                            logger.debug(
-                                "Feld '%s' hat Index %d", target_field, target_field_idx
-                            )
-
+            for row in rows:
                 if row_info["plate"] in row.text:
                     logger.debug("Klicke Upload-Zelle...")
-                    upload_cell = row.find_element(
-                        self._config.selenium.upload_cell_prepare.locator_strategie,
-                        self._config.selenium.upload_cell_prepare.selector
-                        + f"[{target_field_idx}]",
-                    )
+                    upload_cell = self._column_cell(row, target_field)
                     upload_cell.click()
-                    time.sleep(1)
+                    self.settle("upload_dialog", self._config.selenium.upload_cell)
                     break
 
             rows = self._selenium_client.find_elements(
@@ -256,7 +817,7 @@ class PlanSoMain:
                         by=self._config.selenium.status_upload_uploading.locator_strategie,
                         selector=self._config.selenium.status_upload_uploading.selector,
                     )
-                    time.sleep(2)
+                    self.settle("upload_alert")
                     # Warten auf das Warnung fenster "datei existiert bereits"
                     if self.check_for_alert():
                         return self.check_overlay_type()
@@ -269,12 +830,11 @@ class PlanSoMain:
                     logger.info(
                         f"Datei erfolgreich hochgeladen, warte auf unsichtbarkeit von {self._config.selenium.wait_for_upload.selector} und klicke dann auf {self._config.selenium.upload_dialog_close.selector}"
                     )
-                    time.sleep(1)
                     self._selenium_client.wait_for_invisibility(
                         by=self._config.selenium.wait_for_upload.locator_strategie,
                         selector=self._config.selenium.wait_for_upload.selector,
                     )
-                    time.sleep(1)
+                    self.settle("upload_close", self._config.selenium.upload_dialog_close)
                     self._selenium_client.safe_click(
                         by=self._config.selenium.upload_dialog_close.locator_strategie,
                         selector=self._config.selenium.upload_dialog_close.selector,
@@ -292,15 +852,203 @@ class PlanSoMain:
         )
         return "File not uploaded"
 
+    def upload_files(self, paths, row_info, target_field="Dokumente"):
+        """
+        Lädt mehrere Dateien über einen einzigen Upload-Dialog hoch. Erlaubt das
+        Datei-Input `multiple`, werden alle Pfade in einem send_keys gesendet und
+        einmal auf den Abschluss gewartet; sonst werden die Dateien nacheinander
+        im offenen Dialog hochgeladen.
+
+        :return: {dateiname: status} wie planso_bulk_upload es bisher lieferte
+        """
+        logger.info("Starte Upload von %d Dateien für Ziel-Feld: %s", len(paths), target_field)
+        file_status = {os.path.basename(path): "File not uploaded" for path in paths}
+        try:
+            self.set_page(row_info["page"])
+            row = self._find_row_by_plate(row_info["plate"])
+            if row is None:
+                logger.warning("Zeile '%s' nicht gefunden", row_info["plate"])
+                return file_status
+            logger.debug("Klicke Upload-Zelle...")
+            self._column_cell(row, target_field).click()
+            self.settle("upload_dialog", self._config.selenium.upload_cell)
+
+            row = self._find_row_by_plate(row_info["plate"])
+            before = self._upload_progress()
+            if self._selenium_client.upload_files(
+                element=row,
+                by=self._config.selenium.upload_cell.locator_strategie,
+                selector=self._config.selenium.upload_cell.selector,
+                paths=paths,
+            ):
+                file_status.update(self._wait_for_uploads(paths, before))
+            else:
+                logger.debug("Datei-Input erlaubt kein 'multiple', lade einzeln hoch")
+                for path in paths:
+                    # Meldungen der vorigen Datei schließen, damit sie nicht der nächsten gelten
+                    self._dismiss_notices()
+                    before = self._upload_progress()
+                    self._selenium_client.upload_file(
+                        element=self._find_row_by_plate(row_info["plate"]),
+                        by=self._config.selenium.upload_cell.locator_strategie,
+                        selector=self._config.selenium.upload_cell.selector,
+                        path=path,
+                    )
+                    file_status.update(self._wait_for_uploads([path], before))
+                    logger.info(
+                        "'%s' return of status '%s'",
+                        os.path.basename(path),
+                        file_status[os.path.basename(path)],
+                    )
+        except Exception as e:
+            logger.error("Upload fehlgeschlagen: %s", str(e))
+
+        self._selenium_client.wait_for_invisibility(
+            by=self._config.selenium.wait_for_upload.locator_strategie,
+            selector=self._config.selenium.wait_for_upload.selector,
+        )
+        self.settle("upload_close", self._config.selenium.upload_dialog_close)
+        self._selenium_client.safe_click(
+            by=self._config.selenium.upload_dialog_close.locator_strategie,
+            selector=self._config.selenium.upload_dialog_close.selector,
+        )
+        return file_status
+
+    def _find_row_by_plate(self, plate):
+        rows = self._selenium_client.find_elements(
+            by=self._config.selenium.rows_of_table.locator_strategie,
+            selector=self._config.selenium.rows_of_table.selector,
+        )
+        for row in rows:
+            if plate in row.text:
+                return row
+        return None
+
+    def _upload_progress(self):
+        """
+        Stand des Upload-Dialogs vor einem Upload: (Anzahl hochgeladener Dateien,
+        sichtbare Meldungen). Dient _wait_for_uploads als Ausgangswert.
+        """
+        items = self._selenium_client.find_elements(
+            by=self._config.selenium.uploaded_items.locator_strategie,
+            selector=self._config.selenium.uploaded_items.selector,
+        )
+        notices = self._selenium_client.visible_elements(
+            by=self._config.selenium.upload_dialog_alert.locator_strategie,
+            selector=self._config.selenium.upload_dialog_alert.selector,
+        )
+        return len(items), set(notices)
+
+    def _new_notices(self, before):
+        """Seit `before` neu erschienene Meldungen als (Text, Typ), ohne Fortschrittsmeldungen."""
+        notices = []
+        for notice in self._selenium_client.visible_elements(
+            by=self._config.selenium.upload_dialog_alert.locator_strategie,
+            selector=self._config.selenium.upload_dialog_alert.selector,
+        ):
+            if notice in before[1]:
+                continue
+            text = notice.text.strip().lower()
+            overlay_type = self._classify_overlay_text(text)
+            if overlay_type != "upload":
+                notices.append((text, overlay_type))
+        return notices
+
+    def _dismiss_notices(self, timeout=5):
+        """Schließt sichtbare Meldungen und wartet kurz, bis sie weg sind."""
+        for closer in self._selenium_client.find_elements(
+            by=self._config.selenium.upload_dialog_alert_close.locator_strategie,
+            selector=self._config.selenium.upload_dialog_alert_close.selector,
+        ):
+            try:
+                # der Closer ist nur bei Hover sichtbar, daher per JS
+                self._selenium_client.execute_script("arguments[0].click();", closer)
+            except Exception as e:
+                logger.debug("Meldung schließen fehlgeschlagen: %s", e)
+        try:
+            self._selenium_client.wait_until(
+                lambda: not self._selenium_client.visible_elements(
+                    by=self._config.selenium.upload_dialog_alert.locator_strategie,
+                    selector=self._config.selenium.upload_dialog_alert.selector,
+                ),
+                timeout=timeout,
+            )
+        except Exception:
+            logger.debug("Meldungen nach %ss noch sichtbar, werden über den Ausgangsstand ignoriert", timeout)
+
+    def _wait_for_uploads(self, paths, before):
+        """
+        Wartet, bis jede Datei abgeschlossen ist: als neuer Eintrag in der
+        Dateiliste des Dialogs oder als neue Meldung (z.B. "existiert bereits"),
+        jeweils gezählt ab `before` (siehe _upload_progress). Danach werden die
+        neuen Meldungen den Dateien zugeordnet (über den Dateinamen im Text);
+        Meldungen ohne Dateinamen gelten für alle nicht genannten Dateien.
+
+        Die Wartezeit wächst mit der Anzahl Dateien (timing.upload_timeout_per_file).
+        Läuft sie ab, gilt jede Datei ohne eigenen Eintrag oder eigene Meldung
+        als nicht hochgeladen.
+        """
+        names = [os.path.basename(path) for path in paths]
+        timing = getattr(self._config, "timing", None)
+        per_file = getattr(timing, "upload_timeout_per_file", None) or 30
+
+        def new_items():
+            items = self._selenium_client.find_elements(
+                by=self._config.selenium.uploaded_items.locator_strategie,
+                selector=self._config.selenium.uploaded_items.selector,
+            )
+            return items[before[0]:]
+
+        def finished():
+            if self._selenium_client.find_elements(
+                by=self._config.selenium.status_upload_uploading.locator_strategie,
+                selector=self._config.selenium.status_upload_uploading.selector,
+            ):
+                return False
+            return len(new_items()) + len(self._new_notices(before)) >= len(names)
+
+        confirmed = True
+        try:
+            self._selenium_client.wait_until(finished, timeout=per_file * len(names))
+        except Exception:
+            logger.warning("Upload von %d Datei(en) nicht vollständig bestätigt", len(names))
+            confirmed = False
+        self.settle("upload_alert")
+
+        status = {name: "File Upload erfolgreich" for name in names}
+        notices = self._new_notices(before)
+        unassigned = []
+        for text, overlay_type in notices:
+            logging.info(f"Overlay erkannt: {text}")
+            matched = [name for name in names if name.lower() in text]
+            for name in matched:
+                status[name] = overlay_type
+            if not matched:
+                unassigned.append(overlay_type)
+        if unassigned:
+            for name in names:
+                if not any(name.lower() in text for text, _ in notices):
+                    status[name] = unassigned[0]
+        if not confirmed:
+            texts = [text for text, _ in notices]
+            texts += [item.text.strip().lower() for item in new_items()]
+            for name in names:
+                if not any(name.lower() in text for text in texts):
+                    status[name] = "File not uploaded"
+        return status
+
     def find_element(self, field_name: str, search_string: str):
         logger.info(
             "Suche Element mit Feld '%s' und Suchbegriff '%s'",
             field_name,
             search_string,
         )
-        self._config.find_element.selector = self._config.find_element.selector.replace(
-            "SEARCH_FIELD_STRING", field_name
-        )
+        field_selector = render_selector(self._config.find_element.selector, field_name)
+        row_info = self._find_element_in_grid(field_name, search_string)
+        if row_info is not False:
+            return row_info
+
+        logger.debug("Kein jqGrid-Datenmodell verfügbar, durchsuche DOM-Zeilen")
         nr_pages = self.get_nr_pages()
         field_idx = -1
 
@@ -312,15 +1060,7 @@ class PlanSoMain:
             )
             for idx, row in enumerate(rows):
                 if idx == 1 and field_idx == -1:
-                    tds = self._selenium_client.find_elements(
-                        by=self._config.selenium.field_count.locator_strategie,
-                        selector=self._config.selenium.field_count.selector,
-                        element=row,
-                    )
-                    for i, td in enumerate(tds):
-                        td_id = td.get_attribute("aria-describedby")
-                        if td_id == getattr(self._config.table_fields, field_name):
-                            field_idx = i
+                    field_idx = self._column_index(field_name)
 
                 if search_string in row.text:
                     logger.debug(
@@ -331,7 +1071,7 @@ class PlanSoMain:
                     )
                     numberplate = self._selenium_client.find_element(
                         by=self._config.find_element.locator_strategie,
-                        selector=self._config.find_element.selector,
+                        selector=field_selector,
                         element=row,
                     ).text
                     id_nr = self._selenium_client.find_element(
@@ -353,62 +1093,213 @@ class PlanSoMain:
         logger.warning("Element nicht gefunden: %s", search_string)
         return None
 
+    def _grid_column_name(self, field_name: str) -> str:
+        # table_fields: "<table_id>_<spalte>" -> colModel-Name "<spalte>"
+        field_id = getattr(self._config.table_fields, field_name)
+        return field_id[len(self._config.table_id) + 1 :]
+
+    def _read_grid_page(self, field_name: str, search_string: str):
+        return self._selenium_client.execute_script(
+            GRID_SEARCH_SCRIPT,
+            self._config.table_id,
+            self._grid_column_name(field_name),
+            self._grid_column_name("ID"),
+            search_string,
+        )
+
+    def _find_element_in_grid(self, field_name: str, search_string: str):
+        """
+        Sucht `search_string` seitenweise im jqGrid-Datenmodell (ein Script-Aufruf
+        pro Seite). Vorher wird die Seitengröße auf das Maximum der rowList
+        gesetzt, damit möglichst wenige Seiten geladen werden müssen; danach
+        wird die vorherige Seitengröße wiederhergestellt.
+
+        :return: row_info wie find_element, None wenn nicht gefunden,
+            False wenn die Tabelle kein jqGrid-Datenmodell hat
+        """
+        try:
+            page_data = self._read_grid_page(field_name, search_string)
+        except Exception as e:
+            logger.warning("jqGrid-Datenmodell nicht lesbar: %s", e)
+            return False
+        if page_data is None:
+            return False
+
+        original_size = None
+        row_list = [int(n) for n in page_data["row_list"] if str(n).isdigit()]
+        if row_list and max(row_list) > page_data["page_size"]:
+            original_size = page_data["page_size"]
+            self.set_page_size(str(max(row_list)))
+            page_data = self._read_grid_page(field_name, search_string)
+        if page_data["page"] != 1:
+            self.set_page(1)
+            page_data = self._read_grid_page(field_name, search_string)
+
+        row_info = None
+        page = 1
+        while True:
+            match = page_data["match"]
+            if match is not None:
+                logger.info(
+                    "Element gefunden: Kennzeichen=%s, ID=%s", match["plate"], match["id"]
+                )
+                row_info = {
+                    "Zeile": match["row"],
+                    "ID": match["id"],
+                    "plate": match["plate"],
+                    "field_idx": self._column_index(field_name),
+                    "page_size": page_data["page_size"],
+                    "page": page,
+                }
+                break
+            if page >= page_data["last_page"]:
+                break
+            page += 1
+            self.set_page(page)
+            page_data = self._read_grid_page(field_name, search_string)
+
+        if original_size is not None:
+            row_info = self._restore_grid_page_size(
+                original_size, field_name, search_string, row_info
+            )
+        if row_info is None:
+            logger.warning("Element nicht gefunden: %s", search_string)
+        return row_info
+
+    def _restore_grid_page_size(
+        self, page_size: int, field_name: str, search_string: str, row_info
+    ):
+        """
+        Stellt die Seitengröße `page_size` wieder her und blättert auf die Seite,
+        auf der die gefundene Zeile mit dieser Größe steht. Seite und Zeile in
+        `row_info` werden daran angepasst, damit set_page(row_info["page"]) und
+        open_details(row_info["Zeile"]) weiter auf dieselbe Zeile zeigen.
+        """
+        self.set_page_size(str(page_size))
+        if row_info is None:
+            return None
+        # Zeile 0 ist die jqgfirstrow, die Datenzeilen beginnen bei 1
+        position = (row_info["page"] - 1) * row_info["page_size"] + row_info["Zeile"] - 1
+        page = position // page_size + 1
+        page_data = self._read_grid_page(field_name, search_string)
+        if page_data["page"] != page:
+            self.set_page(page)
+            page_data = self._read_grid_page(field_name, search_string)
+        match = page_data["match"]
+        if match is None or match["id"] != row_info["ID"]:
+            logger.warning(
+                "Zeile %s nach Zurücksetzen der Seitengröße nicht auf Seite %d",
+                row_info["ID"],
+                page,
+            )
+            return dict(row_info, Zeile=position % page_size + 1, page_size=page_size, page=page)
+        return dict(row_info, Zeile=match["row"], page_size=page_size, page=page)
+
+    def _find_element_with_grid_filter(self, field_name: str, search_string: str):
+        """
+        Setzt den Spaltenfilter "ist gleich" direkt über die jqGrid-API,
+        löst genau einen Reload aus und liest das Ergebnis aus dem Datenmodell.
+
+        :return: row_info wie find_element_with_search, None wenn das neu
+            geladene Grid nachweislich gefiltert ist (alle Zeilen erfüllen die
+            Regel oder die Anzahl Datensätze hat sich geändert) und nichts
+            enthält, False wenn der Filter nicht gesetzt, nicht angewendet oder
+            das Ergebnis nicht gelesen werden konnte
+        """
+        toolbar_field = None
+        if self._config.selenium.search_field.locator_strategie == "id":
+            toolbar_field = render_selector(
+                self._config.selenium.search_field.selector, field_name
+            )
+        try:
+            applied = self._selenium_client.execute_script(
+                GRID_FILTER_SCRIPT,
+                self._config.table_id,
+                self._grid_column_name(field_name),
+                search_string,
+                toolbar_field,
+            )
+            if not applied:
+                return False
+            records_before = applied.get("records") if isinstance(applied, dict) else None
+            self.settle("search", self._config.selenium.rows_of_table)
+            self._selenium_client.wait_for_invisibility(
+                self._config.selenium.load_table_indicator.locator_strategie,
+                self._config.selenium.load_table_indicator.selector,
+            )
+            page_data = self._read_grid_page(field_name, search_string)
+        except Exception as e:
+            logger.warning("Grid-Filter fehlgeschlagen: %s", e)
+            return False
+        if page_data is None:
+            return False
+
+        match = page_data["match"]
+        if match is None:
+            # nur ein nachweislich gefiltertes Ergebnis ist ein echter Fehlschlag;
+            # ignoriert das Backend postData.filters, kommt ungefiltert Seite 1
+            filtered = page_data.get("all_equal") or (
+                records_before is not None and page_data.get("records") != records_before
+            )
+            if not filtered:
+                logger.debug("Grid-Filter wurde vom Server nicht angewendet")
+                return False
+            logger.warning("Element nicht gefunden: %s", search_string)
+            return None
+        logger.info("Element gefunden: Kennzeichen=%s, ID=%s", match["plate"], match["id"])
+        return {
+            "Zeile": match["row"],
+            "ID": match["id"],
+            "plate": match["plate"],
+            "field_idx": self._column_index(field_name),
+            "page_size": page_data["page_size"],
+            "page": page_data["page"],
+        }
+
     def find_element_with_search(self, field_name: str, search_string: str):
         logger.info(
             "Suche Element mit Feld '%s' und Suchbegriff '%s'",
             field_name,
             search_string,
         )
-        wait_time = 1
-        self._config.selenium.search_field.selector = (
-            self._config.selenium.search_field.selector.replace(
-                "SEARCH_FIELD_STRING", field_name
-            )
-        )
-        self._config.find_element.selector = self._config.find_element.selector.replace(
-            "SEARCH_FIELD_STRING", field_name
+        search_field = (
+            self._config.selenium.search_field.locator_strategie,
+            render_selector(self._config.selenium.search_field.selector, field_name),
         )
+        field_selector = render_selector(self._config.find_element.selector, field_name)
+        self._selenium_client.wait_for_element(*search_field)
+
+        # ----- Filter direkt über die jqGrid-API setzen (ein Reload)
+        row_info = self._find_element_with_grid_filter(field_name, search_string)
+        if row_info is not False:
+            # Treffer oder echter Fehlschlag, die Suchleiste fände auch nichts
+            return row_info
+        logger.debug("Grid-Filter nicht möglich, nutze die Suchleiste")
 
         # ----- such operator setzen
         logger.debug("setze den such operator auf 'ist gleich'")
-        time.sleep(wait_time)
-        self._selenium_client.wait_for_element(
-            self._config.selenium.search_field.locator_strategie,
-            self._config.selenium.search_field.selector,
-        )
-        time.sleep(wait_time)
-        spalten_element = self._selenium_client.find_element(
-            self._config.selenium.search_field.locator_strategie,
-            self._config.selenium.search_field.selector,
-        )
-        time.sleep(wait_time)
+        self.settle("search", search_field)
+        spalten_element = self._selenium_client.find_element(*search_field)
         search_button = self._selenium_client.find_element(
             self._config.selenium.search_strategy_menu.locator_strategie,
             self._config.selenium.search_strategy_menu.selector,
             spalten_element,
         )
-        time.sleep(wait_time)
         search_button.click()
-        time.sleep(wait_time)
         self._selenium_client.click(
             self._config.selenium.search_strategy.locator_strategie,
             self._config.selenium.search_strategy.selector,
         )
-        time.sleep(wait_time)
 
         # ----- setze den such string
         logger.info("setze den suchstring '%s'", search_string)
-        self._selenium_client.wait_for_visibility(
-            self._config.selenium.search_field.locator_strategie,
-            self._config.selenium.search_field.selector,
-        )
-        time.sleep(wait_time)
+        self._selenium_client.wait_for_visibility(*search_field)
+        self.settle("search", search_field)
         self._selenium_client.type_text(
-            self._config.selenium.search_field.locator_strategie,
-            self._config.selenium.search_field.selector,
+            *search_field,
             search_string,
         )
-        time.sleep(wait_time)
+        self.settle("search")
 
         # -----
         page = 1
@@ -420,15 +1311,7 @@ class PlanSoMain:
         )
         for idx, row in enumerate(rows):
             if idx == 1 and field_idx == -1:
-                tds = self._selenium_client.find_elements(
-                    by=self._config.selenium.field_count.locator_strategie,
-                    selector=self._config.selenium.field_count.selector,
-                    element=row,
-                )
-                for i, td in enumerate(tds):
-                    td_id = td.get_attribute("aria-describedby")
-                    if td_id == getattr(self._config.table_fields, field_name):
-                        field_idx = i
+                field_idx = self._column_index(field_name)
 
             if search_string in row.text:
                 logger.debug(
@@ -439,7 +1322,7 @@ class PlanSoMain:
                 )
                 numberplate = self._selenium_client.find_element(
                     by=self._config.find_element.locator_strategie,
-                    selector=self._config.find_element.selector,
+                    selector=field_selector,
                     element=row,
                 ).text
                 id_nr = self._selenium_client.find_element(
@@ -461,6 +1344,77 @@ class PlanSoMain:
         logger.warning("Element nicht gefunden: %s", search_string)
         return None
 
+    def _deep_link(self, name: str, order_id: str = ""):
+        """
+        URL aus `deep_links.<name>` (relativ zu base_url) oder None, wenn der
+        Link nicht konfiguriert ist.
+        """
+        links = getattr(self._config, "deep_links", None)
+        template = getattr(links, name, None) if links is not None else None
+        if not template:
+            return None
+        return urljoin(self._config.base_url, template.replace(ORDER_PLACEHOLDER, str(order_id)))
+
+    def _open_deep_link(self, url, target) -> bool:
+        """
+        Öffnet `url` und wartet auf das Element `target`. False, wenn stattdessen
+        die Login-Seite kommt oder das Element fehlt, dann wird geklickt.
+        """
+        try:
+            logger.info("Springe direkt zu %s", url)
+            self._selenium_client.open_url(url)
+            if self.check_login_page():
+                return False
+            self._selenium_client.wait_for_element(target.locator_strategie, target.selector)
+            return True
+        except Exception as e:
+            logger.warning("Deep Link %s fehlgeschlagen, navigiere per Klick: %s", url, e)
+            return False
+
+    def goto_table(self):
+        """Öffnet die Tabelle per deep_links.table, sonst über die Navigation."""
+        url = self._deep_link("table")
+        if url is None or not self._open_deep_link(url, self._config.selenium.table_element):
+            self.open_navigation()
+            self.open_table()
+        self.settle("open_table", self._config.selenium.table_element)
+
+    def goto_orga_list(self):
+        """Öffnet die Orga Liste per deep_links.orga_list, sonst über den Schnellzugriff."""
+        url = self._deep_link("orga_list")
+        if url is None or not self._open_deep_link(url, self._config.selenium.orga_list_element):
+            self.open_schnellzugriff()
+            self.open_orga_list()
+        self.settle("open_orga_list")
+
+    def open_order_direct(self, order_id) -> bool:
+        """
+        Öffnet den Teile-Reiter eines Auftrags direkt über seine ID: per
+        deep_links.teile, sonst per deep_links.details und Klick auf Teile.
+        False, wenn keiner der Links konfiguriert ist oder funktioniert.
+        """
+        teile_button = self._config.selenium.teile_button
+        url = self._deep_link("teile", order_id)
+        if url is not None and self._open_deep_link(url, teile_button):
+            self.settle("open_details", teile_button)
+            return True
+        url = self._deep_link("details", order_id)
+        if url is not None and self._open_deep_link(url, teile_button):
+            self.settle("open_details", teile_button)
+            self.open_teile()
+            return True
+        return False
+
+    def open_order_teile(self, row_info):
+        """
+        Öffnet den Teile-Reiter zu einem Treffer von find_element_with_search:
+        per Deep Link über row_info["ID"], sonst per Klick auf Details/Teile.
+        """
+        if row_info.get("ID") and self.open_order_direct(row_info["ID"]):
+            return
+        self.open_details(row_nr=row_info["Zeile"])
+        self.open_teile()
+
     def open_navigation(self):
         try:
             logger.info("Öffne Navigation...")
@@ -475,6 +1429,7 @@ class PlanSoMain:
             )
         except Exception as e:
             logger.error("Navigation öffnen fehlgeschlagen: %s", str(e))
+            self.check_login_page()
             return False
 
     def open_schnellzugriff(self):
@@ -486,6 +1441,7 @@ class PlanSoMain:
             )
         except Exception as e:
             logger.error("Schnellzugriff öffnen fehlgeschlagen: %s", str(e))
+            self.check_login_page()
             return False
 
     def open_table(self):
@@ -506,16 +1462,41 @@ class PlanSoMain:
                 selector=self._config.selenium.table_name.selector,
             )
             # self._wait_for_table()
-            time.sleep(1)
+            self.settle("open_table", self._config.selenium.table_element)
             logger.info("OK")
         except Exception as e:
             logger.error("Tabelle öffnen fehlgeschlagen: %s", str(e))
             return False
 
+    def ensure_table_open(self):
+        """
+        Öffnet die Tabelle nur, wenn sie nicht bereits angezeigt wird
+        (für Batch-Flows mit mehreren Jobs pro Login).
+        """
+        if self._selenium_client.is_visible(
+            self._config.selenium.table_element.locator_strategie,
+            self._config.selenium.table_element.selector,
+        ):
+            return
+        logger.info("Tabelle nicht offen, navigiere neu...")
+        self.goto_table()
+
+    def ensure_orga_list_open(self):
+        """
+        Öffnet die Orga Liste nur, wenn sie nicht bereits angezeigt wird.
+        """
+        if self._selenium_client.is_visible(
+            self._config.selenium.orga_list_element.locator_strategie,
+            self._config.selenium.orga_list_element.selector,
+        ):
+            return
+        logger.info("Orga Liste nicht offen, navigiere neu...")
+        self.goto_orga_list()
+
     def open_orga_list(self):
         try:
             logger.info("Öffne Orga Liste...")
-            time.sleep(1)
+            self.settle("open_orga_list", self._config.selenium.orga_list)
             self._selenium_client.click(
                 by=self._config.selenium.orga_list.locator_strategie,
                 selector=self._config.selenium.orga_list.selector,
@@ -528,26 +1509,24 @@ class PlanSoMain:
 
     def open_details(self, row_nr):
         try:
-            wait = 1
             logger.info("Öffne Details...")
             self._selenium_client.wait_for_visibility(
                 by=self._config.selenium.details_button.locator_strategie,
                 selector=self._config.selenium.details_button.selector_row
                 + f"[{row_nr}]",
             )
-            time.sleep(wait)
+            self.settle("open_details")
             row = self._selenium_client.find_element(
                 by=self._config.selenium.details_button.locator_strategie,
                 selector=self._config.selenium.details_button.selector_row
                 + f"[{row_nr}]",
             )
-            time.sleep(wait)
             self._selenium_client.click(
                 by=self._config.selenium.details_button.locator_strategie,
                 selector=self._config.selenium.details_button.selector,
                 element=row,
             )
-            time.sleep(wait)
+            self.settle("open_details", self._config.selenium.teile_button)
             # self._wait_for_table()
         except Exception as e:
             logger.error("Details öffnen fehlgeschlagen: %s", str(e))
@@ -574,24 +1553,16 @@ class PlanSoMain:
 
     def get_nr_pages(self) -> int:
         timeout = 10
-        self._selenium_client.wait_for_element(
-            self._config.selenium.nr_pages.locator_strategie,
-            self._config.selenium.nr_pages.selector,
-        )
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            try:
-                text = self._selenium_client.find_element(
-                    by=self._config.selenium.nr_pages.locator_strategie,
-                    selector=self._config.selenium.nr_pages.selector,
-                ).text
-                if text != "":
-                    logging.info("number page: %d", text)
-                    return int(text)
-                time.sleep(0.5)
-            except:
-                time.sleep(0.5)
-        raise Exception(f"get_nr_page fehlgeschlagen")
+        try:
+            text = self._selenium_client.wait_for_text(
+                by=self._config.selenium.nr_pages.locator_strategie,
+                selector=self._config.selenium.nr_pages.selector,
+                timeout=timeout,
+            )
+        except Exception:
+            raise Exception(f"get_nr_page fehlgeschlagen")
+        logging.info("number page: %s", text)
+        return int(text)
 
     def set_page(self, nr):
         logger.info("Setze Seite auf: %d", nr)
@@ -602,7 +1573,7 @@ class PlanSoMain:
             send_return=True,
         )
         self._wait_for_table()
-        time.sleep(1)
+        self.settle("set_page", self._config.selenium.rows_of_table)
 
     def get_page_size(self):
         size = int(
@@ -626,7 +1597,7 @@ class PlanSoMain:
     def get_teile_info(self):
         try:
             logger.info("Lese Teile Infos")
-            time.sleep(1)
+            self.settle("teile")
             # self._selenium_client.wait_for_visibility(
             #     by=self._config.selenium.teile_elements.locator_strategie,
             #     selector=self._config.selenium.teile_elements.selector,
@@ -647,191 +1618,289 @@ class PlanSoMain:
                 logger.info("Keine Ersatzteile vorhanden.")
                 return []
 
-            # 3. Tabelle auslesen
-            parts_data = []
+            parts_data = None
+            if getattr(self._config.teile_tabelle, "extraction", "elements") == "script":
+                parts_data = self._get_teile_info_script(rows)
+            if parts_data is None:
+                parts_data = self._get_teile_info_elements(rows)
 
-            for row in rows:
-                part = {}
-                logger.debug(f"{row}")
-                logger.debug("lese data_id")
-                part["data_id"] = row.get_attribute("data-id")
-                logger.debug("lese data_partid")
-                part["data_partid"] = row.get_attribute("data-partid")
-                logger.debug("lese data_pnum")
-                part["data_pnum"] = row.get_attribute("data-pnum")
-                logger.debug("lese name")
-                try:
-                    part["name"] = self._selenium_client.find_element(
-                        by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.name,
-                        element=row,
-                    ).text.strip()
-                except:
-                    part["name"] = None
-                logger.debug("lese part_number")
-                try:
-                    part["part_number"] = self._selenium_client.find_element(
-                        by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.part_nr,
-                        element=row,
-                    ).get_attribute("data-prtnumber")
-                except:
-                    part["part_number"] = None
-                logger.debug("lese price")
-                try:
-                    part["price"] = self._selenium_client.find_element(
-                        by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.price,
-                        element=row,
-                    ).text.strip()
-                except:
-                    part["price"] = None
-                logger.debug("lese quantity")
-                try:
-                    part["quantity"] = self._selenium_client.find_element(
-                        by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.quantity,
-                        element=row,
-                    ).text.strip()
-                except:
-                    part["quantity"] = None
-                logger.debug("lese total_price")
-                try:
-                    part["total_price"] = self._selenium_client.find_element(
-                        by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.total_price,
-                        element=row,
-                    ).text.strip()
-                except:
-                    part["total_price"] = None
-                logger.debug("lese bestellt")
-                try:
-                    part["bestellt"] = (
-                        self._selenium_client.find_element(
-                            by=self._config.teile_tabelle.locator_strategie,
-                            selector=self._config.teile_tabelle.bestellt,
-                            element=row,
-                        ).get_attribute("checked")
-                        is not None
-                    )
-                except:
-                    part["bestellt"] = None
-                logger.debug("lese delivered")
-                try:
-                    part["delivered"] = (
-                        self._selenium_client.find_element(
-                            by=self._config.teile_tabelle.locator_strategie,
-                            selector=self._config.teile_tabelle.delivered,
-                            element=row,
-                        ).get_attribute("checked")
-                        is not None
-                    )
-                except:
-                    part["delivered"] = None
-                logger.debug("lese status")
-                try:
-                    part["status"] = self._selenium_client.find_element(
-                        by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.status,
-                        element=row,
-                    ).get_attribute("title")
-                except:
-                    part["status"] = None
-                logger.debug("lese bestelldatum")
-                try:
-                    part["bestelldatum"] = self._selenium_client.find_element(
+            return parts_data
+        except Exception as e:
+            logger.error("Teile Infos auslesen fehlgeschlagen: %s", str(e))
+            return []
+
+    def _get_teile_info_script(self, rows):
+        """
+        Liest alle Teile-Zeilen plus Summen mit einem einzigen execute_script aus.
+        Gibt None zurück, wenn das nicht möglich ist (dann greift der
+        Element-für-Element Pfad). Das Ergebnis entspricht exakt dem Format von
+        _get_teile_info_elements.
+        """
+        teile = self._config.teile_tabelle
+        bottom_line = teile.bottom_line_gesamtpreis
+        if (
+            teile.locator_strategie != "css"
+            or bottom_line.locator_strategie != "css"
+            or bottom_line.locator_strategie_tag != "tag"
+        ):
+            logger.debug("Teile-Selektoren sind nicht css, nutze Element-Pfad")
+            return None
+
+        selectors = {
+            "name": teile.name,
+            "part_nr": teile.part_nr,
+            "price": teile.price,
+            "quantity": teile.quantity,
+            "total_price": teile.total_price,
+            "bestellt": teile.bestellt,
+            "delivered": teile.delivered,
+            "status": teile.status,
+            "bestelldatum": teile.bestelldatum,
+            "project_num": teile.project_num,
+            "bottom_line": bottom_line.selector,
+            "bottom_line_tr": bottom_line.selector_tr,
+            "bottom_line_td": bottom_line.selector_td,
+        }
+        try:
+            result = self._selenium_client.execute_script(
+                TEILE_INFO_SCRIPT, rows, selectors
+            )
+        except Exception as e:
+            logger.warning("Teile per Script auslesen fehlgeschlagen: %s", e)
+            return None
+        if not result or len(result["rows"]) != len(rows):
+            logger.warning("Teile-Script lieferte unerwartetes Ergebnis, nutze Element-Pfad")
+            return None
+
+        def strip(value):
+            return value.strip() if value is not None else None
+
+        parts_data = []
+        for row in result["rows"]:
+            part = {
+                "data_id": row["data_id"],
+                "data_partid": row["data_partid"],
+                "data_pnum": row["data_pnum"],
+                "name": strip(row["name"]),
+                "part_number": row["part_number"],
+                "price": strip(row["price"]),
+                "quantity": strip(row["quantity"]),
+                "total_price": strip(row["total_price"]),
+                "bestellt": row["bestellt"],
+                "delivered": row["delivered"],
+                "status": row["status"],
+                "bestelldatum": strip(row["bestelldatum"]),
+                "project_num": strip(row["project_num"]),
+            }
+            logger.debug(f"part: {part}")
+            parts_data.append(part)
+
+        num = []
+        for p in parts_data:
+            if not p["project_num"] in num:
+                num.append(p["project_num"])
+
+        logger.debug(f"ersatzteile gedunden: {parts_data}")
+
+        # Wie im Element-Pfad: bei fehlender Zeile bleibt der letzte Wert stehen
+        sums = result["sums"]
+        ersatzteile_summe = None
+        for i, auftragsnummer in enumerate(num):
+            if i < len(sums) and sums[i] is not None:
+                ersatzteile_summe = sums[i].replace("€", "").replace(",", ".").strip()
+            else:
+                logger.warning("Ersatzteile Summe konnte nicht ausgelesen werden")
+            parts_data.append({f"{auftragsnummer} ersatzteile_summe": ersatzteile_summe})
+
+        gesamtpreis = strip(result["gesamtpreis"])
+        if gesamtpreis is None:
+            logger.warning("Gesamtpreis konnte nicht ausgelesen werden")
+        parts_data.append({"gesamtpreis": gesamtpreis})
+        return parts_data
+
+    def _get_teile_info_elements(self, rows):
+        # 3. Tabelle auslesen
+        parts_data = []
+
+        for row in rows:
+            part = {}
+            logger.debug(f"{row}")
+            logger.debug("lese data_id")
+            part["data_id"] = row.get_attribute("data-id")
+            logger.debug("lese data_partid")
+            part["data_partid"] = row.get_attribute("data-partid")
+            logger.debug("lese data_pnum")
+            part["data_pnum"] = row.get_attribute("data-pnum")
+            logger.debug("lese name")
+            try:
+                part["name"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.name,
+                    element=row,
+                ).text.strip()
+            except:
+                part["name"] = None
+            logger.debug("lese part_number")
+            try:
+                part["part_number"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.part_nr,
+                    element=row,
+                ).get_attribute("data-prtnumber")
+            except:
+                part["part_number"] = None
+            logger.debug("lese price")
+            try:
+                part["price"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.price,
+                    element=row,
+                ).text.strip()
+            except:
+                part["price"] = None
+            logger.debug("lese quantity")
+            try:
+                part["quantity"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.quantity,
+                    element=row,
+                ).text.strip()
+            except:
+                part["quantity"] = None
+            logger.debug("lese total_price")
+            try:
+                part["total_price"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.total_price,
+                    element=row,
+                ).text.strip()
+            except:
+                part["total_price"] = None
+            logger.debug("lese bestellt")
+            try:
+                part["bestellt"] = (
+                    self._selenium_client.find_element(
                         by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.bestelldatum,
+                        selector=self._config.teile_tabelle.bestellt,
                         element=row,
-                    ).text.strip()
-                except:
-                    part["bestelldatum"] = None
-                logger.debug("lese project_num")
-                try:
-                    part["project_num"] = self._selenium_client.find_element(
+                    ).get_attribute("checked")
+                    is not None
+                )
+            except:
+                part["bestellt"] = None
+            logger.debug("lese delivered")
+            try:
+                part["delivered"] = (
+                    self._selenium_client.find_element(
                         by=self._config.teile_tabelle.locator_strategie,
-                        selector=self._config.teile_tabelle.project_num,
+                        selector=self._config.teile_tabelle.delivered,
                         element=row,
-                    ).text.strip()
-                except:
-                    part["project_num"] = None
-                logger.debug(f"part: {part}")
-                parts_data.append(part)
-
-            num = []
-            for p in parts_data:
-                if not p["project_num"] in num:
-                    num.append(p["project_num"])
+                    ).get_attribute("checked")
+                    is not None
+                )
+            except:
+                part["delivered"] = None
+            logger.debug("lese status")
+            try:
+                part["status"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.status,
+                    element=row,
+                ).get_attribute("title")
+            except:
+                part["status"] = None
+            logger.debug("lese bestelldatum")
+            try:
+                part["bestelldatum"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.bestelldatum,
+                    element=row,
+                ).text.strip()
+            except:
+                part["bestelldatum"] = None
+            logger.debug("lese project_num")
+            try:
+                part["project_num"] = self._selenium_client.find_element(
+                    by=self._config.teile_tabelle.locator_strategie,
+                    selector=self._config.teile_tabelle.project_num,
+                    element=row,
+                ).text.strip()
+            except:
+                part["project_num"] = None
+            logger.debug(f"part: {part}")
+            parts_data.append(part)
 
-            logger.debug(f"ersatzteile gedunden: {parts_data}")
+        num = []
+        for p in parts_data:
+            if not p["project_num"] in num:
+                num.append(p["project_num"])
 
-            # Gesamtpreis und ersatzteile_summe
-            try:
-                table = self._selenium_client.wait_for_all_elements(
-                    by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie,
-                    selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector,
-                )[
-                    0
-                ]  # nur eine Tabelle
-            except Exception as e:
-                logger.warning(f"Gesamtpreis Tabelle konnte nicht gefunden werden: {e}")
+        logger.debug(f"ersatzteile gedunden: {parts_data}")
 
-            gesamtpreis = None
-            ersatzteile_summe = None
-            for i, auftragsnummer in enumerate(num):
-                try:
-                    first_row = self._selenium_client.find_elements(
-                        by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag,
-                        selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector_tr,
-                        element=table,
-                    )[i]
-                    ersatzteile_summe_td = self._selenium_client.find_elements(
-                        by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag,
-                        selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector_td,
-                        element=first_row,
-                    )[1]
-                    ersatzteile_summe = (
-                        ersatzteile_summe_td.text.replace("€", "")
-                        .replace(",", ".")
-                        .strip()
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Ersatzteile Summe konnte nicht ausgelesen werden: {e}"
-                    )
-                parts_data.append(
-                    {f"{auftragsnummer} ersatzteile_summe": ersatzteile_summe}
-                )
+        # Gesamtpreis und ersatzteile_summe
+        try:
+            table = self._selenium_client.wait_for_all_elements(
+                by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie,
+                selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector,
+            )[
+                0
+            ]  # nur eine Tabelle
+        except Exception as e:
+            logger.warning(f"Gesamtpreis Tabelle konnte nicht gefunden werden: {e}")
 
+        gesamtpreis = None
+        ersatzteile_summe = None
+        for i, auftragsnummer in enumerate(num):
             try:
-                last_row = self._selenium_client.find_elements(
+                first_row = self._selenium_client.find_elements(
                     by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag,
                     selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector_tr,
                     element=table,
-                )[-1]
-                gesamtpreis_td = self._selenium_client.find_elements(
+                )[i]
+                ersatzteile_summe_td = self._selenium_client.find_elements(
                     by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag,
                     selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector_td,
-                    element=last_row,
-                )[-1]
-                gesamtpreis = gesamtpreis_td.text.strip()
-
-                # last_row = table.find_elements(self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag, "tr")[-1]
-                # gesamtpreis_td = last_row.find_elements(self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag, "td")[-1]
-                # gesamtpreis = gesamtpreis_td.find_element(self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag, "b").text.strip()
+                    element=first_row,
+                )[1]
+                ersatzteile_summe = (
+                    ersatzteile_summe_td.text.replace("€", "")
+                    .replace(",", ".")
+                    .strip()
+                )
             except Exception as e:
-                logger.warning(f"Gesamtpreis konnte nicht ausgelesen werden: {e}")
-            parts_data.append({"gesamtpreis": gesamtpreis})
+                logger.warning(
+                    f"Ersatzteile Summe konnte nicht ausgelesen werden: {e}"
+                )
+            parts_data.append(
+                {f"{auftragsnummer} ersatzteile_summe": ersatzteile_summe}
+            )
 
-            return parts_data
+        try:
+            last_row = self._selenium_client.find_elements(
+                by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag,
+                selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector_tr,
+                element=table,
+            )[-1]
+            gesamtpreis_td = self._selenium_client.find_elements(
+                by=self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag,
+                selector=self._config.teile_tabelle.bottom_line_gesamtpreis.selector_td,
+                element=last_row,
+            )[-1]
+            gesamtpreis = gesamtpreis_td.text.strip()
+
+            # last_row = table.find_elements(self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag, "tr")[-1]
+            # gesamtpreis_td = last_row.find_elements(self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag, "td")[-1]
+            # gesamtpreis = gesamtpreis_td.find_element(self._config.teile_tabelle.bottom_line_gesamtpreis.locator_strategie_tag, "b").text.strip()
         except Exception as e:
-            logger.error("Teile Infos auslesen fehlgeschlagen: %s", str(e))
-            return []
+            logger.warning(f"Gesamtpreis konnte nicht ausgelesen werden: {e}")
+        parts_data.append({"gesamtpreis": gesamtpreis})
+
+        return parts_data
 
     def check_sparepart_boxes(self, positions: str = ""):
         try:
             logger.info("checke Ersatzteil check boxen")
-            time.sleep(1)
+            self.settle("teile")
             # self._selenium_client.wait_for_visibility(
             #     by=self._config.selenium.teile_elements.locator_strategie,
             #     selector=self._config.selenium.teile_elements.selector,
@@ -883,7 +1952,6 @@ class PlanSoMain:
                             selector=self._config.teile_tabelle.price_checkbox.selector,
                             element=row,
                         )
-                        time.sleep(0.5)
                         if not checkbox.is_selected():
                             logger.info(f"checking price_checkbox for {part_name}")
 
@@ -925,21 +1993,70 @@ class PlanSoMain:
             if overlay_elem.is_displayed():
                 text = overlay_elem.text.strip().lower()
                 logging.info(f"Overlay erkannt: {text}")
-
-                if "upload" in text or "wird hochgeladen" in text:
-                    return "upload"
-                elif (
-                    "das bild konnte nicht hochgeladen werden" in text
-                    or "alert" in text
-                    or "nicht möglich" in text
-                ):
-                    return "File existiert bereits"
-                else:
-                    return "unbekannt"
+                return self._classify_overlay_text(text)
         except:
             logging.info("error in check_overlay_type")
             return None
 
+    def _classify_overlay_text(self, text: str):
+        if "upload" in text or "wird hochgeladen" in text:
+            return "upload"
+        elif (
+            "das bild konnte nicht hochgeladen werden" in text
+            or "alert" in text
+            or "nicht möglich" in text
+        ):
+            return "File existiert bereits"
+        else:
+            return "unbekannt"
+
+    def _get_column_map(self, refresh: bool = False) -> dict:
+        """
+        Spaltenname (aria-describedby) -> Index (0-basiert) der aktuellen Tabelle.
+        Wird mit einem Script-Aufruf gebaut und pro (client, table_id) im Prozess
+        gecacht. Ändert sich das Spaltenlayout, baut _column_cell den Cache neu auf.
+        """
+        key = (self._client, self._config.table_id)
+        column_map = _COLUMN_MAP_CACHE.get(key)
+        if column_map is None or refresh:
+            logger.debug("Baue Spalten-Index für Tabelle '%s' auf", self._config.table_id)
+            column_map = self._selenium_client.execute_script(
+                COLUMN_MAP_SCRIPT, self._config.table_id
+            )
+            if not column_map:
+                # Tabelle (noch) leer -> nichts cachen
+                return {}
+            _COLUMN_MAP_CACHE[key] = column_map
+        return column_map
+
+    def _column_index(self, field_name: str) -> int:
+        field_id = getattr(self._config.table_fields, field_name)
+        field_idx = self._get_column_map().get(field_id, -1)
+        logger.debug("Feld '%s' hat Index %d", field_name, field_idx)
+        return field_idx
+
+    def _column_cell(self, row, field_name: str):
+        """
+        Gibt die Zelle der Spalte `field_name` in `row` zurück. Passt die Zelle
+        nicht zur erwarteten Spalte (Layout geändert), wird der Spalten-Index
+        einmal neu aufgebaut.
+        """
+        field_id = getattr(self._config.table_fields, field_name)
+        cell = None
+        for refresh in (False, True):
+            field_idx = self._get_column_map(refresh=refresh).get(field_id, -1)
+            if field_idx == -1 and not refresh:
+                continue
+            cell = row.find_element(
+                self._config.selenium.upload_cell_prepare.locator_strategie,
+                self._config.selenium.upload_cell_prepare.selector
+                + f"[{field_idx + 1}]",
+            )
+            if cell.get_attribute("aria-describedby") == field_id:
+                return cell
+            logger.debug("Spaltenlayout hat sich geändert, baue Spalten-Index neu auf")
+        return cell
+
     def _wait_for_table(self):
         logger.info("Warte auf das Laden der Tabelle...")
         self._selenium_client.wait_for_visibility(
@@ -968,7 +2085,6 @@ class PlanSoMain:
                 f"in _wait_for_orga_list ist load_table_indicator nicht sichtbar geworden: {e}"
             )
 
-        time.sleep(0.1)
         self._selenium_client.wait_for_invisibility(
             self._config.selenium.load_table_indicator.locator_strategie,
             self._config.selenium.load_table_indicator.selector,
@@ -978,27 +2094,6 @@ class PlanSoMain:
             self._config.selenium.orga_list_element.selector,
         )
 
-    def _replace_in_dict(self, data, search, replace):
-        if isinstance(data, dict):
-            return {
-                k: self._replace_in_dict(v, search, replace) for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._replace_in_dict(i, search, replace) for i in data]
-        elif isinstance(data, str):
-            return data.replace(search, replace)
-        else:
-            return data
-
-    def _dict_to_namespace(self, d):
-        if isinstance(d, dict):
-            return SimpleNamespace(
-                **{k: self._dict_to_namespace(v) for k, v in d.items()}
-            )
-        elif isinstance(d, list):
-            return [self._dict_to_namespace(i) for i in d]
-        return d
-
     def _get_config_path(self):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         return os.path.join(script_dir, "config.yaml")
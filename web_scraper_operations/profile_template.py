@@ -0,0 +1,84 @@
+import fcntl
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+# Nur diese Verzeichnisse eines Chrome-Profils werden übernommen. Cookies,
+# Local/Session Storage, IndexedDB usw. liegen woanders und bleiben pro Client leer.
+CACHE_DIRS = (
+    os.path.join("Default", "Cache"),
+    os.path.join("Default", "Code Cache"),
+)
+_READY = "READY"
+
+
+def copy_cache(source_profile, target_profile):
+    """Kopiert die HTTP- und Code-Caches eines Profils in ein anderes."""
+    for relative in CACHE_DIRS:
+        source = os.path.join(source_profile, relative)
+        if os.path.isdir(source):
+            shutil.copytree(source, os.path.join(target_profile, relative), dirs_exist_ok=True)
+
+
+def _is_fresh(template_dir, warm_urls, max_age):
+    try:
+        marker = os.path.join(template_dir, _READY)
+        with open(marker, "r") as f:
+            built_for = json.load(f)
+        return built_for == warm_urls and time.time() - os.stat(marker).st_mtime < max_age
+    except (OSError, ValueError):
+        return False
+
+
+def ensure(template_dir, build, warm_urls, max_age=86400):
+    """
+    Stellt sicher, dass unter `template_dir` ein aktuelles Template liegt.
+    Fehlt es, ist es älter als `max_age` Sekunden oder wurde es für andere
+    URLs gebaut, wird `build(staging_dir)` aufgerufen und das Ergebnis atomar
+    an die Stelle des alten Templates gesetzt.
+
+    Ein flock auf `<template_dir>.lock` sorgt dafür, dass auch mehrere
+    Worker-Prozesse im selben Container das Template nur einmal bauen.
+    """
+    if _is_fresh(template_dir, warm_urls, max_age):
+        return
+    parent = os.path.dirname(os.path.abspath(template_dir))
+    os.makedirs(parent, exist_ok=True)
+    with open(template_dir + ".lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if _is_fresh(template_dir, warm_urls, max_age):
+            # anderer Prozess war schneller
+            return
+        logger.info("Baue Profil-Template '%s' aus %s", template_dir, warm_urls)
+        start = time.perf_counter()
+        staging = tempfile.mkdtemp(prefix=".build_", dir=parent)
+        old = None
+        try:
+            build(staging)
+            with open(os.path.join(staging, _READY), "w") as f:
+                json.dump(warm_urls, f)
+            if os.path.exists(template_dir):
+                old = f"{template_dir}.old-{os.getpid()}"
+                os.rename(template_dir, old)
+            os.rename(staging, template_dir)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+            if old is not None:
+                shutil.rmtree(old, ignore_errors=True)
+        logger.info("Profil-Template gebaut in %.1fs", time.perf_counter() - start)
+
+
+def clone(template_dir, profile_dir):
+    """
+    Übernimmt die Caches des Templates in ein frisches Profil. Während ein
+    Template neu gebaut wird, wartet clone() auf den fertigen Stand.
+    """
+    with open(template_dir + ".lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_SH)
+        copy_cache(template_dir, profile_dir)
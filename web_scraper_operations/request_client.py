@@ -1,57 +1,228 @@
 import logging
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+
 import requests
+from requests.adapters import HTTPAdapter
 
 # Logging wird im Docker main (app.py) definiert
 logger = logging.getLogger(__name__)
 
 
+def handle_response(response):
+    """
+    Loggt den Statuscode einer Antwort und gibt True bei 2xx zurück.
+    Erwartet ein Objekt mit `status_code` und `headers`.
+    """
+    status = response.status_code
+
+    if 200 <= status < 300:
+        # Gültige Antwort
+        logger.info(f"Erfolg ({status})")
+        return True
+
+    elif status in (301, 302):
+        # Warnung bei weiterleitung
+        location = response.headers.get("Location", "Unbekannt")
+        logger.warning(f"Weiterleitung ({status}) nach {location}")
+
+    elif status == 400:
+        logger.error("Fehlerhafte Anfrage (400): Prüfe deine Daten.")
+    elif status == 401:
+        logger.error("Nicht autorisiert (401): Login oder Token fehlt.")
+    elif status == 403:
+        logger.error("Zugriff verweigert (403): Du hast keine Rechte.")
+    elif status == 404:
+        logger.error("Nicht gefunden (404): URL prüfen.")
+    elif status == 429:
+        logger.error("Zu viele Anfragen (429): Rate Limit erreicht.")
+    elif 500 <= status < 600:
+        logger.error(f"Serverfehler ({status}): Problem auf der Serverseite.")
+    else:
+        logger.warning(f"Unerwarteter Statuscode ({status})")
+
+    return False  # Bei allen Fehlern
+
+
+def download_path(target_dir, link, index, name=None):
+    """
+    Zielpfad für den `index`-ten Link eines Sammel-Downloads. PlanSo-Links
+    enden meist alle auf '/do?m=...&id=...', der Name aus der URL ist also
+    nicht eindeutig; das Index-Präfix verhindert, dass zwei Downloads in
+    dieselbe Datei schreiben, auch bei doppelten Links oder Namen.
+
+    :param name: Dateiname des Aufrufers, sonst der letzte Teil der URL
+    """
+    name = os.path.basename(name or link.split("?")[0]) or "download"
+    return os.path.join(target_dir, f"{index:04d}_{name}")
+
+
+class RetryPolicy:
+    """
+    Exponentielles Backoff mit Jitter. Bei 429/503 wird ein Retry-After Header
+    bevorzugt; verlangt er mehr Zeit als vom `budget` (Gesamtzeit eines
+    Aufrufs in Sekunden inklusive aller Wiederholungen) übrig ist, wird nicht
+    mehr wiederholt.
+
+    Wiederholt werden nur idempotente Methoden (`retry_methods`), ein POST
+    nur, wenn der Aufrufer es ausdrücklich erlaubt (retry=True).
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: float = 0.5,
+        retry_statuses=(429, 500, 502, 503, 504),
+        budget: float = 60.0,
+        retry_methods=IDEMPOTENT_METHODS,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = set(retry_statuses)
+        self.budget = budget
+        self.retry_methods = {method.upper() for method in retry_methods}
+
+    def retries_method(self, method, retry=None) -> bool:
+        """Ob Requests mit `method` wiederholt werden; `retry` überschreibt das."""
+        return method.upper() in self.retry_methods if retry is None else retry
+
+    def should_retry(self, status) -> bool:
+        return status in self.retry_statuses
+
+    def backoff(self, attempt: int, response=None) -> float:
+        """Wartezeit vor Versuch `attempt + 1` (attempt beginnt bei 1)."""
+        if response is not None and response.status_code in (429, 503):
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                # Vorgabe des Servers nicht kürzen, das Budget entscheidet
+                return retry_after
+        delay = min(self.backoff_base * 2 ** (attempt - 1), self.backoff_max)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+    @staticmethod
+    def _parse_retry_after(value):
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
 class RequestClient:
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        retry_policy: RetryPolicy = None,
+    ):
         logger.info(f"RequestClient gestartet")
         self._session = requests.Session()
+        # Retries übernimmt RetryPolicy, nicht urllib3
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._timeout = (connect_timeout, read_timeout)
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
         self._response = None
+        self._metrics = {}
 
-    def request_post(self, url, headers, payload):
+    def request_post(self, url, headers, payload, retry: bool = None):
+        """Mit `retry=True` wird der POST wiederholt wie ein GET (nur wenn idempotent!)."""
         logger.info(f"request_post")
-        self._response = self._session.post(url, data=payload, headers=headers)
+        self._response = self._send("POST", url, retry=retry, data=payload, headers=headers)
         return self._handle_response()
 
     def request_get(self, url: str):
         logger.info(f"request_get")
-        self._response = self._session.get(url)
+        self._response = self._send("GET", url)
         return self._handle_response()
 
     def get_response(self):
         logger.info(f"get_response")
         return self._response
 
+    def get_metrics(self):
+        """
+        Metriken des letzten Aufrufs: attempts, backoff_time, requests,
+        new_connections, pool_reuse_ratio und keep_alive (Verbindung wiederverwendet).
+        """
+        return dict(self._metrics)
+
+    def _pool_counters(self):
+        connections = requests_made = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests_made += pool.num_requests
+        return connections, requests_made
+
+    def _send(self, method, url, retry=None, **kwargs):
+        policy = self._retry_policy
+        retryable = policy.retries_method(method, retry)
+        start = time.monotonic()
+        connections_before, requests_before = self._pool_counters()
+        attempts = 0
+        backoff_time = 0.0
+        response = None
+
+        while True:
+            attempts += 1
+            error = None
+            try:
+                response = self._session.request(method, url, timeout=self._timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+                response = None
+
+            failed = error is not None or policy.should_retry(response.status_code)
+            if not failed or not retryable or attempts >= policy.max_attempts:
+                break
+            delay = policy.backoff(attempts, response)
+            if time.monotonic() - start + delay > policy.budget:
+                logger.warning("Retry-Budget von %.1fs erschöpft", policy.budget)
+                break
+            logger.warning(
+                "Versuch %d fehlgeschlagen (%s), nächster Versuch in %.2fs",
+                attempts,
+                error if error is not None else response.status_code,
+                delay,
+            )
+            time.sleep(delay)
+            backoff_time += delay
+
+        connections_after, requests_after = self._pool_counters()
+        made = requests_after - requests_before
+        new_connections = connections_after - connections_before
+        self._metrics = {
+            "attempts": attempts,
+            "backoff_time": backoff_time,
+            "requests": made,
+            "new_connections": new_connections,
+            "pool_reuse_ratio": (made - new_connections) / made if made else 0.0,
+            "keep_alive": made > new_connections,
+        }
+        if error is not None:
+            raise error
+        return response
+
     def _handle_response(self):
-        status = self._response.status_code
-
-        if 200 <= status < 300:
-            # Gültige Antwort
-            logger.info(f"Erfolg ({status})")
-            return True
-
-        elif status in (301, 302):
-            # Warnung bei weiterleitung
-            location = self._response.headers.get("Location", "Unbekannt")
-            logger.warning(f"Weiterleitung ({status}) nach {location}")
-
-        elif status == 400:
-            logger.error("Fehlerhafte Anfrage (400): Prüfe deine Daten.")
-        elif status == 401:
-            logger.error("Nicht autorisiert (401): Login oder Token fehlt.")
-        elif status == 403:
-            logger.error("Zugriff verweigert (403): Du hast keine Rechte.")
-        elif status == 404:
-            logger.error("Nicht gefunden (404): URL prüfen.")
-        elif status == 429:
-            logger.error("Zu viele Anfragen (429): Rate Limit erreicht.")
-        elif 500 <= status < 600:
-            logger.error(f"Serverfehler ({status}): Problem auf der Serverseite.")
-        else:
-            logger.warning(f"Unerwarteter Statuscode ({status})")
-
-        return False  # Bei allen Fehlern
+        return handle_response(self._response)
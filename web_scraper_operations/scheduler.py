@@ -0,0 +1,269 @@
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+EXPIRED = "expired"
+
+
+class QueueFullError(Exception):
+    """Die Job-Queue des FlowScheduler ist voll."""
+
+
+class FlowJob:
+    def __init__(self, flow, kwargs, priority, deadline, account):
+        self.id = uuid.uuid4().hex
+        self.flow = flow
+        self.kwargs = kwargs
+        self.priority = priority
+        self.deadline = deadline
+        self.account = account
+        self.state = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.done = threading.Event()
+
+    def as_dict(self):
+        now = time.monotonic()
+        started = self.started_at or now
+        return {
+            "id": self.id,
+            "flow": getattr(self.flow, "__name__", str(self.flow)),
+            "state": self.state,
+            "priority": self.priority,
+            "wait_time": round(started - self.submitted_at, 3),
+            "run_time": (
+                round((self.finished_at or now) - self.started_at, 3)
+                if self.started_at
+                else None
+            ),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class FlowScheduler:
+    """
+    Führt Flows aus planso_flows in einer begrenzten Anzahl Worker-Threads aus
+    (ein Browser pro Worker). Pro (client, username) laufen höchstens
+    `per_account_limit` Flows gleichzeitig, weil PlanSo-Accounts nicht beliebig
+    viele parallele Logins vertragen.
+
+    Abgeschlossene Jobs (inklusive Ergebnis) bleiben für poll()/wait() höchstens
+    `result_ttl` Sekunden erhalten, und es werden nie mehr als `history`
+    abgeschlossene Jobs gehalten; ältere werden automatisch entfernt.
+
+    Beispiel:
+        scheduler = FlowScheduler(workers=4, per_account_limit=1)
+        job_id = scheduler.submit(planso_upload_flow, priority=5, deadline=120, **kwargs)
+        scheduler.poll(job_id)
+        result = scheduler.wait(job_id, timeout=300)
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 100,
+        per_account_limit: int = 1,
+        selenium_pool=None,
+        history: int = 1000,
+        result_ttl: float = 3600,
+    ):
+        logger.info(
+            "------ Initialisiere FlowScheduler (workers=%d, max_queue=%d, per_account_limit=%d) ------",
+            workers,
+            max_queue,
+            per_account_limit,
+        )
+        self._max_queue = max_queue
+        self._per_account_limit = per_account_limit
+        self._selenium_pool = selenium_pool
+        self._history = history
+        self._result_ttl = result_ttl
+
+        self._lock = threading.Condition()
+        self._queue = []  # (-priority, seq, job), sortiert gehalten
+        self._seq = itertools.count()
+        self._jobs = {}
+        self._finished = deque()  # (finished_at, job_id) in Abschlussreihenfolge
+        self._running = {}  # account -> Anzahl laufender Jobs
+        self._closed = False
+
+        self._wait_times = deque(maxlen=history)
+        self._run_times = deque(maxlen=history)
+        self._counters = {DONE: 0, FAILED: 0, EXPIRED: 0, "rejected": 0}
+
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"flow-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, flow, priority: int = 0, deadline: float = None, **kwargs) -> str:
+        """
+        Reiht einen Flow ein. Höhere `priority` läuft zuerst. Startet der Job
+        nicht innerhalb von `deadline` Sekunden, wird er als 'expired' verworfen.
+
+        :raises QueueFullError: wenn die Queue voll ist
+        """
+        if self._selenium_pool is not None:
+            kwargs.setdefault("selenium_pool", self._selenium_pool)
+        account = (kwargs.get("client", "jvg"), kwargs.get("username"))
+        absolute_deadline = time.monotonic() + deadline if deadline is not None else None
+        job = FlowJob(flow, kwargs, priority, absolute_deadline, account)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("FlowScheduler ist beendet")
+            self._prune()
+            if len(self._queue) >= self._max_queue:
+                self._counters["rejected"] += 1
+                raise QueueFullError(f"Queue voll ({self._max_queue} Jobs)")
+            self._jobs[job.id] = job
+            self._queue.append((-priority, next(self._seq), job))
+            self._queue.sort(key=lambda item: item[:2])
+            self._lock.notify()
+        logger.debug("Job %s eingereiht (%s)", job.id, job.as_dict()["flow"])
+        return job.id
+
+    def poll(self, job_id: str) -> dict:
+        """
+        :raises KeyError: wenn der Job unbekannt ist oder bereits entfernt wurde
+        """
+        with self._lock:
+            return self._jobs[job_id].as_dict()
+
+    def wait(self, job_id: str, timeout: float = None):
+        """
+        Wartet auf das Ende des Jobs und gibt das Ergebnis des Flows zurück.
+
+        :raises KeyError: wenn der Job unbekannt ist oder bereits entfernt wurde
+        :raises TimeoutError: wenn der Job nicht rechtzeitig fertig wird
+        """
+        job = self._jobs[job_id]
+        if not job.done.wait(timeout):
+            raise TimeoutError(f"Job {job_id} nach {timeout}s nicht fertig")
+        if job.state == EXPIRED:
+            raise TimeoutError(f"Job {job_id} hat seine Deadline verpasst")
+        if job.state == FAILED:
+            raise RuntimeError(f"Job {job_id} fehlgeschlagen: {job.error}")
+        return job.result
+
+    def forget(self, job_id: str):
+        """Entfernt einen abgeschlossenen Job aus der Verwaltung."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.done.is_set():
+                del self._jobs[job_id]
+
+    def stats(self) -> dict:
+        """Kennzahlen für Autoscaling: Queue-Tiefe, Warte- und Laufzeiten."""
+        with self._lock:
+            wait_times = sorted(self._wait_times)
+            run_times = sorted(self._run_times)
+            return {
+                "queue_depth": len(self._queue),
+                "running": sum(self._running.values()),
+                "workers": len(self._workers),
+                "accounts_running": {f"{c}/{u}": n for (c, u), n in self._running.items() if n},
+                "wait_time_avg": _avg(wait_times),
+                "wait_time_p95": _p95(wait_times),
+                "run_time_avg": _avg(run_times),
+                "run_time_p95": _p95(run_times),
+                **self._counters,
+            }
+
+    def shutdown(self, wait: bool = True):
+        logger.info("Beende FlowScheduler")
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _finish(self, job, now):
+        """Markiert einen Job als abgeschlossen und räumt alte Jobs auf (Lock gehalten)."""
+        job.finished_at = now
+        self._counters[job.state] += 1
+        self._finished.append((now, job.id))
+        self._prune()
+
+    def _prune(self):
+        """Entfernt abgeschlossene Jobs jenseits von `history` bzw. `result_ttl` (Lock gehalten)."""
+        cutoff = time.monotonic() - self._result_ttl
+        while self._finished and (
+            len(self._finished) > self._history or self._finished[0][0] < cutoff
+        ):
+            _, job_id = self._finished.popleft()
+            self._jobs.pop(job_id, None)
+
+    def _next_job(self):
+        """Höchstpriorisierter Job, dessen Account noch Kapazität hat (Lock gehalten)."""
+        now = time.monotonic()
+        for i, (_, _, job) in enumerate(self._queue):
+            if job.deadline is not None and now > job.deadline:
+                del self._queue[i]
+                job.state = EXPIRED
+                self._finish(job, now)
+                job.done.set()
+                logger.warning("Job %s hat seine Deadline verpasst", job.id)
+                return self._next_job()
+            if self._running.get(job.account, 0) < self._per_account_limit:
+                del self._queue[i]
+                return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                job = self._next_job()
+                while job is None:
+                    if self._closed:
+                        return
+                    # Deadlines auch ohne neue Jobs regelmäßig prüfen
+                    self._lock.wait(1.0)
+                    job = self._next_job()
+                self._running[job.account] = self._running.get(job.account, 0) + 1
+                job.state = RUNNING
+                job.started_at = time.monotonic()
+                self._wait_times.append(job.started_at - job.submitted_at)
+
+            try:
+                job.result = job.flow(**job.kwargs)
+                job.state = DONE
+            except Exception as e:
+                logger.exception("Job %s fehlgeschlagen", job.id)
+                job.error = str(e)
+                job.state = FAILED
+
+            with self._lock:
+                self._finish(job, time.monotonic())
+                self._run_times.append(job.finished_at - job.started_at)
+                self._running[job.account] -= 1
+                # ein Account-Slot ist frei geworden -> alle Worker prüfen lassen
+                self._lock.notify_all()
+            job.done.set()
+
+
+def _avg(values):
+    return round(sum(values) / len(values), 3) if values else 0.0
+
+
+def _p95(sorted_values):
+    if not sorted_values:
+        return 0.0
+    return round(sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * 0.95))], 3)
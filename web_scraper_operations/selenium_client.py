@@ -1,16 +1,27 @@
+import atexit
+import inspect
+import json
 import logging
+import os
+import threading
 import time
 import tempfile
 import shutil
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException, NoSuchElementException
+from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 
+from web_scraper_operations import profile_template
+from web_scraper_operations.instrumentation import instrument
+
 
 # Logging wird im Docker main (app.py) definiert
 logger = logging.getLogger(__name__)
@@ -26,14 +37,329 @@ STRATEGY_MAP = {
     "partial_link": By.PARTIAL_LINK_TEXT,
 }
 
+# Liefert, ob die Seite "ruhig" ist (kein blockUI, keine offenen jQuery-Requests)
+# und die Position/Größe des optional übergebenen Elements.
+SETTLE_SCRIPT = """
+var el = arguments[0];
+var blocked = false;
+var overlays = document.querySelectorAll('.blockUI');
+for (var i = 0; i < overlays.length; i++) {
+    if (overlays[i].offsetWidth || overlays[i].offsetHeight) { blocked = true; break; }
+}
+var pending = (window.jQuery && window.jQuery.active) || 0;
+var rect = null;
+if (el) {
+    var r = el.getBoundingClientRect();
+    rect = [r.x, r.y, r.width, r.height, el.offsetParent !== null];
+}
+return {idle: document.readyState === 'complete' && !blocked && pending === 0, rect: rect};
+"""
+
+# Network.setBlockedURLs kennt nur URL-Muster ("*" als Wildcard), keine
+# Ressourcentypen. Die Typen aus resource_policy.block_types werden deshalb auf
+# Dateiendungen abgebildet (jeweils mit und ohne Query-String).
+# Stylesheets fehlen absichtlich: ohne CSS stimmt die Sichtbarkeit von Dialogen
+# und Overlays nicht mehr, und die Waits würden falsch entscheiden.
+BLOCK_TYPE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp"),
+    "media": ("mp4", "webm", "ogg", "ogv", "mp3", "wav", "m4a", "mov"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+}
+
+
+# Speicherarten, die reset() pro besuchtem Origin löscht (CDP Storage.clearDataForOrigin)
+RESET_STORAGE_TYPES = "cookies,local_storage,indexeddb,websql,service_workers,cache_storage,file_systems"
+
+
+def _origin(url):
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+# Chrome-Startprofile (browser.launch.profile in der config.yaml). "lean" spart
+# Speicher für viele parallele Sessions in einem Container: weniger Renderer-
+# Prozesse, keine Hintergrunddienste, begrenzter V8-Heap, kleineres Fenster.
+LAUNCH_PROFILES = {
+    "default": {"window_size": "1920,1080", "v8_heap_mb": 0, "arguments": ()},
+    "lean": {
+        "window_size": "1366,768",
+        "v8_heap_mb": 512,
+        "arguments": (
+            "--renderer-process-limit=2",
+            "--disable-site-isolation-trials",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-extensions",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--no-first-run",
+            "--mute-audio",
+            "--disable-features=Translate,OptimizationHints,MediaRouter",
+        ),
+    },
+}
+
+
+def launch_arguments(launch, headless):
+    """
+    Chrome-Argumente für ein launch-dict (profile, window_size, v8_heap_mb).
+    window_size und v8_heap_mb überschreiben die Vorgaben des Profils.
+    """
+    launch = launch or {}
+    name = launch.get("profile") or "default"
+    profile = LAUNCH_PROFILES.get(name)
+    if profile is None:
+        logger.warning("Unbekanntes Launch-Profil '%s', verwende 'default'", name)
+        profile = LAUNCH_PROFILES["default"]
+    arguments = list(profile["arguments"])
+    if headless:
+        arguments.append(f"window-size={launch.get('window_size') or profile['window_size']}")
+    v8_heap_mb = launch.get("v8_heap_mb") or profile["v8_heap_mb"]
+    if v8_heap_mb:
+        arguments.append(f"--js-flags=--max-old-space-size={int(v8_heap_mb)}")
+    return arguments
+
+
+def blocked_url_patterns(resource_policy):
+    """
+    Baut aus einer resource_policy (block_types, block_urls) die URL-Muster
+    für Network.setBlockedURLs.
+    """
+    if not resource_policy:
+        return []
+    patterns = []
+    for resource_type in resource_policy.get("block_types") or []:
+        extensions = BLOCK_TYPE_EXTENSIONS.get(resource_type)
+        if extensions is None:
+            logger.warning("Unbekannter Ressourcentyp '%s' in resource_policy wird ignoriert", resource_type)
+            continue
+        for extension in extensions:
+            patterns.extend((f"*.{extension}", f"*.{extension}?*"))
+    patterns.extend(resource_policy.get("block_urls") or [])
+    return list(dict.fromkeys(patterns))
+
+
+def _process_tree_rss(root_pid):
+    """
+    Summiert den RSS (in Bytes) eines Prozesses und aller Kindprozesse.
+    Liest direkt aus /proc, funktioniert daher nur unter Linux (Docker).
+    """
+    children = {}
+    rss_pages = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/statm", "r") as f:
+                statm = f.read().split()
+        except OSError:
+            continue
+        # comm kann Leerzeichen enthalten -> erst nach der letzten Klammer splitten
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+        rss_pages[int(entry)] = int(statm[1])
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf("SC_PAGE_SIZE")
+
+
+def _find_child_process(parent_pid, needle):
+    """PID des direkten Kindprozesses, dessen Kommandozeile `needle` enthält."""
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            if ppid != parent_pid:
+                continue
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().decode(errors="replace")
+        except OSError:
+            continue
+        if needle in cmdline:
+            return int(entry)
+    return None
+
+
+# Namen, unter denen Chrome im PATH liegen kann
+CHROME_BINARY_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+# (chromedriver_path, chrome_binary) aus der Config -> aufgelöste Pfade
+_BINARIES = {}
+_BINARIES_LOCK = threading.Lock()
+
+
+def resolve_binaries(chromedriver_path="", chrome_binary=""):
+    """
+    Ermittelt die Pfade zu chromedriver und Chrome einmal pro Prozess:
+    explizit übergeben (Config), dann CHROMEDRIVER_PATH / CHROME_BINARY,
+    dann PATH und erst zuletzt einmalig Selenium Manager.
+
+    :return: (driver_path, browser_path), browser_path kann leer sein
+        (chromedriver sucht Chrome dann selbst)
+    """
+    key = (chromedriver_path, chrome_binary)
+    with _BINARIES_LOCK:
+        if key in _BINARIES:
+            return _BINARIES[key]
+        driver_path = chromedriver_path or os.environ.get("CHROMEDRIVER_PATH") or shutil.which("chromedriver") or ""
+        browser_path = chrome_binary or os.environ.get("CHROME_BINARY") or ""
+        if not browser_path:
+            browser_path = next(filter(None, map(shutil.which, CHROME_BINARY_NAMES)), "")
+        if not driver_path:
+            from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+            logger.info("chromedriver nicht gefunden, frage Selenium Manager (einmalig)")
+            args = ["--browser", "chrome"]
+            if browser_path:
+                args += ["--browser-path", browser_path]
+            paths = SeleniumManager().binary_paths(args)
+            driver_path = paths["driver_path"]
+            browser_path = browser_path or paths.get("browser_path", "")
+        logger.info("chromedriver: %s, Chrome: %s", driver_path, browser_path or "(von chromedriver gesucht)")
+        _BINARIES[key] = (driver_path, browser_path)
+        return _BINARIES[key]
+
+
+class _SharedService(Service):
+    """
+    chromedriver, den sich alle Sessions eines Prozesses teilen. stop() der
+    einzelnen Driver wird ignoriert, beendet wird er erst beim Prozessende.
+    """
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        super().stop()
+
+
+_SHARED_SERVICES = {}
+_SHARED_SERVICES_LOCK = threading.Lock()
+
+
+def _shared_service(driver_path):
+    """Startet den geteilten chromedriver beim ersten Aufruf bzw. nach einem Absturz neu."""
+    with _SHARED_SERVICES_LOCK:
+        service = _SHARED_SERVICES.get(driver_path)
+        if service is None or service.process.poll() is not None:
+            if service is not None:
+                logger.warning("Geteilter chromedriver wurde beendet, starte neu")
+            service = _SharedService(executable_path=driver_path)
+            service.start()
+            logger.info("Geteilter chromedriver läuft auf %s", service.service_url)
+            _SHARED_SERVICES[driver_path] = service
+        return service
+
+
+@atexit.register
+def _stop_shared_services():
+    for service in _SHARED_SERVICES.values():
+        service.shutdown()
+
+
+class _AttachedChrome(webdriver.Chrome):
+    """
+    webdriver.Chrome, das eine neue Session am geteilten chromedriver öffnet,
+    statt einen eigenen Service zu starten und die Binaries zu suchen.
+
+    Umgeht ChromiumDriver.__init__ und baut den Executor so wie Selenium selbst
+    (geprüft gegen Selenium 4.34 bis 4.51); ob die Selenium-Version dazu passt,
+    prüft _attach_supported().
+    """
+
+    def __init__(self, service, options):
+        self.service = service
+        self.options = options
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service.service_url,
+            browser_name="chrome",
+            vendor_prefix="goog",
+            keep_alive=True,
+            # privates Attribut der Options, fehlt es, gilt Seleniums Vorgabe
+            ignore_proxy=getattr(options, "_ignore_local_proxy", False),
+        )
+        RemoteWebDriver.__init__(self, command_executor=executor, options=options)
+
+
+def _attach_supported():
+    """
+    True, wenn ChromiumRemoteConnection noch die Parameter hat, mit denen
+    _AttachedChrome den Executor baut. Sonst läuft shared_service wie ohne:
+    ein chromedriver pro Client.
+    """
+    try:
+        params = inspect.signature(ChromiumRemoteConnection.__init__).parameters
+    except (TypeError, ValueError):
+        return False
+    return all(
+        name in params
+        for name in ("remote_server_addr", "browser_name", "vendor_prefix", "keep_alive", "ignore_proxy")
+    )
 
+
+_ATTACH_SUPPORTED = _attach_supported()
+
+
+def _is_wait(name):
+    return name.startswith("wait") or name in ("settle", "is_present")
+
+
+@instrument(include=_is_wait)
 class SeleniumClient:
-    def __init__(self, headless=True):
+    def __init__(
+        self,
+        headless=True,
+        page_load_strategy="normal",
+        resource_policy=None,
+        profile_template=None,
+        shared_service=False,
+        chromedriver_path="",
+        chrome_binary="",
+        launch=None,
+    ):
+        """
+        :param page_load_strategy: "normal", "eager" (nur DOMContentLoaded) oder
+            "none". Bei "eager"/"none" entscheiden die Element-Waits und settle(),
+            wann die Seite bereit ist, nicht das load-Event.
+        :param resource_policy: dict mit block_types, block_urls und report,
+            siehe `browser.resource_policy` in der config.yaml.
+        :param profile_template: dict mit dir, warm_urls und max_age. Das neue
+            Profil startet dann mit dem vorgewärmten HTTP-Cache des Templates.
+        :param shared_service: Session am chromedriver des Prozesses öffnen,
+            statt pro Client einen eigenen zu starten.
+        :param chromedriver_path, chrome_binary: feste Pfade, siehe resolve_binaries().
+        :param launch: dict mit profile ("default"/"lean"), window_size und
+            v8_heap_mb, siehe LAUNCH_PROFILES.
+        """
+        self.uses = 0  # wird vom SeleniumClientPool hochgezählt
+        self.profiler = None
+        self._origins = set()  # per open_url besuchte Origins, siehe reset()
         self._profile_dir = tempfile.mkdtemp(prefix="selenium_profile_")
         logger.info("------ Initialisiere SeleniumClient '%s', (headless=%s) ------", self._profile_dir, headless)
         
         
         self._webdriver_wait = 30 # seconds unil timeout
+        self._headless = headless
+        self._launch = launch or {}
+        self._shared_service = shared_service
+        self._chromedriver_path = chromedriver_path
+        self._chrome_binary = chrome_binary
+        self.page_load_strategy = page_load_strategy
+        self._resource_policy = resource_policy or {}
+        self._profile_template = profile_template or {}
+        if self._profile_template.get("dir"):
+            self._clone_profile_template()
 
         chrome_options = Options()
         chrome_options.add_argument(f"--user-data-dir={self._profile_dir}")
@@ -41,24 +367,134 @@ class SeleniumClient:
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("window-size=1920,1080")
         chrome_options.add_argument("--no-sandbox")
+        for argument in launch_arguments(self._launch, headless):
+            chrome_options.add_argument(argument)
         prefs = {
             "profile.default_content_setting_values.geolocation": 2,
             "profile.default_content_setting_values.media_stream_camera": 2,
             "profile.default_content_setting_values.media_stream_mic": 2,
         }
         chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options.page_load_strategy = page_load_strategy
+        if self._resource_policy.get("report"):
+            # Network-Events landen im Performance-Log, siehe network_report()
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
-        self.driver = webdriver.Chrome(service=Service(), options=chrome_options)
+        self.driver = self._start_driver(chrome_options)
         self.driver.set_page_load_timeout(self._webdriver_wait)
         self.driver.set_script_timeout(self._webdriver_wait)
         self.wait = WebDriverWait(self.driver, self._webdriver_wait)
+        self._apply_resource_policy()
         logger.debug("Selenium WebDriver erfolgreich gestartet.")
 
+    def _start_driver(self, chrome_options):
+        driver_path, browser_path = resolve_binaries(self._chromedriver_path, self._chrome_binary)
+        if browser_path:
+            chrome_options.binary_location = browser_path
+        if self._shared_service:
+            if _ATTACH_SUPPORTED:
+                return _AttachedChrome(_shared_service(driver_path), chrome_options)
+            logger.warning("shared_service wird von dieser Selenium-Version nicht unterstützt, starte eigenen chromedriver")
+        return webdriver.Chrome(service=Service(executable_path=driver_path), options=chrome_options)
+
+    def _clone_profile_template(self):
+        template = self._profile_template
+        try:
+            profile_template.ensure(
+                template["dir"],
+                self._build_profile_template,
+                template.get("warm_urls") or [],
+                template.get("max_age", 86400),
+            )
+            profile_template.clone(template["dir"], self._profile_dir)
+        except Exception as e:
+            # ohne Template geht es weiter, nur eben mit leerem Cache
+            logger.warning("Profil-Template nicht nutzbar, starte mit leerem Profil: %s", e)
+
+    def _build_profile_template(self, target_dir):
+        """
+        Startet einen eigenen Browser (gleiche Optionen, ohne Template), lädt
+        die warm_urls und übernimmt nach dem Beenden nur dessen Caches.
+        block_types gelten hier nicht, sonst landen Bilder und Fonts nie im
+        Cache; geladen wird bis zum load-Event.
+        """
+        builder = SeleniumClient(
+            headless=self._headless,
+            page_load_strategy="normal",
+            resource_policy=dict(self._resource_policy, block_types=[], report=False),
+            shared_service=self._shared_service,
+            chromedriver_path=self._chromedriver_path,
+            chrome_binary=self._chrome_binary,
+            launch=self._launch,
+        )
+        try:
+            for url in self._profile_template.get("warm_urls") or []:
+                builder.open_url(url)
+                builder.wait.until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
+        finally:
+            # erst nach dem Beenden ist der Cache vollständig auf die Platte geschrieben
+            builder.driver.quit()
+        try:
+            profile_template.copy_cache(builder._profile_dir, target_dir)
+        finally:
+            shutil.rmtree(builder._profile_dir, ignore_errors=True)
+
+    def _apply_resource_policy(self):
+        patterns = blocked_url_patterns(self._resource_policy)
+        if not patterns:
+            return
+        # gilt für das Target des Drivers über alle Navigationen hinweg
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        logger.debug("%d URL-Muster blockiert (page_load_strategy=%s)", len(patterns), self.page_load_strategy)
+
+    def network_report(self):
+        """
+        Wertet die Network-Events im Performance-Log seit dem letzten Aufruf aus.
+        Nur mit resource_policy.report, sonst None.
+
+        Blockierte Requests werden nie geladen, ihre Größe ist also unbekannt.
+        Geliefert werden die tatsächlich übertragenen Bytes und die Anzahl
+        blockierter Requests je Typ; die gesparten Bytes ergeben sich aus dem
+        Vergleich von bytes_loaded mit einem Lauf ohne resource_policy.
+        """
+        if not self._resource_policy.get("report"):
+            return None
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug("Performance-Log konnte nicht gelesen werden: %s", e)
+            return None
+
+        report = {"requests": 0, "bytes_loaded": 0, "blocked": 0, "blocked_by_type": {}}
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message["method"] == "Network.requestWillBeSent":
+                report["requests"] += 1
+            elif message["method"] == "Network.loadingFinished":
+                report["bytes_loaded"] += int(params.get("encodedDataLength", 0))
+            elif message["method"] == "Network.loadingFailed" and params.get("blockedReason"):
+                resource_type = params.get("type", "Other")
+                report["blocked"] += 1
+                report["blocked_by_type"][resource_type] = report["blocked_by_type"].get(resource_type, 0) + 1
+        return report
+
     def open_url(self, url):
         logger.info("Öffne URL: %s", url)
+        origin = _origin(url)
+        if origin:
+            self._origins.add(origin)
         self.driver.get(url)
+        if self.page_load_strategy == "none":
+            # get() kehrt sofort zurück; mindestens das DOM muss stehen, bevor
+            # die Element-Waits sinnvoll greifen
+            self.wait.until(
+                lambda driver: driver.execute_script("return document.readyState") != "loading"
+            )
 
     def type_text(self, by, selector, text, send_return=False):
         logger.debug("Tippe Text in Feld [%s=%s]", by, selector)
@@ -162,6 +598,72 @@ class SeleniumClient:
         logger.debug("Gefundene Elemente: %d (Selector: %s)", len(elements), selector[matched_index])
         return (elements, matched_index) if return_status else elements
 
+    def settle(self, by=None, selector=None, min_delay=0.0, timeout=None):
+        """
+        Wartet, bis die Seite zur Ruhe gekommen ist, statt fest zu schlafen:
+        document.readyState ist 'complete', kein blockUI sichtbar, keine offenen
+        jQuery/XHR-Requests und (falls angegeben) das Ziel-Element ist vorhanden
+        und liegt in zwei aufeinanderfolgenden Messungen an derselben Stelle.
+
+        :param min_delay: Mindestdauer in Sekunden für Schritte, die trotzdem
+            eine feste Pause brauchen
+        :return: True wenn die Seite ruhig ist, False bei Timeout
+        """
+        start = time.monotonic()
+        last_rect = [None]
+
+        def ready(driver):
+            element = None
+            if selector is not None:
+                elements = driver.find_elements(STRATEGY_MAP[by], selector)
+                if not elements:
+                    return False
+                element = elements[0]
+            state = driver.execute_script(SETTLE_SCRIPT, element)
+            if not state["idle"]:
+                last_rect[0] = None
+                return False
+            if element is None:
+                return True
+            stable = state["rect"] == last_rect[0]
+            last_rect[0] = state["rect"]
+            return stable
+
+        settled = True
+        try:
+            WebDriverWait(
+                self.driver,
+                timeout or self._webdriver_wait,
+                poll_frequency=0.1,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(ready)
+        except TimeoutException:
+            logger.warning("Seite ist nicht zur Ruhe gekommen [%s=%s]", by, selector)
+            settled = False
+
+        remaining = min_delay - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        return settled
+
+    def wait_for_text(self, by, selector, timeout=None):
+        """
+        Wartet, bis das Element einen nicht-leeren Text hat, und gibt ihn zurück.
+        """
+        logger.debug("Warte auf Text in [%s=%s]", by, selector)
+
+        def has_text(driver):
+            elements = driver.find_elements(STRATEGY_MAP[by], selector)
+            if elements and elements[0].text != "":
+                return elements[0].text
+            return False
+
+        return WebDriverWait(
+            self.driver,
+            timeout or self._webdriver_wait,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(has_text)
+
     def wait_for_element(self, by, selector):
         logger.debug("Warte auf Element [%s=%s]", by, selector)
         self.wait.until(EC.presence_of_element_located((STRATEGY_MAP[by], selector)))
@@ -201,11 +703,8 @@ class SeleniumClient:
             return self.driver.find_element(STRATEGY_MAP[by], selector)
         return element.find_element(STRATEGY_MAP[by], selector)
 
-    def execute_script(self, execute_script, element=None):
-        if element is not None:
-            self.driver.execute_script(execute_script, element)
-        else:
-            self.driver.execute_script(execute_script)
+    def execute_script(self, execute_script, *args):
+        return self.driver.execute_script(execute_script, *args)
 
     def upload_file(self, element, by, selector, path):
         logger.debug("Lade Datei hoch: %s", path)
@@ -216,10 +715,150 @@ class SeleniumClient:
         self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "blockUI")))
         logger.debug("Datei erfolgreich hochgeladen")
 
+    def upload_files(self, element, by, selector, paths):
+        """
+        Sendet alle Pfade in einem send_keys an das Datei-Input, sofern es
+        `multiple` erlaubt. Gibt False zurück, wenn das Input nur eine Datei
+        annimmt (dann muss einzeln hochgeladen werden).
+        """
+        file_input = WebDriverWait(element, self._webdriver_wait).until(
+            EC.presence_of_element_located((STRATEGY_MAP[by], selector))
+        )
+        if file_input.get_attribute("multiple") is None:
+            return False
+        logger.debug("Lade %d Dateien in einem Schritt hoch", len(paths))
+        file_input.send_keys("\n".join(paths))
+        self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "blockUI")))
+        return True
+
+    def is_present(self, by, selector, timeout=2):
+        """
+        Prüft kurz, ob ein Element vorhanden ist, ohne den vollen Timeout abzuwarten.
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((STRATEGY_MAP[by], selector))
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def is_visible(self, by, selector):
+        """
+        Prüft ohne zu warten, ob das erste passende Element sichtbar ist.
+        """
+        elements = self.driver.find_elements(STRATEGY_MAP[by], selector)
+        try:
+            return bool(elements) and elements[0].is_displayed()
+        except StaleElementReferenceException:
+            return False
+
+    def visible_elements(self, by, selector):
+        """
+        Alle aktuell sichtbaren Elemente, ohne zu warten.
+        """
+        visible = []
+        for element in self.driver.find_elements(STRATEGY_MAP[by], selector):
+            try:
+                if element.is_displayed():
+                    visible.append(element)
+            except StaleElementReferenceException:
+                pass
+        return visible
+
+    def wait_until(self, condition, timeout=None):
+        """
+        Wartet, bis `condition()` einen wahren Wert liefert, und gibt ihn zurück.
+        Wirft TimeoutException, wenn das nicht innerhalb von `timeout` passiert.
+        """
+        return WebDriverWait(
+            self.driver,
+            timeout or self._webdriver_wait,
+            poll_frequency=0.1,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(lambda driver: condition())
+
+    def get_cookies(self):
+        return self.driver.get_cookies()
+
+    def delete_all_cookies(self):
+        self.driver.delete_all_cookies()
+
+    def add_cookies(self, cookies):
+        logger.debug("Setze %d Cookies", len(cookies))
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
+
     def send_return(self):
         logger.debug("Sende RETURN an aktives Element")
         self.driver.switch_to.active_element.send_keys(Keys.RETURN)
 
+    def reset(self):
+        """
+        Setzt den Browser-Zustand zwischen zwei Flows zurück, damit ein
+        wiederverwendeter Client keine Session-Daten weiterreicht.
+
+        Cookies werden browserweit gelöscht, Storage für jeden besuchten Origin
+        (nicht nur den gerade geladenen). sessionStorage hängt am Tab, daher
+        wird ein neuer Tab geöffnet und alle alten geschlossen.
+        """
+        logger.debug("Setze Browser-Zustand zurück")
+        origins = set(self._origins)
+        old_handles = self.driver.window_handles
+        for handle in old_handles:
+            self.driver.switch_to.window(handle)
+            origin = _origin(self.driver.current_url)
+            if origin:
+                origins.add(origin)
+        self.driver.switch_to.new_window("tab")
+        new_handle = self.driver.current_window_handle
+        for handle in old_handles:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(new_handle)
+
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            self.driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": RESET_STORAGE_TYPES},
+            )
+        self._origins.clear()
+
+    def get_rss(self):
+        """
+        RSS in Bytes von chromedriver inkl. aller Chrome-Prozesse dieses Clients.
+        Beim geteilten chromedriver nur die Chrome-Prozesse dieses Clients
+        (erkannt am eigenen --user-data-dir).
+        """
+        try:
+            if self._shared_service:
+                browser_pid = _find_child_process(
+                    self.driver.service.process.pid, f"--user-data-dir={self._profile_dir}"
+                )
+                return _process_tree_rss(browser_pid) if browser_pid else 0
+            return _process_tree_rss(self.driver.service.process.pid)
+        except Exception as e:
+            logger.debug("RSS konnte nicht ermittelt werden: %s", e)
+            return 0
+
+    def enable_profiler(self, profiler=None):
+        """
+        Hängt einen CommandProfiler in den Command-Executor des Drivers ein und
+        gibt ihn zurück. Ohne `profiler` wird ein neuer angelegt.
+        """
+        from web_scraper_operations.command_profiler import CommandProfiler
+
+        self.disable_profiler()
+        self.profiler = profiler if profiler is not None else CommandProfiler()
+        self.profiler.attach(self.driver)
+        return self.profiler
+
+    def disable_profiler(self):
+        if self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
+
     def quit(self):
         logger.info("Beende WebDriver")
         try:
@@ -0,0 +1,191 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from web_scraper_operations.selenium_client import SeleniumClient
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+
+class SeleniumClientPool:
+    """
+    Hält eine feste Anzahl warmer (bereits gestarteter) SeleniumClients vor und
+    verleiht sie an Flows. Zwischen zwei Flows wird der Browser zurückgesetzt
+    (Cookies, Storage, zusätzliche Fenster). Ein Client wird ersetzt, wenn er
+    zu oft benutzt wurde oder mehr Speicher als erlaubt belegt.
+
+    `client_options` wird an jeden SeleniumClient durchgereicht, z.B.
+    browser_options(load_config(...)) für page_load_strategy/resource_policy.
+
+    Beispiel:
+        pool = SeleniumClientPool(size=2)
+        planso = PlanSoMain(..., selenium_pool=pool)
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        headless: bool = True,
+        max_uses: int = 50,
+        max_rss_mb: int = 1024,
+        acquire_timeout: int = 120,
+        prewarm: bool = True,
+        client_options: dict = None,
+    ):
+        logger.info(
+            "------ Initialisiere SeleniumClientPool (size=%d, max_uses=%d, max_rss_mb=%d) ------",
+            size,
+            max_uses,
+            max_rss_mb,
+        )
+        self._size = size
+        self._headless = headless
+        self._client_options = client_options or {}
+        self._max_uses = max_uses
+        self._max_rss = max_rss_mb * 1024 * 1024
+        self._acquire_timeout = acquire_timeout
+
+        self._lock = threading.Condition()
+        self._idle = []
+        self._in_use = set()
+        self._starting = 0
+        self._closed = False
+
+        self._stats = {
+            "created": 0,
+            "recycled_uses": 0,
+            "recycled_rss": 0,
+            "discarded": 0,
+            "acquired": 0,
+            "released": 0,
+            "acquire_wait_total": 0.0,
+        }
+
+        if prewarm:
+            for _ in range(size):
+                self._idle.append(self._create_client())
+
+    def _create_client(self):
+        client = SeleniumClient(headless=self._headless, **self._client_options)
+        with self._lock:
+            self._stats["created"] += 1
+        return client
+
+    def acquire(self, timeout: int = None) -> SeleniumClient:
+        """
+        Gibt einen freien Client zurück. Ist keiner frei und das Limit erreicht,
+        wird bis zu `timeout` Sekunden gewartet.
+        """
+        timeout = self._acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise RuntimeError("SeleniumClientPool ist geschlossen")
+                if self._idle:
+                    client = self._idle.pop()
+                    break
+                if len(self._in_use) + self._starting < self._size:
+                    # Platz frei -> neuen Client außerhalb des Locks starten
+                    self._starting += 1
+                    client = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Kein SeleniumClient innerhalb von {timeout}s verfügbar"
+                    )
+                self._lock.wait(remaining)
+
+        if client is None:
+            try:
+                client = self._create_client()
+            finally:
+                with self._lock:
+                    self._starting -= 1
+
+        client.uses += 1
+        with self._lock:
+            self._in_use.add(client)
+            self._stats["acquired"] += 1
+            self._stats["acquire_wait_total"] += time.monotonic() - start
+        logger.debug("SeleniumClient ausgeliehen (Nutzung %d)", client.uses)
+        return client
+
+    def release(self, client: SeleniumClient, discard: bool = False):
+        """
+        Gibt einen Client zurück. Mit `discard=True` (z.B. nach einem Fehler)
+        wird der Browser beendet statt wiederverwendet.
+        """
+        with self._lock:
+            self._in_use.discard(client)
+            self._stats["released"] += 1
+
+        reason = None
+        if discard:
+            reason = "discarded"
+        elif client.uses >= self._max_uses:
+            reason = "recycled_uses"
+        elif self._max_rss and client.get_rss() > self._max_rss:
+            reason = "recycled_rss"
+        else:
+            try:
+                client.reset()
+            except Exception as e:
+                logger.warning("Reset des SeleniumClient fehlgeschlagen: %s", e)
+                reason = "discarded"
+
+        if reason is None and not self._closed:
+            with self._lock:
+                self._idle.append(client)
+                self._lock.notify()
+            return
+
+        logger.info("Ersetze SeleniumClient (%s)", reason or "pool closed")
+        try:
+            client.quit()
+        except Exception as e:
+            logger.warning("Beenden des SeleniumClient fehlgeschlagen: %s", e)
+        with self._lock:
+            if reason:
+                self._stats[reason] += 1
+            self._lock.notify()
+
+    @contextmanager
+    def client(self, timeout: int = None):
+        client = self.acquire(timeout=timeout)
+        failed = False
+        try:
+            yield client
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(client, discard=failed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = self._size
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = len(self._in_use)
+            stats["starting"] = self._starting
+        stats["avg_acquire_wait"] = (
+            stats["acquire_wait_total"] / stats["acquired"] if stats["acquired"] else 0.0
+        )
+        return stats
+
+    def close(self):
+        logger.info("Schließe SeleniumClientPool")
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._lock.notify_all()
+        for client in idle:
+            try:
+                client.quit()
+            except Exception as e:
+                logger.warning("Beenden des SeleniumClient fehlgeschlagen: %s", e)
@@ -0,0 +1,88 @@
+import hashlib
+import hmac
+import json
+import logging
+import os
+import tempfile
+import time
+
+# Logging wird im Docker main (app.py) definiert
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    Dateibasierter Cache für Browser-Cookies nach erfolgreichem Login.
+    Schlüssel ist (client, base_url, username), damit mehrere Worker-Prozesse
+    im selben Container eine Session teilen können. Der Dateiname ist ein
+    HMAC mit dem Passwort als Schlüssel: mit einem falschen oder geänderten
+    Passwort wird keine gecachte Session gefunden, der Login läuft normal.
+
+    Die Dateien enthalten Session-Cookies und werden daher nur für den
+    eigenen Benutzer lesbar (0600) geschrieben.
+    """
+
+    def __init__(self, cache_dir: str = None, ttl: int = 1800):
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                "PLANSO_SESSION_CACHE_DIR",
+                os.path.join(tempfile.gettempdir(), "planso_session_cache"),
+            )
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        logger.debug("SessionCache in '%s' (ttl=%ds)", cache_dir, ttl)
+
+    def _path(self, client: str, base_url: str, username: str, password: str) -> str:
+        key = json.dumps([client, base_url, username])
+        name = hmac.new(
+            password.encode("utf-8"), key.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+        return os.path.join(self._cache_dir, f"{name}.json")
+
+    def get(self, client: str, base_url: str, username: str, password: str):
+        """
+        Gibt die gespeicherten Cookies zurück oder None, wenn kein gültiger
+        Eintrag existiert. Abgelaufene Einträge werden dabei gelöscht.
+        """
+        path = self._path(client, base_url, username, password)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Session-Cache Eintrag unlesbar, wird verworfen: %s", e)
+            self._remove(path)
+            return None
+
+        if time.time() - entry.get("created", 0) > self._ttl:
+            logger.debug("Session-Cache Eintrag abgelaufen")
+            self._remove(path)
+            return None
+        return entry.get("cookies")
+
+    def set(self, client: str, base_url: str, username: str, password: str, cookies: list):
+        path = self._path(client, base_url, username, password)
+        entry = {"created": time.time(), "cookies": cookies}
+        # atomar schreiben, damit parallele Leser nie eine halbe Datei sehen
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        logger.debug("Session für '%s' gespeichert", username)
+
+    def evict(self, client: str, base_url: str, username: str, password: str):
+        logger.info("Verwerfe gecachte Session für '%s'", username)
+        self._remove(self._path(client, base_url, username, password))
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass